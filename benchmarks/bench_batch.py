@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""Throughput of :func:`geolink_formatter.batch.render_all` with an increasing number of processes.
+
+Run with ``python -m benchmarks.bench_batch``.
+"""
+from __future__ import print_function
+
+import multiprocessing
+import timeit
+
+from benchmarks.common import synthetic_geolink
+from geolink_formatter.batch import render_all
+
+
+def main(geolinks=200, documents=200):
+    sources = [synthetic_geolink(documents=documents)] * geolinks
+    cpus = multiprocessing.cpu_count()
+    processes = sorted(set([1, 2, 4, 8, cpus]) & set(range(1, cpus + 1)))
+    for count in processes:
+        start = timeit.default_timer()
+        results = list(render_all(sources, processes=count, chunksize=4))
+        seconds = timeit.default_timer() - start
+        assert all(not isinstance(result, Exception) for result in results)
+        print(u'{count:>3} processes: {rate:>10.1f} geoLinks/s'.format(count=count, rate=geolinks / seconds))
+
+
+if __name__ == '__main__':
+    main()
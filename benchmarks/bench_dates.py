@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Date conversion of :meth:`geolink_formatter.parser.XML.from_string`.
+
+Compares :func:`datetime.datetime.strptime` with :meth:`geolink_formatter.parser.XML._parse_date` for the
+date attributes of realistic document counts, as well as the complete parsing.
+
+Run with ``python -m benchmarks.bench_dates``.
+"""
+import datetime
+
+from benchmarks.common import measure, report, synthetic_geolink
+from geolink_formatter.parser import XML
+
+
+def main():
+    for documents in (100, 1000, 10000):
+        # Three date attributes per document, spread over a few years of decisions
+        values = ['{0}-{1:02d}-{2:02d}'.format(2000 + i % 20, i % 12 + 1, i % 28 + 1)
+                  for i in range(documents * 3)]
+
+        def strptime():
+            for value in values:
+                datetime.datetime.strptime(value, XML._date_format).date()
+
+        def parse_date():
+            XML._date_cache.clear()
+            for value in values:
+                XML._parse_date(value)
+
+        report('strptime ({0} documents)'.format(documents), measure(strptime, number=3))
+        report('_parse_date ({0} documents)'.format(documents), measure(parse_date, number=3))
+
+    parser = XML()
+    xml = synthetic_geolink(documents=10000)
+    report('from_string (10000 documents)', measure(lambda: parser.from_string(xml), number=1))
+
+
+if __name__ == '__main__':
+    main()
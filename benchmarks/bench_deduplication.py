@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Scaling of :meth:`geolink_formatter.parser.XML.from_string` with the number of documents.
+
+Every document is contained twice, so the de-duplication is exercised on each element. With linear
+de-duplication the time per document stays roughly constant.
+
+Run with ``python -m benchmarks.bench_deduplication``.
+"""
+from __future__ import print_function
+
+from benchmarks.common import measure, synthetic_geolink
+from geolink_formatter.parser import XML
+
+
+def duplicated_geolink(documents):
+    xml = synthetic_geolink(documents=documents, files=1)
+    head, body = xml.split(b'<geolinks>\n', 1)
+    body = body.rsplit(b'</geolinks>', 1)[0]
+    return head + b'<geolinks>\n' + body + body + b'</geolinks>\n'
+
+
+def main():
+    parser = XML()
+    for documents in (10, 1000, 50000):
+        xml = duplicated_geolink(documents)
+        assert len(parser.from_string(xml)) == documents
+        seconds = measure(lambda: parser.from_string(xml), number=1, repeat=3)
+        print(u'{documents:>6} documents: {ms:>10.3f} ms total, {us:>8.3f} us per document'.format(
+            documents=documents,
+            ms=seconds * 1000,
+            us=seconds * 1000000 / documents
+        ))
+
+
+if __name__ == '__main__':
+    main()
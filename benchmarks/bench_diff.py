@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""Comparing polled geoLinks with :class:`geolink_formatter.diff.SnapshotDiffer`.
+
+Compares parsing and formatting the whole geoLink on every poll with diffing it against the snapshot of the
+previous poll, for an unchanged geoLink and for a geoLink with a single changed document.
+
+Run with ``python -m benchmarks.bench_diff``.
+"""
+from benchmarks.common import measure, report, synthetic_geolink
+from geolink_formatter.diff import SnapshotDiffer
+from geolink_formatter.format import HTML
+from geolink_formatter.parser import XML
+
+
+def main():
+    parser = XML()
+    differ = SnapshotDiffer(parser)
+    for documents in (1000, 10000):
+        xml = synthetic_geolink(documents=documents)
+        changed = xml.replace(b'Synthetic document 0"', b'Changed document 0"')
+        previous = differ.snapshot(xml)
+        report('parse and format ({0} documents)'.format(documents), measure(
+            lambda: HTML.format(parser.from_string(changed)), number=3))
+        report('diff, unchanged ({0} documents)'.format(documents), measure(
+            lambda: differ.diff(previous, xml).snapshot.html, number=3))
+        report('diff, one changed ({0} documents)'.format(documents), measure(
+            lambda: differ.diff(previous, changed).snapshot.html, number=3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Memory footprint of parsed documents and files.
+
+Parses a synthetic geoLink with 100k documents and compares the memory held by the resulting entities with
+equivalent entity classes storing their attributes in a per-instance ``__dict__``.
+
+Run with ``python -m benchmarks.bench_entity_memory`` (Python 3 only).
+"""
+from __future__ import print_function
+
+import gc
+import tracemalloc
+
+from benchmarks.common import synthetic_geolink
+from geolink_formatter import entity, parser as parser_module
+from geolink_formatter.parser import XML
+
+
+def without_slots(cls):
+    """Creates a copy of the specified entity class storing its attributes in an instance dictionary."""
+    namespace = dict((key, value) for key, value in vars(cls).items()
+                     if key != '__slots__' and key not in cls.__slots__)
+    return type(cls.__name__, (object,), namespace)
+
+
+def traced_size(parser, xml):
+    gc.collect()
+    tracemalloc.start()
+    documents = parser.from_string(xml)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(documents) > 0
+    return size
+
+
+def main(documents=100000):
+    xml = synthetic_geolink(documents=documents, files=3)
+    parser = XML()
+    slotted = traced_size(parser, xml)
+
+    document_cls, file_cls = entity.Document, entity.File
+    entity.Document, entity.File = without_slots(document_cls), without_slots(file_cls)
+    parser_module.Document, parser_module.File = entity.Document, entity.File
+    try:
+        unslotted = traced_size(parser, xml)
+    finally:
+        entity.Document, entity.File = document_cls, file_cls
+        parser_module.Document, parser_module.File = document_cls, file_cls
+
+    print(u'{0} documents with 3 files each'.format(documents))
+    print(u'instance dictionaries: {0:>10.1f} MiB'.format(unslotted / 1048576.0))
+    print(u'slots:                 {0:>10.1f} MiB'.format(slotted / 1048576.0))
+    print(u'saved:                 {0:>10.1f} %'.format(100.0 * (unslotted - slotted) / unslotted))
+
+
+if __name__ == '__main__':
+    main()
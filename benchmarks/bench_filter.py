@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""Document filters and field projections of :meth:`geolink_formatter.parser.XML.from_string`.
+
+Compares filtering the created documents afterwards with passing the filter to the parser, which skips the
+rejected document elements before creating any entities, as well as projections to a single field.
+
+Run with ``python -m benchmarks.bench_filter``.
+"""
+from benchmarks.common import measure, report, synthetic_geolink
+from geolink_formatter.parser import XML, DocumentFilter
+
+
+def main():
+    parser = XML(xsd_validation=False)
+    document_filter = DocumentFilter(doctype='edict')
+    for documents in (1000, 10000):
+        xml = synthetic_geolink(documents=documents)
+        report('filter afterwards ({0} documents)'.format(documents), measure(
+            lambda: [d for d in parser.from_string(xml) if document_filter.matches(d)], number=3))
+        report('filter in parser ({0} documents)'.format(documents), measure(
+            lambda: parser.from_string(xml, document_filter=document_filter), number=3))
+        report('projection to title ({0} documents)'.format(documents), measure(
+            lambda: parser.from_string(xml, fields=['title']), number=3))
+
+
+if __name__ == '__main__':
+    main()
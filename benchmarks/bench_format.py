@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""Rendering of :meth:`geolink_formatter.format.HTML.format` for an increasing number of documents.
+
+Run with ``python -m benchmarks.bench_format``.
+"""
+from benchmarks.common import measure, report, synthetic_geolink
+from geolink_formatter.format import HTML
+from geolink_formatter.parser import XML
+
+
+def main():
+    parser = XML()
+    for documents in (10, 1000, 10000):
+        parsed = parser.from_string(synthetic_geolink(documents=documents))
+        report('format ({0} documents)'.format(documents),
+               measure(lambda: HTML.format(parsed), number=max(1, 10000 // documents)))
+
+
+if __name__ == '__main__':
+    main()
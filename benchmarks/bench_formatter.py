@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Per-call latency of :meth:`geolink_formatter.GeoLinkFormatter.html`.
+
+The baseline creates a new parser, compiling the schema, and a new formatter on every call.
+
+Run with ``python -m benchmarks.bench_formatter``.
+"""
+from benchmarks.common import measure, report, synthetic_geolink
+from geolink_formatter import GeoLinkFormatter
+from geolink_formatter.format import HTML
+from geolink_formatter.parser import XML, schema_registry
+
+
+def main():
+    for documents in (10, 100, 1000):
+        xml = synthetic_geolink(documents=documents)
+        number = max(1, 1000 // documents)
+
+        def per_call():
+            schema_registry.clear()
+            parser = XML(host_url='http://oereblex.example.com')
+            return HTML().format(parser.from_string(xml))
+
+        formatter = GeoLinkFormatter(host_url='http://oereblex.example.com')
+
+        def reused():
+            return formatter.html(xml)
+
+        assert per_call() == reused()
+        report('new parser and schema per call ({0} documents)'.format(documents),
+               measure(per_call, number=number))
+        report('reused formatter ({0} documents)'.format(documents), measure(reused, number=number))
+
+
+if __name__ == '__main__':
+    main()
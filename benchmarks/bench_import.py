@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Import time of :mod:`geolink_formatter`.
+
+Imports the package in fresh interpreters using ``python -X importtime`` (Python 3.7+) and reports the best
+cumulative import time and the modules contributing most to it. Fails with exit code 1 if the import takes
+longer than ``--max-ms`` or loads one of the modules which are only needed for loading geoLinks via HTTP.
+
+Run with ``python -m benchmarks.bench_import``.
+"""
+from __future__ import print_function
+
+import argparse
+import subprocess
+import sys
+
+
+LAZY_MODULES = ('requests', 'urllib3', 'pkg_resources', 'concurrent.futures')
+"""tuple[str]: Modules which must not be loaded by importing the package."""
+
+
+def import_times(module):
+    """Imports the specified module in a fresh interpreter and returns the import times of the modules it
+    loads, excluding modules loaded at interpreter start-up.
+
+    Args:
+        module (str): The module to be imported.
+
+    Returns:
+        dict: The self and cumulative import time in microseconds of every loaded module, as tuple.
+
+    """
+    process = subprocess.Popen([sys.executable, '-X', 'importtime', '-c', 'import {0}'.format(module)],
+                               stderr=subprocess.PIPE)
+    _, stderr = process.communicate()
+    times = dict()
+    for line in stderr.decode('utf-8').splitlines():
+        if line.startswith('import time:') and '|' in line:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            if self_us.strip().isdigit():
+                times[name.strip()] = (int(self_us), int(cumulative_us))
+                # Top-level entries follow their dependencies, so everything before belongs to other imports
+                if not name[1:].startswith(' ') and name.strip() != module:
+                    times.clear()
+    return times
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    arguments.add_argument('--repeat', type=int, default=5, help='number of fresh interpreters')
+    arguments.add_argument('--max-ms', type=float, help='fail if the import takes longer')
+    arguments.add_argument('--top', type=int, default=10, help='number of modules listed')
+    args = arguments.parse_args(argv)
+
+    runs = [import_times('geolink_formatter') for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: times['geolink_formatter'][1])
+    total = best['geolink_formatter'][1] / 1000.0
+    print(u'{name:<50} {ms:>10.3f} ms'.format(name='import geolink_formatter', ms=total))
+    for name, (self_us, _) in sorted(best.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(u'  {name:<48} {ms:>10.3f} ms'.format(name=name, ms=self_us / 1000.0))
+
+    failed = False
+    loaded = [name for name in LAZY_MODULES if name in best]
+    if loaded:
+        print(u'FAILED: loaded on import: {0}'.format(u', '.join(loaded)))
+        failed = True
+    if args.max_ms is not None and total > args.max_ms:
+        print(u'FAILED: import takes longer than {0} ms'.format(args.max_ms))
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Parsing and validation of :meth:`geolink_formatter.parser.XML._parse_xml` for different input types.
+
+Run with ``python -m benchmarks.bench_input``.
+"""
+import io
+
+from benchmarks.common import measure, report, synthetic_geolink
+from geolink_formatter.parser import XML
+
+
+def main(documents=20000):
+    parser = XML()
+    xml = synthetic_geolink(documents=documents)
+    text = xml.decode('utf-8')
+    text_without_declaration = text.split(u'?>', 1)[1]
+    inputs = [
+        ('bytes', lambda: xml),
+        ('bytearray', lambda: bytearray(xml)),
+        ('memoryview', lambda: memoryview(xml)),
+        ('file', lambda: io.BytesIO(xml)),
+        ('str with encoding declaration', lambda: text),
+        ('str without declaration', lambda: text_without_declaration),
+        ('str encoded as UTF-16 (previous implementation)', lambda: text.encode('utf-16be'))
+    ]
+    for name, source in inputs:
+        report('{0} ({1} documents)'.format(name, documents),
+               measure(lambda: parser._parse_xml(source()), number=1, repeat=5))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Lazy document view of :meth:`geolink_formatter.parser.XML.from_string`.
+
+Compares creating all documents eagerly with the lazy view for callers needing only the number of documents
+or the first few of them, as well as materializing the view in full.
+
+Run with ``python -m benchmarks.bench_lazy``.
+"""
+from benchmarks.common import measure, report, synthetic_geolink
+from geolink_formatter.parser import XML
+
+
+def main():
+    parser = XML(xsd_validation=False)
+    for documents in (1000, 10000):
+        xml = synthetic_geolink(documents=documents)
+
+        def first_titles(lazy):
+            return [document.title for document in parser.from_string(xml, lazy=lazy)[:10]]
+
+        report('eager len ({0} documents)'.format(documents),
+               measure(lambda: len(parser.from_string(xml)), number=3))
+        report('lazy len ({0} documents)'.format(documents),
+               measure(lambda: len(parser.from_string(xml, lazy=True)), number=3))
+        report('eager first 10 ({0} documents)'.format(documents),
+               measure(lambda: first_titles(False), number=3))
+        report('lazy first 10 ({0} documents)'.format(documents),
+               measure(lambda: first_titles(True), number=3))
+        report('lazy materialize ({0} documents)'.format(documents),
+               measure(lambda: parser.from_string(xml, lazy=True).materialize(), number=3))
+
+
+if __name__ == '__main__':
+    main()
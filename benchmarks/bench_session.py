@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Latency of :meth:`geolink_formatter.parser.XML.from_url` with and without connection reuse.
+
+A local HTTP server stands in for OEREBlex. Each new connection is delayed by a few milliseconds to
+simulate the TCP and TLS handshake of a remote host.
+
+Run with ``python -m benchmarks.bench_session``.
+"""
+import requests
+
+from benchmarks.common import measure, report, serve, synthetic_geolink
+from geolink_formatter.parser import XML
+
+
+def main(handshake=0.005):
+    xml = synthetic_geolink(documents=10)
+    with serve(xml, delay=handshake) as base_url:
+        url = '{0}/api/geolinks/1500.xml'.format(base_url)
+
+        parser = XML()
+
+        def new_connection():
+            response = requests.get(url)
+            return parser.from_string(response.content)
+
+        def session():
+            return parser.from_url(url)
+
+        with parser:
+            assert len(new_connection()) == len(session())
+            report('new connection per request', measure(new_connection, number=20))
+            report('pooled session', measure(session, number=20))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""Time to first byte of the HTML output for large geoLinks.
+
+Compares :meth:`geolink_formatter.format.HTML.format` on a completely parsed geoLink with
+:meth:`geolink_formatter.format.HTML.iter_format` chained with
+:meth:`geolink_formatter.parser.XML.iter_documents`.
+
+Run with ``python -m benchmarks.bench_streaming``.
+"""
+import timeit
+
+from benchmarks.common import report, synthetic_geolink
+from geolink_formatter.format import HTML
+from geolink_formatter.parser import XML
+
+
+def main():
+    parser = XML()
+    for documents in (1000, 10000, 50000):
+        xml = synthetic_geolink(documents=documents)
+
+        start = timeit.default_timer()
+        HTML.format(parser.from_string(xml))
+        report('first byte, format ({0} documents)'.format(documents), timeit.default_timer() - start)
+
+        start = timeit.default_timer()
+        fragments = HTML.iter_format(parser.iter_documents(xml))
+        next(fragments)
+        next(fragments)
+        report('first byte, iter_format ({0} documents)'.format(documents), timeit.default_timer() - start)
+        for _ in fragments:
+            pass
+        report('last byte, iter_format ({0} documents)'.format(documents), timeit.default_timer() - start)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+
+import threading
+import time
+import timeit
+from contextlib import contextmanager
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:  # pragma: no cover
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+from geolink_formatter.parser import SCHEMA
+
+
+def synthetic_geolink(documents=100, files=3, version=SCHEMA.V1_2_0):
+    """Creates a synthetic geoLink XML valid against the specified schema version.
+
+    Args:
+        documents (int): The number of documents to be generated.
+        files (int): The number of files per document.
+        version (str): The geoLink schema version the XML has to be valid for. Defaults to `1.2.0`.
+
+    Returns:
+        bytes: The UTF-8 encoded geoLink XML.
+
+    """
+    parts = [u'<?xml version="1.0" encoding="utf-8"?>\n<geolinks>\n']
+    for i in range(documents):
+        attributes = [
+            u'id="{0}"'.format(i),
+            u'category="{0}"'.format(u'main' if i % 2 else u'related'),
+            u'doctype="{0}"'.format(u'decree' if i % 3 else u'edict'),
+            u'federal_level="Gemeinde"',
+            u'authority="Bauverwaltung Gemeinde"',
+            u'authority_url="http://www.example.com"',
+            u'title="Synthetic document {0}"'.format(i),
+            u'type="Sondernutzungsplan"',
+            u'subtype="Gestaltungsplan"',
+            u'decree_date="2001-03-15"',
+            u'enactment_date="2001-03-27"'
+        ]
+        if version != SCHEMA.V1_0_0:
+            attributes.append(u'number="{0}A"'.format(i))
+            attributes.append(u'abbreviation="abbr"')
+            if i % 10 == 9:
+                attributes.append(u'abrogation_date="2008-12-31"')
+        if version == SCHEMA.V1_2_0:
+            attributes.append(u'language="de"')
+        parts.append(u'<document {0}>\n'.format(u' '.join(attributes)))
+        for j in range(files):
+            description = u''
+            if version == SCHEMA.V1_2_0:
+                description = u' description="File {0}"'.format(j)
+            parts.append(u'<file category="{category}" href="/api/attachments/{i}{j}" '
+                         u'title="{i}-{j}.pdf"{description}></file>\n'.format(
+                             category=u'main' if j == 0 else u'additional',
+                             i=i,
+                             j=j,
+                             description=description
+                         ))
+        parts.append(u'</document>\n')
+    parts.append(u'</geolinks>\n')
+    return u''.join(parts).encode('utf-8')
+
+
+def measure(func, number=None, repeat=5, min_time=0.1):
+    """Measures the best per-call duration of the specified function.
+
+    Args:
+        func (callable): The function to be measured, called without arguments.
+        number (int): The number of calls per measurement. Optional, if not set, the number of calls is
+            doubled until a measurement takes at least `min_time`.
+        repeat (int): The number of measurements, of which the fastest one is used.
+        min_time (float): The minimum duration of a measurement in seconds, if `number` is not set.
+
+    Returns:
+        float: The per-call duration in seconds.
+
+    """
+    if number is None:
+        number = 1
+        while timeit.timeit(func, number=number) < min_time and number < 1000000:
+            number *= 2
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(name, seconds):
+    """Prints the per-call duration of a benchmark.
+
+    Args:
+        name (str): The benchmark name.
+        seconds (float): The per-call duration in seconds.
+
+    """
+    print(u'{name:<50} {ms:>10.3f} ms'.format(name=name, ms=seconds * 1000))
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+@contextmanager
+def serve(content, delay=0.0):
+    """Serves the specified content on a local HTTP/1.1 server supporting keep-alive connections.
+
+    Args:
+        content (bytes): The response body returned for every GET request.
+        delay (float): Additional delay in seconds for every new connection, simulating the TCP and TLS
+            handshake of a remote host.
+
+    Yields:
+        str: The base URL of the server, e.g. `http://127.0.0.1:12345`.
+
+    """
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            BaseHTTPRequestHandler.setup(self)
+            if delay:
+                time.sleep(delay)
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/xml')
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = _ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield 'http://127.0.0.1:{0}'.format(server.server_address[1])
+    finally:
+        server.shutdown()
+        server.server_close()
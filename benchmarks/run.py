@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""Benchmark suite covering parsing, validation, rendering and fetching.
+
+Runs every benchmark on synthetic geoLinks of the configured sizes for each supported schema version.
+Fetching uses a local HTTP server. The results can be written as JSON and compared with a baseline, failing
+with exit code 1 if a benchmark is slower than the baseline by more than the threshold.
+
+Run with ``python -m benchmarks.run``, e.g.::
+
+    python -m benchmarks.run --documents 10 1000 --output results.json
+    python -m benchmarks.run --baseline results.json --threshold 0.25
+
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from benchmarks.common import measure, report, serve, synthetic_geolink
+from geolink_formatter import __version__
+from geolink_formatter.format import HTML
+from geolink_formatter.parser import SCHEMA, XML, SchemaRegistry, version_detector
+
+
+def suite(documents, files, versions):
+    """Yields the benchmarks for the specified geoLink sizes and schema versions.
+
+    The local HTTP server for the fetch benchmark of a geoLink runs until the next geoLink is generated, so
+    the benchmarks have to be run while iterating.
+
+    Args:
+        documents (list[int]): The numbers of documents of the synthetic geoLinks.
+        files (int): The number of files per document.
+        versions (list[str]): The geoLink schema versions.
+
+    Yields:
+        tuple[str, callable]: The name of each benchmark and the function to be measured.
+
+    """
+    for version in versions:
+        yield 'compile_schema/' + version, lambda: SchemaRegistry._compile(version)
+        for count in documents:
+            xml = synthetic_geolink(documents=count, files=files, version=version)
+            parser = XML(version=version)
+            auto = XML(version=SCHEMA.AUTO)
+            unvalidated = XML(version=version, xsd_validation=False)
+            root = unvalidated._parse_xml(xml)
+            parsed = parser.from_string(xml)
+            suffix = '{0}/{1}'.format(version, count)
+            yield 'parse/' + suffix, lambda: unvalidated.from_string(xml)
+            yield 'validate/' + suffix, lambda: parser._schema.assertValid(root)
+            yield 'detect_version/' + suffix, lambda: version_detector.detect(root)
+            yield 'from_string/' + suffix, lambda: parser.from_string(xml)
+            yield 'from_string_auto/' + suffix, lambda: auto.from_string(xml)
+            yield 'render/' + suffix, lambda: HTML.format(parsed)
+            with serve(xml) as base_url:
+                url = base_url + '/api/geolinks/1.xml'
+                yield 'from_url/' + suffix, lambda: parser.from_url(url)
+            parser.close()
+
+
+def run(documents=(10, 100, 1000), files=3, versions=SCHEMA.ALL, repeat=5, min_time=0.1, pattern=None):
+    """Runs the benchmark suite and prints the results.
+
+    Args:
+        documents (list[int]): The numbers of documents of the synthetic geoLinks.
+        files (int): The number of files per document.
+        versions (list[str]): The geoLink schema versions.
+        repeat (int): The number of measurements per benchmark.
+        min_time (float): The minimum duration of a measurement in seconds.
+        pattern (str): Substring the names of the benchmarks to be run have to contain. Optional,
+            defaults to all benchmarks.
+
+    Returns:
+        dict: The machine-readable results, containing the per-call duration in seconds of each benchmark
+        under `results`.
+
+    """
+    results = dict()
+    for name, func in suite(documents, files, versions):
+        if pattern is None or pattern in name:
+            results[name] = measure(func, repeat=repeat, min_time=min_time)
+            report(name, results[name])
+    return {
+        'geolink_formatter': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'files': files,
+        'results': results
+    }
+
+
+def compare(results, baseline, threshold):
+    """Compares results with a baseline.
+
+    Benchmarks missing in one of both are ignored.
+
+    Args:
+        results (dict): The current results, as returned by :func:`run`.
+        baseline (dict): The baseline results, as returned by :func:`run`.
+        threshold (float): The accepted slowdown relative to the baseline, e.g. 0.2 for 20 %.
+
+    Returns:
+        list[tuple[str, float]]: The names of the regressed benchmarks and their duration relative to the
+        baseline.
+
+    """
+    regressions = list()
+    for name in sorted(results['results']):
+        reference = baseline['results'].get(name)
+        if reference:
+            ratio = results['results'][name] / reference
+            if ratio > 1 + threshold:
+                regressions.append((name, ratio))
+    return regressions
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    arguments.add_argument('--documents', type=int, nargs='+', default=[10, 100, 1000],
+                           help='numbers of documents of the synthetic geoLinks')
+    arguments.add_argument('--files', type=int, default=3, help='number of files per document')
+    arguments.add_argument('--versions', nargs='+', default=list(SCHEMA.ALL), choices=SCHEMA.ALL,
+                           help='geoLink schema versions')
+    arguments.add_argument('--repeat', type=int, default=5, help='number of measurements per benchmark')
+    arguments.add_argument('--min-time', type=float, default=0.1,
+                           help='minimum duration of a measurement in seconds')
+    arguments.add_argument('--filter', dest='pattern', help='run benchmarks containing this substring only')
+    arguments.add_argument('--output', help='write the results as JSON to this file')
+    arguments.add_argument('--baseline', help='compare the results with this JSON file')
+    arguments.add_argument('--threshold', type=float, default=0.2,
+                           help='accepted slowdown relative to the baseline, defaults to 0.2')
+    args = arguments.parse_args(argv)
+
+    results = run(documents=args.documents, files=args.files, versions=args.versions, repeat=args.repeat,
+                  min_time=args.min_time, pattern=args.pattern)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for name, ratio in regressions:
+            print(u'REGRESSION {name}: {ratio:.2f}x baseline'.format(name=name, ratio=ratio))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,36 +1,85 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+import hashlib
+
+from geolink_formatter.cache import CacheEntry
 from geolink_formatter.entity import Msg
 from geolink_formatter.format import HTML
-from geolink_formatter.parser import XML
+from geolink_formatter.metrics import METRIC, _clock
+from geolink_formatter.parser import XML, _map_parallel
 
 
 __version__ = '1.5.0'
 
 
 class GeoLinkFormatter(object):
-    def __init__(self, host_url=None, version='1.2.0', dtd_validation=False):
+    def __init__(self, host_url=None, version='1.2.0', dtd_validation=False, session=None, cache=None,
+                 html_cache=None, max_bytes=None, max_documents=None, max_files=None, xsd_validation=True,
+                 metrics=None):
         """Creates a new GeoLinkFormatter instance.
 
+        The parser, including its HTTP session, and the HTML formatter are created once and reused for
+        every call of :meth:`html`.
+
         Args:
             host_url (str): URL of the OEREBlex host to resolve relative URLs. The complete URL until but
                 without the */api* part has to be set, starting with *http://* or *https://*.
-            version (str): The version of the geoLink schema to be used. Defaults to `1.2.0`.
+            version (str): The version of the geoLink schema to be used or `auto` to detect it for each
+                geoLink (see :attr:`geolink_formatter.parser.SCHEMA.AUTO`). Defaults to `1.2.0`.
             dtd_validation (bool): Enable/disable validation of document type definition (DTD).
                 Optional, defaults to False.
+            session (requests.Session): The HTTP session used to load geoLinks. Optional, if not set, a
+                session created by :func:`geolink_formatter.parser.create_session` is used and closed
+                together with the formatter.
+            cache (geolink_formatter.cache.Cache): Cache for the documents loaded from URLs. Optional,
+                defaults to no caching.
+            html_cache (geolink_formatter.cache.Cache): Cache for the rendered HTML, keyed by a digest of
+                the geoLink XML and the formatter configuration. Optional, defaults to no caching.
+            max_bytes (int): Maximum size of the geoLink XML in bytes (characters for text input), enforced
+                while downloading. Optional, defaults to no limit.
+            max_documents (int): Maximum number of documents. Optional, defaults to no limit.
+            max_files (int): Maximum number of files per document. Optional, defaults to no limit.
+            xsd_validation (bool or geolink_formatter.parser.ValidationPolicy): Enable/disable validation
+                against XML schema (XSD), or a policy deciding per geoLink, e.g.
+                :class:`geolink_formatter.parser.FirstSightValidation`. Optional, defaults to True.
+            metrics (geolink_formatter.metrics.MetricsSink): Sink receiving the durations of all processing
+                stages, the parsed bytes, the number of documents and files and the cache outcomes.
+                Optional, defaults to no instrumentation.
 
         """
         self._host_url = host_url
         self._version = version
         self._dtd_validation = dtd_validation
+        self._parser = XML(host_url=host_url, version=version, dtd_validation=dtd_validation,
+                           xsd_validation=xsd_validation, session=session, cache=cache, max_bytes=max_bytes,
+                           max_documents=max_documents, max_files=max_files, metrics=metrics)
+        self._formatter = HTML()
+        self._metrics = metrics
+        self._html_cache = html_cache
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
-    def html(self, source):
+    def close(self):
+        """Closes the HTTP session, if it has been created by the formatter."""
+        self._parser.close()
+
+    def html(self, source, document_filter=None):
         """Returns the HTML representation of the geoLink XML form the specified source.
 
+        If the formatter has an HTML cache, geoLinks loaded from URLs are only parsed and formatted if their
+        content has not been rendered before. They are always downloaded, unless the formatter also has a
+        document cache, whose time to live and revalidation apply to the rendered HTML of the URL as well.
+
         Args:
             source (str or bytes): The geoLink source. Can be a XML string or an URL to load the XML via
                 HTTP/HTTPS request.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents to be
+                formatted, applied while parsing. Optional, defaults to all documents.
 
         Returns:
             str: An HTML formatted string containing the documents as HTML list.
@@ -39,19 +88,142 @@ class GeoLinkFormatter(object):
             TypeError: Raised on invalid source type.
             lxml.etree.XMLSyntaxError: Raised on failed validation.
             requests.HTTPError: Raised on failed HTTP request.
+            geolink_formatter.parser.LimitExceededError: Raised if the geoLink exceeds a configured limit.
+
+        """
+        if self._html_cache is not None:
+            if self._is_url(source):
+                if self._parser.cache is not None:
+                    return self._html_from_url_cached(source, document_filter)
+                return self._html_cached(self._parser._fetch(source), source, document_filter)
+            return self._html_cached(source, document_filter=document_filter)
+        elif self._is_url(source):
+            return self._format(self._parser.from_url(source, document_filter=document_filter))
+        else:
+            return self._format(self._parser.from_string(source, document_filter=document_filter))
+
+    def _format(self, documents):
+        """Formats the documents as HTML, reporting the duration to the metrics sink.
+
+        Args:
+            documents (list[geolink_formatter.entity.Document]): The documents to be formatted.
+
+        Returns:
+            str: An HTML formatted string containing the documents as HTML list.
+
+        """
+        if self._metrics is None:
+            return self._formatter.format(documents)
+        start = _clock()
+        html = self._formatter.format(documents)
+        self._metrics.timing(METRIC.FORMAT, _clock() - start)
+        return html
+
+    def _html_cached(self, xml, source=None, document_filter=None):
+        """Returns the HTML representation of the specified geoLink XML using the HTML cache.
+
+        If HTML for byte-identical XML has been rendered before with the same configuration, it is returned
+        without parsing the XML.
+
+        Args:
+            xml (str or bytes): The geoLink XML.
+            source (str or bytes): The URL the XML has been loaded from. Optional, defaults to None.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents to be
+                formatted. Optional, defaults to all documents.
+
+        Returns:
+            str: An HTML formatted string containing the documents as HTML list.
+
+        """
+        digest = hashlib.sha256(xml if isinstance(xml, bytes) else xml.encode('utf-8')).hexdigest()
+        key = '|'.join([
+            digest,
+            self._host_url or '',
+            self._version,
+            str(self._dtd_validation),
+            self._parser.xsd_validation.__class__.__name__,
+            document_filter.key if document_filter else ''
+        ])
+        entry = self._html_cache.get(key)
+        if entry is not None and entry.is_fresh(self._html_cache.ttl):
+            self._html_cache._record(hits=1)
+            self._parser._increment(METRIC.HTML_CACHE_HIT)
+            return entry.value
+        root = self._parser._parse_xml(xml, source=source)
+        html = self._format(self._parser._documents(root, document_filter))
+        self._html_cache._record(misses=1)
+        self._parser._increment(METRIC.HTML_CACHE_MISS)
+        self._html_cache.set(key, CacheEntry(html))
+        return html
+
+    def _html_from_url_cached(self, url, document_filter=None):
+        """Returns the HTML representation of the geoLink of the specified URL using both caches.
+
+        The rendered HTML is stored in the document cache by URL, so it is returned without request while
+        fresh and revalidated with a conditional request afterwards. Downloaded content is rendered using
+        the HTML cache.
+
+        Args:
+            url (str): The URL of the geoLink.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents to be
+                formatted. Optional, defaults to all documents.
+
+        Returns:
+            str: An HTML formatted string containing the documents as HTML list.
+
+        """
+        key = u'html|' + self._parser._cache_key(url, None, document_filter)
+        return self._parser._load_cached(
+            key,
+            lambda content: self._html_cached(content, url, document_filter),
+            url
+        )
+
+    @staticmethod
+    def _is_url(source):
+        """Checks whether the specified geoLink source is an URL or a XML string.
+
+        Args:
+            source (str or bytes): The geoLink source.
+
+        Returns:
+            bool: True if the source is an URL starting with *http://* or *https://*, False otherwise.
+
+        Raises:
+            TypeError: Raised on invalid source type.
 
         """
-        parser = XML(host_url=self._host_url, version=self._version, dtd_validation=self._dtd_validation)
         if isinstance(source, (str, bytes)):
             http = 'http://' if isinstance(source, str) else b'http://'
             https = 'https://' if isinstance(source, str) else b'https://'
-            if source.startswith(http) or source.startswith(https):
-                return HTML().format(parser.from_url(source))
-            else:
-                return HTML().format(parser.from_string(source))
+            return source.startswith(http) or source.startswith(https)
         else:
             raise TypeError(Msg.invalid_argument.format(
                 arg='source',
                 expected=(str, bytes),
                 got=source.__class__
             ))
+
+    def html_many(self, sources, max_workers=10, document_filter=None):
+        """Returns the HTML representations of the geoLink XML from multiple sources.
+
+        The sources are processed in parallel on a bounded thread pool, sharing the HTTP session of the
+        formatter for sources to be loaded via HTTP/HTTPS request.
+
+        Args:
+            sources (list[str or bytes]): The geoLink sources. Each source can be a XML string or an URL to
+                load the XML via HTTP/HTTPS request.
+            max_workers (int): The maximum number of sources processed concurrently. Defaults to 10.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents to be
+                formatted, applied while parsing. Optional, defaults to all documents.
+
+        Returns:
+            list[str or Exception]: The HTML formatted strings in the order of the specified sources. If
+            processing a source fails, the raised exception (e.g. :class:`TypeError`,
+            :class:`lxml.etree.XMLSyntaxError` or :class:`requests.HTTPError`) is returned at its position
+            instead of aborting the whole batch.
+
+        """
+        def html(source):
+            return self.html(source, document_filter=document_filter)
+        return _map_parallel(html, sources, max_workers)
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Generated from the geoLink schemas by "python -m geolink_formatter.version".
+# Do not edit.
+
+SPECS = {
+    '1.0.0': {
+        'document': 'document',
+        'document_attributes': {
+            'approval_date': None,
+            'authority': None,
+            'authority_url': None,
+            'category': ('main', 'related'),
+            'cycle': None,
+            'decree_date': None,
+            'doctype': ('decree', 'edict'),
+            'enactment_date': None,
+            'federal_level': ('Bezirk', 'Bund', 'Gemeinde', 'Interkantonal', 'Kanton'),
+            'id': None,
+            'instance': None,
+            'publication_date': None,
+            'subtype': None,
+            'title': None,
+            'type': None,
+        },
+        'file': 'file',
+        'file_attributes': {
+            'category': ('additional', 'main'),
+            'href': None,
+            'title': None,
+        },
+        'root_attributes': {},
+    },
+    '1.1.0': {
+        'document': 'document',
+        'document_attributes': {
+            'abbreviation': None,
+            'abrogation_date': None,
+            'approval_date': None,
+            'authority': None,
+            'authority_url': None,
+            'category': ('main', 'related'),
+            'cycle': None,
+            'decree_date': None,
+            'doctype': ('decree', 'edict'),
+            'enactment_date': None,
+            'federal_level': ('Bezirk', 'Bund', 'Gemeinde', 'Interkantonal', 'Kanton'),
+            'id': None,
+            'instance': None,
+            'number': None,
+            'publication_date': None,
+            'subtype': None,
+            'title': None,
+            'type': None,
+        },
+        'file': 'file',
+        'file_attributes': {
+            'category': ('additional', 'main'),
+            'href': None,
+            'title': None,
+        },
+        'root_attributes': {},
+    },
+    '1.1.1': {
+        'document': 'document',
+        'document_attributes': {
+            'abbreviation': None,
+            'abrogation_date': None,
+            'approval_date': None,
+            'authority': None,
+            'authority_url': None,
+            'category': ('main', 'related'),
+            'cycle': None,
+            'decree_date': None,
+            'doctype': ('decree', 'edict'),
+            'enactment_date': None,
+            'federal_level': ('Bezirk', 'Bund', 'Gemeinde', 'Interkantonal', 'Kanton'),
+            'id': None,
+            'instance': None,
+            'number': None,
+            'publication_date': None,
+            'subtype': None,
+            'title': None,
+            'type': None,
+        },
+        'file': 'file',
+        'file_attributes': {
+            'category': ('additional', 'main'),
+            'href': None,
+            'title': None,
+        },
+        'root_attributes': {},
+    },
+    '1.2.0': {
+        'document': 'document',
+        'document_attributes': {
+            'abbreviation': None,
+            'abrogation_date': None,
+            'approval_date': None,
+            'authority': None,
+            'authority_url': None,
+            'category': ('main', 'related'),
+            'cycle': None,
+            'decree_date': None,
+            'doctype': ('decree', 'edict', 'notice'),
+            'enactment_date': None,
+            'federal_level': ('Bezirk', 'Bund', 'Gemeinde', 'Interkantonal', 'Kanton'),
+            'id': None,
+            'instance': None,
+            'language': ('de', 'fr', 'it', 'rm'),
+            'number': None,
+            'publication_date': None,
+            'subtype': None,
+            'title': None,
+            'type': None,
+        },
+        'file': 'file',
+        'file_attributes': {
+            'category': ('additional', 'main'),
+            'description': None,
+            'href': None,
+            'title': None,
+        },
+        'root_attributes': {},
+    },
+}
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from geolink_formatter import GeoLinkFormatter
+from geolink_formatter.entity import Msg
+from geolink_formatter.format import HTML
+from geolink_formatter.parser import XML
+
+
+class AsyncXML(object):
+    def __init__(self, host_url=None, version='1.2.0', dtd_validation=False, xsd_validation=True,
+                 session=None, executor=None):
+        """Creates a new asynchronous XML parser instance.
+
+        Loading geoLinks is done using :mod:`aiohttp`, which has to be installed separately (e.g. using the
+        `async` extra). Parsing and validating the XML is offloaded to an executor, so the event loop is
+        never blocked.
+
+        Args:
+            host_url (str): URL of the OEREBlex host to resolve relative URLs. The complete URL until but
+                without the */api* part has to be set, starting with *http://* or *https://*.
+            version (str): The version of the geoLink schema to be used. Defaults to `1.2.0`.
+            dtd_validation (bool): Enable/disable validation of document type definition (DTD).
+                Optional, defaults to False.
+            xsd_validation (bool): Enable/disable validation against XML schema (XSD).
+                Optional, defaults to True.
+            session (aiohttp.ClientSession): The HTTP session used to load geoLinks. Optional, if not set,
+                a session is created on first use and closed together with the parser.
+            executor (concurrent.futures.Executor): The executor used for parsing. Optional, defaults to
+                the default executor of the event loop.
+
+        """
+        self._parser = XML(host_url=host_url, version=version, dtd_validation=dtd_validation,
+                           xsd_validation=xsd_validation)
+        self._session = session
+        self._owns_session = session is None
+        self._executor = executor
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def host_url(self):
+        """str: The OEREBlex host URL to resolve relative URLs."""
+        return self._parser.host_url
+
+    @property
+    def session(self):
+        """aiohttp.ClientSession: The HTTP session used to load geoLinks."""
+        if self._session is None:
+            if aiohttp is None:
+                raise ImportError('Loading geoLinks asynchronously requires aiohttp to be installed')
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        """Closes the HTTP session, if it has been created by the parser."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _run(self, func, *args):
+        """Runs the specified function in the executor.
+
+        Args:
+            func (callable): The function to be called.
+            *args: The arguments passed to the function.
+
+        Returns:
+            object: The result of the function.
+
+        """
+        return await asyncio.get_event_loop().run_in_executor(self._executor, func, *args)
+
+    async def _fetch(self, url, params=None, **kwargs):
+        """Loads the content of the specified URL. As for :class:`geolink_formatter.parser.XML`, any other
+        status code than 200 is an error.
+
+        Args:
+            url (str or bytes): The URL to be loaded.
+            params (dict): Dictionary to be sent in the query string.
+            **kwargs: Optional arguments that :meth:`aiohttp.ClientSession.request` takes.
+
+        Returns:
+            bytes: The response body.
+
+        Raises:
+            aiohttp.ClientResponseError: Raised on failed HTTP request.
+
+        """
+        if isinstance(url, bytes):
+            url = url.decode('utf-8')
+        async with self.session.get(url, params=params, **kwargs) as response:
+            response.raise_for_status()
+            if response.status != 200:
+                raise aiohttp.ClientResponseError(
+                    response.request_info,
+                    response.history,
+                    status=response.status,
+                    message=Msg.unexpected_status.format(status=response.status, url=response.url),
+                    headers=response.headers
+                )
+            return await response.read()
+
+    async def from_string(self, xml):
+        """Parses XML into internal structure without blocking the event loop.
+
+        Args:
+            xml (str or bytes): The XML to be parsed.
+
+        Returns:
+            list[geolink_formatter.entity.Document]: A list containing the parsed document elements.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: Raised on failed validation.
+
+        """
+        return await self._run(self._parser.from_string, xml)
+
+    async def from_url(self, url, params=None, **kwargs):
+        """Loads the geoLink of the specified URL and parses it into the internal structure.
+
+        Args:
+            url (str): The URL of the geoLink to be parsed.
+            params (dict): Dictionary to be sent in the query string.
+            **kwargs: Optional arguments that :meth:`aiohttp.ClientSession.request` takes.
+
+        Returns:
+            list[geolink_formatter.entity.Document]: A list containing the parsed document elements.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: Raised on failed validation.
+            aiohttp.ClientResponseError: Raised on failed HTTP request.
+
+        """
+        return await self.from_string(await self._fetch(url, params=params, **kwargs))
+
+
+class AsyncGeoLinkFormatter(object):
+    def __init__(self, host_url=None, version='1.2.0', dtd_validation=False, session=None, executor=None):
+        """Creates a new asynchronous GeoLinkFormatter instance.
+
+        Args:
+            host_url (str): URL of the OEREBlex host to resolve relative URLs. The complete URL until but
+                without the */api* part has to be set, starting with *http://* or *https://*.
+            version (str): The version of the geoLink schema to be used. Defaults to `1.2.0`.
+            dtd_validation (bool): Enable/disable validation of document type definition (DTD).
+                Optional, defaults to False.
+            session (aiohttp.ClientSession): The HTTP session used to load geoLinks. Optional, if not set,
+                a session is created on first use and closed together with the formatter.
+            executor (concurrent.futures.Executor): The executor used for parsing and formatting.
+                Optional, defaults to the default executor of the event loop.
+
+        """
+        self._parser = AsyncXML(host_url=host_url, version=version, dtd_validation=dtd_validation,
+                                session=session, executor=executor)
+        self._formatter = HTML()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes the HTTP session, if it has been created by the formatter."""
+        await self._parser.close()
+
+    def _format(self, xml):
+        """Parses the specified XML and formats it as HTML, to be run in the executor.
+
+        Args:
+            xml (str or bytes): The XML to be formatted.
+
+        Returns:
+            str: An HTML formatted string containing the documents as HTML list.
+
+        """
+        return self._formatter.format(self._parser._parser.from_string(xml))
+
+    async def html(self, source):
+        """Returns the HTML representation of the geoLink XML form the specified source.
+
+        Args:
+            source (str or bytes): The geoLink source. Can be a XML string or an URL to load the XML via
+                HTTP/HTTPS request.
+
+        Returns:
+            str: An HTML formatted string containing the documents as HTML list.
+
+        Raises:
+            TypeError: Raised on invalid source type.
+            lxml.etree.XMLSyntaxError: Raised on failed validation.
+            aiohttp.ClientResponseError: Raised on failed HTTP request.
+
+        """
+        if GeoLinkFormatter._is_url(source):
+            source = await self._parser._fetch(source)
+        return await self._parser._run(self._format, source)
+
+    async def html_many(self, sources):
+        """Returns the HTML representations of the geoLink XML from multiple sources, processed
+        concurrently.
+
+        Args:
+            sources (list[str or bytes]): The geoLink sources. Each source can be a XML string or an URL to
+                load the XML via HTTP/HTTPS request.
+
+        Returns:
+            list[str or Exception]: The HTML formatted strings in the order of the specified sources. If
+            processing a source fails, the raised exception is returned at its position instead of aborting
+            the whole batch.
+
+        """
+        return list(await asyncio.gather(*[self.html(source) for source in sources], return_exceptions=True))
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+import pickle
+
+from geolink_formatter import GeoLinkFormatter
+from geolink_formatter.parser import SCHEMA, schema_registry
+
+
+class BatchError(Exception):
+    def __init__(self, message, error_type):
+        """Error raised in a worker process which could not be transferred as is.
+
+        Args:
+            message (str): The message of the original error.
+            error_type (str): The qualified name of the type of the original error.
+
+        """
+        super(BatchError, self).__init__(message, error_type)
+        self.message = message
+        self.error_type = error_type
+
+    def __str__(self):
+        return '{0}: {1}'.format(self.error_type, self.message)
+
+
+_formatter = None
+"""geolink_formatter.GeoLinkFormatter: The formatter of the current worker process."""
+
+
+def _init_worker(host_url, version, dtd_validation):
+    """Initializes a worker process, compiling the schema once at start-up. With version
+    :attr:`geolink_formatter.parser.SCHEMA.AUTO`, the schemas of all versions are compiled.
+
+    Args:
+        host_url (str): URL of the OEREBlex host to resolve relative URLs.
+        version (str): The version of the geoLink schema to be used or
+            :attr:`geolink_formatter.parser.SCHEMA.AUTO`.
+        dtd_validation (bool): Enable/disable validation of document type definition (DTD).
+
+    """
+    global _formatter
+    schema_registry.warm_up(SCHEMA.ALL if version == SCHEMA.AUTO else [version])
+    _formatter = GeoLinkFormatter(host_url=host_url, version=version, dtd_validation=dtd_validation)
+
+
+def _transferable(error):
+    """Returns the specified error, or a :class:`BatchError` if it cannot be pickled.
+
+    Args:
+        error (Exception): The error raised in the worker process.
+
+    Returns:
+        Exception: An error which can be transferred to the parent process.
+
+    """
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        error_type = '{0}.{1}'.format(error.__class__.__module__, error.__class__.__name__)
+        return BatchError(str(error), error_type)
+
+
+def _parse(source):
+    """Parses a geoLink source in the worker process.
+
+    Args:
+        source (str or bytes): The geoLink source.
+
+    Returns:
+        list[geolink_formatter.entity.Document] or Exception: The parsed documents or the raised error.
+
+    """
+    try:
+        if _formatter._is_url(source):
+            return _formatter._parser.from_url(source)
+        return _formatter._parser.from_string(source)
+    except Exception as e:
+        return _transferable(e)
+
+
+def _render(source):
+    """Renders a geoLink source as HTML in the worker process.
+
+    Args:
+        source (str or bytes): The geoLink source.
+
+    Returns:
+        str or Exception: The HTML formatted string or the raised error.
+
+    """
+    try:
+        return _formatter.html(source)
+    except Exception as e:
+        return _transferable(e)
+
+
+def _imap(func, sources, processes, chunksize, host_url, version, dtd_validation):
+    """Processes the sources on a pool of worker processes, yielding the results in order.
+
+    Args:
+        func (callable): The function to be applied to each source in the worker processes.
+        sources (iterable[str or bytes]): The geoLink sources.
+        processes (int): The number of worker processes.
+        chunksize (int): The number of sources sent to a worker process at once.
+        host_url (str): URL of the OEREBlex host to resolve relative URLs.
+        version (str): The version of the geoLink schema to be used.
+        dtd_validation (bool): Enable/disable validation of document type definition (DTD).
+
+    Yields:
+        object: The results of the function in the order of the sources.
+
+    """
+    pool = multiprocessing.Pool(
+        processes=processes,
+        initializer=_init_worker,
+        initargs=(host_url, version, dtd_validation)
+    )
+    try:
+        for result in pool.imap(func, sources, chunksize):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _run(func, sources, processes, chunksize, host_url, version, dtd_validation):
+    """Checks the configuration and returns the results of processing the sources on a pool of worker
+    processes.
+
+    Errors raised by the initializer of a worker process are not reported by :mod:`multiprocessing`, which
+    restarts the worker forever instead. Therefore the configuration is checked by creating a formatter in
+    the calling process before the pool is started.
+
+    Args:
+        func (callable): The function to be applied to each source in the worker processes.
+        sources (iterable[str or bytes]): The geoLink sources.
+        processes (int): The number of worker processes.
+        chunksize (int): The number of sources sent to a worker process at once.
+        host_url (str): URL of the OEREBlex host to resolve relative URLs.
+        version (str): The version of the geoLink schema to be used.
+        dtd_validation (bool): Enable/disable validation of document type definition (DTD).
+
+    Returns:
+        generator: The results of the function in the order of the sources.
+
+    Raises:
+        IOError: Raised if no schema exists for the specified version.
+
+    """
+    GeoLinkFormatter(host_url=host_url, version=version, dtd_validation=dtd_validation).close()
+    return _imap(func, sources, processes, chunksize, host_url, version, dtd_validation)
+
+
+def parse_all(sources, processes=None, chunksize=1, host_url=None, version='1.2.0', dtd_validation=False):
+    """Parses multiple geoLinks on a pool of worker processes.
+
+    Each worker process compiles the schema once at start-up. The results are yielded in the order of the
+    sources as soon as they are available.
+
+    Args:
+        sources (iterable[str or bytes]): The geoLink sources. Each source can be a XML string or an URL to
+            load the XML via HTTP/HTTPS request.
+        processes (int): The number of worker processes. Defaults to the number of CPUs.
+        chunksize (int): The number of sources sent to a worker process at once. Larger chunks reduce the
+            communication overhead for many small geoLinks. Defaults to 1.
+        host_url (str): URL of the OEREBlex host to resolve relative URLs. The complete URL until but
+            without the */api* part has to be set, starting with *http://* or *https://*.
+        version (str): The version of the geoLink schema to be used. Defaults to `1.2.0`.
+        dtd_validation (bool): Enable/disable validation of document type definition (DTD).
+            Optional, defaults to False.
+
+    Yields:
+        list[geolink_formatter.entity.Document] or Exception: The parsed documents of each source. If
+        processing a source fails, the raised exception is yielded instead. Exceptions which cannot be
+        transferred from the worker process are replaced by a :class:`BatchError`.
+
+    Raises:
+        IOError: Raised if no schema exists for the specified version.
+
+    """
+    return _run(_parse, sources, processes, chunksize, host_url, version, dtd_validation)
+
+
+def render_all(sources, processes=None, chunksize=1, host_url=None, version='1.2.0', dtd_validation=False):
+    """Renders multiple geoLinks as HTML on a pool of worker processes.
+
+    Each worker process compiles the schema once at start-up. The results are yielded in the order of the
+    sources as soon as they are available.
+
+    Args:
+        sources (iterable[str or bytes]): The geoLink sources. Each source can be a XML string or an URL to
+            load the XML via HTTP/HTTPS request.
+        processes (int): The number of worker processes. Defaults to the number of CPUs.
+        chunksize (int): The number of sources sent to a worker process at once. Larger chunks reduce the
+            communication overhead for many small geoLinks. Defaults to 1.
+        host_url (str): URL of the OEREBlex host to resolve relative URLs. The complete URL until but
+            without the */api* part has to be set, starting with *http://* or *https://*.
+        version (str): The version of the geoLink schema to be used. Defaults to `1.2.0`.
+        dtd_validation (bool): Enable/disable validation of document type definition (DTD).
+            Optional, defaults to False.
+
+    Yields:
+        str or Exception: The HTML formatted string of each source. If processing a source fails, the
+        raised exception is yielded instead. Exceptions which cannot be transferred from the worker process
+        are replaced by a :class:`BatchError`.
+
+    Raises:
+        IOError: Raised if no schema exists for the specified version.
+
+    """
+    return _run(_render, sources, processes, chunksize, host_url, version, dtd_validation)
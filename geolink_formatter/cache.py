@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+import errno
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+class CacheEntry(object):
+
+    __slots__ = ('value', 'etag', 'last_modified', 'timestamp')
+
+    def __init__(self, value, etag=None, last_modified=None, timestamp=None):
+        """Creates a new cache entry.
+
+        Args:
+            value (object): The cached value.
+            etag (str): The `ETag` header of the response the value has been created from.
+            last_modified (str): The `Last-Modified` header of the response the value has been created from.
+            timestamp (float): The time the value has been stored or revalidated, in seconds since the
+                epoch. Defaults to the current time.
+
+        """
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    def is_fresh(self, ttl):
+        """Checks whether the entry is younger than the specified time to live.
+
+        Args:
+            ttl (float): The time to live in seconds. None means entries never expire.
+
+        Returns:
+            bool: True if the entry can be used without revalidation, False otherwise.
+
+        """
+        return ttl is None or time.time() - self.timestamp < ttl
+
+
+class Cache(object):
+    def __init__(self, ttl=300, max_entries=128):
+        """Base class for caches storing values by key, evicting the least recently used entries.
+
+        Args:
+            ttl (float): The time to live of the entries in seconds. Expired entries are kept until they are
+                evicted, so they can be revalidated. None means entries never expire. Defaults to 300.
+            max_entries (int): The maximum number of entries. Defaults to 128.
+
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+
+    @property
+    def ttl(self):
+        """float: The time to live of the entries in seconds."""
+        return self._ttl
+
+    @property
+    def max_entries(self):
+        """int: The maximum number of entries."""
+        return self._max_entries
+
+    @property
+    def hits(self):
+        """int: Number of requests served by a fresh entry."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """int: Number of requests for which no usable entry existed."""
+        return self._misses
+
+    @property
+    def revalidations(self):
+        """int: Number of requests served by an expired entry confirmed to be unchanged."""
+        return self._revalidations
+
+    def _record(self, hits=0, misses=0, revalidations=0):
+        """Updates the statistics of the cache.
+
+        Args:
+            hits (int): The number of hits to be added.
+            misses (int): The number of misses to be added.
+            revalidations (int): The number of revalidations to be added.
+
+        """
+        with self._lock:
+            self._hits += hits
+            self._misses += misses
+            self._revalidations += revalidations
+
+    def get(self, key):
+        """Returns the entry stored for the specified key, regardless of whether it is expired.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            geolink_formatter.cache.CacheEntry: The stored entry or None.
+
+        """
+        raise NotImplementedError()
+
+    def set(self, key, entry):
+        """Stores an entry for the specified key, evicting the least recently used entries if necessary.
+
+        Args:
+            key (str): The key of the entry.
+            entry (geolink_formatter.cache.CacheEntry): The entry to be stored.
+
+        """
+        raise NotImplementedError()
+
+    def clear(self):
+        """Removes all entries and resets the statistics."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._revalidations = 0
+
+
+class MemoryCache(Cache):
+    def __init__(self, ttl=300, max_entries=128):
+        """Creates a new thread-safe in-memory cache.
+
+        Args:
+            ttl (float): The time to live of the entries in seconds. Expired entries are kept until they are
+                evicted, so they can be revalidated. None means entries never expire. Defaults to 300.
+            max_entries (int): The maximum number of entries. Defaults to 128.
+
+        """
+        super(MemoryCache, self).__init__(ttl=ttl, max_entries=max_entries)
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        super(MemoryCache, self).clear()
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache(Cache):
+    def __init__(self, directory, ttl=300, max_entries=1024):
+        """Creates a new cache storing its entries as pickle files in the specified directory.
+
+        The cache can be shared by multiple processes. The least recently used entries are determined by
+        the modification time of the files.
+
+        Args:
+            directory (str): The directory to store the entries in. It is created if it does not exist.
+            ttl (float): The time to live of the entries in seconds. Expired entries are kept until they are
+                evicted, so they can be revalidated. None means entries never expire. Defaults to 300.
+            max_entries (int): The maximum number of entries. Defaults to 1024.
+
+        """
+        super(DiskCache, self).__init__(ttl=ttl, max_entries=max_entries)
+        self._directory = directory
+        try:
+            os.makedirs(directory)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    @property
+    def directory(self):
+        """str: The directory containing the entries."""
+        return self._directory
+
+    def __len__(self):
+        return len(self._files())
+
+    def _path(self, key):
+        """Returns the path of the file for the specified key.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            str: The path of the file.
+
+        """
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self._directory, '{0}.cache'.format(digest))
+
+    def _files(self):
+        """Returns the paths of all entry files.
+
+        Returns:
+            list[str]: The paths of the entry files.
+
+        """
+        return [os.path.join(self._directory, name) for name in os.listdir(self._directory)
+                if name.endswith('.cache')]
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+            os.utime(path, None)
+        except (IOError, OSError, EOFError, pickle.UnpicklingError):
+            return None
+        return entry
+
+    def set(self, key, entry):
+        fd, tmp = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+        _replace(tmp, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        """Removes the least recently used entries exceeding the maximum number of entries."""
+        files = self._files()
+        if len(files) > self._max_entries:
+            mtimes = list()
+            for path in files:
+                try:
+                    mtimes.append((os.path.getmtime(path), path))
+                except OSError:
+                    pass
+            for _, path in sorted(mtimes)[:len(mtimes) - self._max_entries]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def clear(self):
+        super(DiskCache, self).clear()
+        for path in self._files():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+import hashlib
+
+from lxml.etree import tostring
+
+from geolink_formatter import GeoLinkFormatter
+from geolink_formatter.format import HTML
+from geolink_formatter.parser import XML, DocumentList
+
+
+class Snapshot(object):
+    def __init__(self, key, digest, documents, fingerprints, fragments):
+        """Stored state of a geoLink, used to detect the changes of a newer version of it.
+
+        Snapshots are created by :class:`SnapshotDiffer` and can be pickled to be stored between polls.
+
+        Args:
+            key (str): The configuration of the differ which has created the snapshot.
+            digest (str): The SHA-256 digest of the geoLink XML.
+            documents (geolink_formatter.parser.DocumentList): The documents of the geoLink.
+            fingerprints (list[bytes]): The fingerprint of each document, in the same order.
+            fragments (list[str]): The HTML list item of each document, in the same order.
+
+        """
+        self._key = key
+        self._digest = digest
+        self._documents = documents
+        self._fingerprints = fingerprints
+        self._fragments = fragments
+        self._index = dict((document.id, i) for i, document in enumerate(documents))
+
+    def __getstate__(self):
+        return self._key, self._digest, self._documents, self._fingerprints, self._fragments
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    @property
+    def digest(self):
+        """str: The SHA-256 digest of the geoLink XML."""
+        return self._digest
+
+    @property
+    def documents(self):
+        """geolink_formatter.parser.DocumentList: The documents of the geoLink."""
+        return self._documents
+
+    @property
+    def version(self):
+        """str: The geoLink schema version used for parsing."""
+        return self._documents.version
+
+    @property
+    def html(self):
+        """str: The documents formatted as HTML list, equal to the result of
+        :meth:`geolink_formatter.format.HTML.format`."""
+        return HTML.join(self._fragments)
+
+    def _find(self, doc_id, fingerprint):
+        """Returns the position of an unchanged document.
+
+        Args:
+            doc_id (str): The document identifier.
+            fingerprint (bytes): The fingerprint of the document.
+
+        Returns:
+            int: The position of the document or None if it is new or has changed.
+
+        """
+        i = self._index.get(doc_id)
+        if i is not None and self._fingerprints[i] == fingerprint:
+            return i
+        return None
+
+
+class Diff(object):
+    def __init__(self, snapshot, added, removed, changed):
+        """Changes of a geoLink compared to a previous snapshot.
+
+        Args:
+            snapshot (geolink_formatter.diff.Snapshot): The snapshot of the new geoLink.
+            added (list[geolink_formatter.entity.Document]): The documents which have been added.
+            removed (list[geolink_formatter.entity.Document]): The documents which have been removed.
+            changed (list[geolink_formatter.entity.Document]): The new version of the documents which have
+                changed.
+
+        """
+        self._snapshot = snapshot
+        self._added = added
+        self._removed = removed
+        self._changed = changed
+
+    @property
+    def snapshot(self):
+        """geolink_formatter.diff.Snapshot: The snapshot of the new geoLink, to be compared with the next
+        version."""
+        return self._snapshot
+
+    @property
+    def added(self):
+        """list[geolink_formatter.entity.Document]: The documents which have been added."""
+        return self._added
+
+    @property
+    def removed(self):
+        """list[geolink_formatter.entity.Document]: The documents which have been removed, as contained in
+        the previous snapshot."""
+        return self._removed
+
+    @property
+    def changed(self):
+        """list[geolink_formatter.entity.Document]: The new version of the documents which have changed."""
+        return self._changed
+
+    @property
+    def has_changes(self):
+        """bool: True if documents have been added, removed or changed, False otherwise."""
+        return bool(self._added or self._removed or self._changed)
+
+
+class SnapshotDiffer(object):
+    def __init__(self, parser=None, document_filter=None):
+        """Creates a differ comparing versions of geoLinks, e.g. loaded by periodic polling.
+
+        Documents are compared by their identifier and a fingerprint of their element, covering their
+        attributes and files. Entities are only created and formatted for added and changed documents, the
+        HTML list items of unchanged documents are taken from the previous snapshot. A geoLink identical to
+        the previous one is not parsed at all.
+
+        Fingerprints are taken from the serialized elements, so changes in the order of attributes or in the
+        whitespace between files are reported as changes as well. Changes in the order of documents are
+        not reported, but applied to the HTML of the new snapshot.
+
+        Args:
+            parser (geolink_formatter.parser.XML): The parser used to load, parse and validate geoLinks.
+                Optional, defaults to a parser with default settings.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents to be
+                compared. Optional, defaults to all documents.
+
+        """
+        self._parser = XML() if parser is None else parser
+        self._document_filter = document_filter
+        self._key = u'|'.join([
+            self._parser.host_url or u'',
+            self._parser.version,
+            document_filter.key if document_filter else u''
+        ])
+
+    @property
+    def parser(self):
+        """geolink_formatter.parser.XML: The parser used to load, parse and validate geoLinks."""
+        return self._parser
+
+    def _load(self, source):
+        """Loads the geoLink XML from a source.
+
+        Args:
+            source (str or bytes): The geoLink source. Can be a XML string or an URL to load the XML via
+                HTTP/HTTPS request.
+
+        Returns:
+            tuple[str or bytes, str]: The XML and the URL it has been loaded from or None.
+
+        """
+        if GeoLinkFormatter._is_url(source):
+            return self._parser._fetch(source), source
+        return source, None
+
+    def snapshot(self, source, validation=None):
+        """Creates a snapshot of a geoLink, without comparing it.
+
+        Args:
+            source (str or bytes): The geoLink source. Can be a XML string or an URL to load the XML via
+                HTTP/HTTPS request.
+            validation (bool or geolink_formatter.parser.ValidationPolicy): Validation against the XSD for
+                this geoLink. Optional, defaults to the validation policy of the parser.
+
+        Returns:
+            geolink_formatter.diff.Snapshot: The snapshot of the geoLink.
+
+        Raises:
+            TypeError: Raised on invalid source type.
+            lxml.etree.XMLSyntaxError: Raised on failed validation.
+            requests.HTTPError: Raised on failed HTTP request.
+
+        """
+        return self.diff(None, source, validation=validation).snapshot
+
+    def diff(self, previous, source, validation=None):
+        """Compares a geoLink with a previous snapshot of it.
+
+        Args:
+            previous (geolink_formatter.diff.Snapshot): The previous snapshot or None to report all
+                documents as added. Snapshots created with another host URL, schema version or document
+                filter are ignored as well.
+            source (str or bytes): The geoLink source. Can be a XML string or an URL to load the XML via
+                HTTP/HTTPS request.
+            validation (bool or geolink_formatter.parser.ValidationPolicy): Validation against the XSD for
+                this geoLink. Optional, defaults to the validation policy of the parser.
+
+        Returns:
+            geolink_formatter.diff.Diff: The changes, containing the snapshot of the geoLink.
+
+        Raises:
+            TypeError: Raised on invalid source type.
+            lxml.etree.XMLSyntaxError: Raised on failed validation.
+            requests.HTTPError: Raised on failed HTTP request.
+            geolink_formatter.parser.LimitExceededError: Raised if the geoLink exceeds a configured limit.
+
+        """
+        xml, url = self._load(source)
+        if previous is not None and previous._key != self._key:
+            previous = None
+        digest = hashlib.sha256(xml if isinstance(xml, bytes) else xml.encode('utf-8')).hexdigest()
+        if previous is not None and previous.digest == digest:
+            return Diff(previous, list(), list(), list())
+
+        parser = self._parser
+        root, version = parser._parse(xml, validation=validation, source=url)
+        documents = DocumentList(version=version)
+        fingerprints = list()
+        fragments = list()
+        added = list()
+        changed = list()
+        for document_el, doc_id in parser._unique_documents(root, self._document_filter):
+            fingerprint = hashlib.sha1(tostring(document_el, with_tail=False)).digest()
+            i = None if previous is None else previous._find(doc_id, fingerprint)
+            if i is None:
+                document = parser._create_document(document_el, doc_id)
+                fragment = HTML.__format_document__(document)
+                if previous is not None and doc_id in previous._index:
+                    changed.append(document)
+                else:
+                    added.append(document)
+            else:
+                document = previous._documents[i]
+                fragment = previous._fragments[i]
+            documents.append(document)
+            fingerprints.append(fingerprint)
+            fragments.append(fragment)
+
+        snapshot = Snapshot(self._key, digest, documents, fingerprints, fragments)
+        removed = list() if previous is None else \
+            [document for document in previous.documents if document.id not in snapshot._index]
+        return Diff(snapshot, added, removed, changed)
@@ -7,8 +7,29 @@ class Msg(object):
     invalid_argument = 'Invalid argument "{arg}": expected "{expected}", got "{got}"'
     """str: Message for invalid argument type."""
 
+    limit_exceeded = 'Limit "{limit}" exceeded: the maximum is {maximum}'
+    """str: Message for input exceeding a configured limit."""
+
+    unexpected_status = 'Unexpected HTTP status {status} for URL "{url}": expected 200'
+    """str: Message for successful HTTP responses without geoLink content."""
+
+    invalid_field = 'Invalid field "{field}": expected one of "{expected}"'
+    """str: Message for unknown document field in a projection."""
+
+    incompatible_arguments = 'Arguments "{first}" and "{second}" cannot be combined'
+    """str: Message for arguments which cannot be used together."""
+
+    unsupported_schema = 'Unsupported schema construct: {construct}'
+    """str: Message for schema constructs not supported by the version detection."""
+
 
 class Document(object):
+
+    __slots__ = ('_files', '_id', '_category', '_doctype', '_federal_level', '_authority', '_authority_url',
+                 '_title', '_number', '_abbreviation', '_instance', '_type', '_subtype', '_decree_date',
+                 '_enactment_date', '_abrogation_date', '_cycle')
+    """tuple[str]: Instance attributes, stored in slots to reduce the memory footprint of documents."""
+
     def __init__(self, files, id=None, category=None, doctype=None, federal_level=None, authority=None,
                  authority_url=None, title=None, number=None, abbreviation=None, instance=None, type=None,
                  subtype=None, decree_date=None, enactment_date=None, abrogation_date=None, cycle=None):
@@ -172,6 +193,10 @@ class Document(object):
 
 
 class File(object):
+
+    __slots__ = ('_title', '_href', '_category', '_description')
+    """tuple[str]: Instance attributes, stored in slots to reduce the memory footprint of files."""
+
     def __init__(self, category=None, href=None, title=None, description=None):
         """Creates a new file instance.
 
@@ -207,3 +232,225 @@ class File(object):
     def description(self):
         """str: The file's description."""
         return self._description
+
+
+_unset = object()
+"""object: Marker for lazily evaluated attributes which have not been evaluated yet."""
+
+
+def _absolute_url(href, host_url):
+    """Resolves a relative file URL using the OEREBlex host URL.
+
+    Args:
+        href (str): The URL of the file, absolute or relative.
+        host_url (str): URL of the OEREBlex host or None.
+
+    Returns:
+        str: The absolute URL of the file, or the unchanged URL if no host URL is set.
+
+    """
+    if host_url and not href.startswith(u'http://') and not href.startswith(u'https://'):
+        href = u'{host}{href}'.format(host=host_url, href=href)
+    return href
+
+
+class LazyDocument(Document):
+
+    __slots__ = ('_element', '_parser')
+    """tuple[str]: Additional instance attributes of lazy documents."""
+
+    def __init__(self, element, id, parser):
+        """Creates a document reading its attributes from the underlying element when they are accessed.
+
+        Dates are converted and files are created on first access only.
+
+        Args:
+            element (lxml.etree._Element): The document element.
+            id (str): The document identifier.
+            parser (geolink_formatter.parser.XML): The parser which has parsed the element, used to convert
+                dates and create files.
+
+        """
+        self._element = element
+        self._parser = parser
+        self._id = id
+        self._files = None
+        self._decree_date = _unset
+        self._enactment_date = _unset
+        self._abrogation_date = _unset
+
+    def _date(self, name):
+        """Returns the converted date of the specified attribute.
+
+        Args:
+            name (str): The name of the date attribute.
+
+        Returns:
+            datetime.date: The converted date or None.
+
+        """
+        value = self._element.get(name)
+        return self._parser._parse_date(value) if value else None
+
+    @property
+    def files(self):
+        """list[geolink_formatter.entity.File]: The files contained by the document."""
+        if self._files is None:
+            self._files = self._parser._create_files(self._element, lazy=True)
+        return self._files
+
+    @property
+    def category(self):
+        """str: The document category."""
+        return self._element.get('category')
+
+    @property
+    def doctype(self):
+        """str: The internal type of the document."""
+        return self._element.get('doctype')
+
+    @property
+    def federal_level(self):
+        """str: The federal level of the document."""
+        return self._element.get('federal_level')
+
+    @property
+    def authority(self):
+        """str: The name of the authority responsible for the document."""
+        return self._element.get('authority')
+
+    @property
+    def authority_url(self):
+        """str: The URL of the authority's website."""
+        return self._element.get('authority_url')
+
+    @property
+    def title(self):
+        """str: The document title."""
+        return self._element.get('title')
+
+    @property
+    def number(self):
+        """str: The document number (since v1.1.0)."""
+        return self._element.get('number')
+
+    @property
+    def abbreviation(self):
+        """str: The document abbreviation (since v1.1.0)."""
+        return self._element.get('abbreviation')
+
+    @property
+    def instance(self):
+        """str: The document's instance."""
+        return self._element.get('instance')
+
+    @property
+    def type(self):
+        """str: The official type of the document."""
+        return self._element.get('type')
+
+    @property
+    def subtype(self):
+        """str: The subtype of the document."""
+        return self._element.get('subtype')
+
+    @property
+    def decree_date(self):
+        """datetime.date: The date of decree."""
+        if self._decree_date is _unset:
+            self._decree_date = self._date('decree_date')
+        return self._decree_date
+
+    @property
+    def enactment_date(self):
+        """datetime.date: The date of enactment."""
+        if self._enactment_date is _unset:
+            self._enactment_date = self._date('enactment_date')
+        return self._enactment_date
+
+    @property
+    def abrogation_date(self):
+        """datetime.date: The date of abrogation (since v1.1.0)."""
+        if self._abrogation_date is _unset:
+            self._abrogation_date = self._date('abrogation_date')
+        return self._abrogation_date
+
+    @property
+    def cycle(self):
+        """str: The document cycle (v1.0.0 only)."""
+        return self._element.get('cycle')
+
+    def materialize(self):
+        """Creates an independent document containing all attributes, which no longer references the
+        underlying element.
+
+        Returns:
+            geolink_formatter.entity.Document: The materialized document.
+
+        """
+        return Document(
+            files=[f.materialize() for f in self.files],
+            id=self.id,
+            category=self.category,
+            doctype=self.doctype,
+            federal_level=self.federal_level,
+            authority=self.authority,
+            authority_url=self.authority_url,
+            title=self.title,
+            number=self.number,
+            abbreviation=self.abbreviation,
+            instance=self.instance,
+            type=self.type,
+            subtype=self.subtype,
+            decree_date=self.decree_date,
+            enactment_date=self.enactment_date,
+            abrogation_date=self.abrogation_date,
+            cycle=self.cycle
+        )
+
+
+class LazyFile(File):
+
+    __slots__ = ('_element', '_host_url')
+    """tuple[str]: Additional instance attributes of lazy files."""
+
+    def __init__(self, element, host_url=None):
+        """Creates a file reading its attributes from the underlying element when they are accessed.
+
+        Args:
+            element (lxml.etree._Element): The file element.
+            host_url (str): URL of the OEREBlex host to resolve relative URLs.
+
+        """
+        self._element = element
+        self._host_url = host_url
+
+    @property
+    def title(self):
+        """str: The file's title."""
+        return self._element.get('title')
+
+    @property
+    def href(self):
+        """str: The URL to access the file."""
+        return _absolute_url(self._element.get('href'), self._host_url)
+
+    @property
+    def category(self):
+        """str: The file's category."""
+        return self._element.get('category')
+
+    @property
+    def description(self):
+        """str: The file's description."""
+        return self._element.get('description')
+
+    def materialize(self):
+        """Creates an independent file containing all attributes, which no longer references the
+        underlying element.
+
+        Returns:
+            geolink_formatter.entity.File: The materialized file.
+
+        """
+        return File(category=self.category, href=self.href, title=self.title, description=self.description)
@@ -1,25 +1,121 @@
 # -*- coding: utf-8 -*-
 
 
+_text_type = type(u'')
+
+
+def _text(value):
+    """Converts a value to text the same way :meth:`str.format` does.
+
+    Args:
+        value (object): The value to be converted.
+
+    Returns:
+        str: The value as text.
+
+    """
+    return value if type(value) is _text_type else u'{0}'.format(value)
+
+
 class HTML(object):
     def __init__(self):
         """Creates a new HTML formatter."""
         pass
 
     @classmethod
-    def format(cls, documents):
+    def format(cls, documents, document_filter=None):
         """Formats a list of :obj:`geolink_formatter.entity.Document` instances as HTML list.
 
         Args:
             documents (list[geolink_formatter.entity.Document]): The list of documents to be formatted.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents to be
+                formatted. Optional, defaults to all documents.
 
         Returns:
             str: An HTML formatted string containing the documents as HTML list.
 
         """
-        return u'<ul class="geolink-formatter">{documents}</ul>'.format(
-            documents=u''.join([cls.__format_document__(document) for document in documents])
-        )
+        return u''.join(cls.iter_format(documents, document_filter))
+
+    @classmethod
+    def iter_format(cls, documents, document_filter=None):
+        """Formats :obj:`geolink_formatter.entity.Document` instances as HTML list, yielding the HTML
+        fragment by fragment.
+
+        The documents are consumed lazily, so this can be chained with
+        :meth:`geolink_formatter.parser.XML.iter_documents` to start sending the output before the whole
+        geoLink has been parsed.
+
+        Args:
+            documents (iterable[geolink_formatter.entity.Document]): The documents to be formatted.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents to be
+                formatted. Optional, defaults to all documents.
+
+        Yields:
+            str: The HTML fragments, which joined together are equal to the result of :meth:`format`.
+
+        """
+        yield u'<ul class="geolink-formatter">'
+        for document in documents:
+            if document_filter is None or document_filter.matches(document):
+                yield cls.__format_document__(document)
+        yield u'</ul>'
+
+    @classmethod
+    def join(cls, fragments):
+        """Joins HTML list items of documents formatted before into the HTML list.
+
+        Args:
+            fragments (iterable[str]): The documents formatted by :meth:`__format_document__`.
+
+        Returns:
+            str: An HTML formatted string containing the documents as HTML list, equal to the result of
+            :meth:`format` for the same documents.
+
+        """
+        return u''.join(fragments).join((u'<ul class="geolink-formatter">', u'</ul>'))
+
+    @classmethod
+    def write_to(cls, documents, fileobj, encoding=None, document_filter=None):
+        """Formats :obj:`geolink_formatter.entity.Document` instances as HTML list and writes the HTML
+        fragment by fragment to the specified file-like object.
+
+        Args:
+            documents (iterable[geolink_formatter.entity.Document]): The documents to be formatted.
+            fileobj (file): The file-like object to write to, e.g. a streaming response body.
+            encoding (str): The encoding of the written fragments. Optional, if not set the fragments are
+                written as text.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents to be
+                formatted. Optional, defaults to all documents.
+
+        """
+        for fragment in cls.iter_format(documents, document_filter):
+            fileobj.write(fragment.encode(encoding) if encoding else fragment)
+
+    _date_strings = dict()
+    """dict: Already formatted dates, shared by all formatter instances."""
+
+    _date_strings_size = 4096
+    """int: Maximum number of entries in the cache of formatted dates."""
+
+    @classmethod
+    def __format_date__(cls, date):
+        """Formats a date as *DD.MM.YYYY*, enclosed in parentheses.
+
+        Args:
+            date (datetime.date): The date to be formatted.
+
+        Returns:
+            str: The formatted date.
+
+        """
+        formatted = cls._date_strings.get(date)
+        if formatted is None:
+            formatted = u'(' + date.strftime('%d.%m.%Y') + u')'
+            if len(cls._date_strings) >= cls._date_strings_size:
+                cls._date_strings.clear()
+            cls._date_strings[date] = formatted
+        return formatted
 
     @classmethod
     def __format_document__(cls, document):
@@ -32,33 +128,30 @@ class HTML(object):
             str: The document formatted as HTML list item.
 
         """
+        parts = [u'<li class="geolink-formatter-document">']
+        abrogated = bool(document.abrogation_date)
+        if abrogated:
+            parts.append(u'<strike>')
+        if document.type or document.subtype:
+            if document.type:
+                parts.append(_text(document.type))
+            if document.subtype:
+                parts.append(u' (')
+                parts.append(_text(document.subtype))
+                parts.append(u')')
+            parts.append(u': ')
+        parts.append(_text(document.title))
+        parts.append(u' ')
         if document.enactment_date:
-            enactment_date = u'({0})'.format(document.enactment_date.strftime('%d.%m.%Y'))
-        else:
-            enactment_date = u''
-        if document.abrogation_date:
-            files = u''
-            strike_start = u'<strike>'
-            strike_end = u'</strike>'
-            abrogation_date = u'({0})'.format(document.abrogation_date.strftime('%d.%m.%Y'))
+            parts.append(cls.__format_date__(document.enactment_date))
+        if abrogated:
+            parts.append(u'</strike> ')
+            parts.append(cls.__format_date__(document.abrogation_date))
         else:
-            files = cls.__format_files__(document.files)
-            strike_start = u''
-            strike_end = u''
-            abrogation_date = u''
-        subtype = u' ({0})'.format(document.subtype) if document.subtype else u''
-        return u'<li class="geolink-formatter-document">' \
-               u'{strike_start}{type}{title} {enactment_date}{strike_end} {abrogation_date}{files}' \
-               u'</li>'.format(
-                   type=u'{0}{1}: '.format(document.type or u'', subtype)
-                   if document.type or document.subtype else u'',
-                   title=document.title,
-                   enactment_date=enactment_date,
-                   files=files,
-                   strike_start=strike_start,
-                   strike_end=strike_end,
-                   abrogation_date=abrogation_date
-               )
+            parts.append(u' ')
+            cls.__append_files__(parts, document.files)
+        parts.append(u'</li>')
+        return u''.join(parts)
 
     @classmethod
     def __format_files__(cls, files):
@@ -70,12 +163,25 @@ class HTML(object):
         Returns:
             str: The files formatted as HTML list.
 
+        """
+        parts = list()
+        cls.__append_files__(parts, files)
+        return u''.join(parts)
+
+    @classmethod
+    def __append_files__(cls, parts, files):
+        """Appends the HTML list of :obj:`geolink_formatter.entity.File` instances to a list of fragments.
+
+        Args:
+            parts (list[str]): The list of HTML fragments to be extended.
+            files (list[geolink_formatter.entity.File]): The list of files to be formatted.
+
         """
         if len(files) > 0:
-            return u'<ul class="geolink-formatter">{files}</ul>'.format(
-                files=u''.join([cls.__format_file__(file) for file in files])
-            )
-        return u''
+            parts.append(u'<ul class="geolink-formatter">')
+            for file in files:
+                cls.__append_file__(parts, file)
+            parts.append(u'</ul>')
 
     @classmethod
     def __format_file__(cls, file):
@@ -91,11 +197,22 @@ class HTML(object):
             str: The file formatted as HTML list item.
 
         """
-        title = file.description
-        if not title:
-            title = file.title
-
-        return u'<li class="geolink-formatter-file"><a href="{href}" target="_blank">{title}</a></li>'.format(
-            title=title,
-            href=file.href
-        )
+        parts = list()
+        cls.__append_file__(parts, file)
+        return u''.join(parts)
+
+    @classmethod
+    def __append_file__(cls, parts, file):
+        """Appends the HTML list item of a :obj:`geolink_formatter.entity.File` instance to a list of
+        fragments.
+
+        Args:
+            parts (list[str]): The list of HTML fragments to be extended.
+            file (geolink_formatter.entity.File): The file to be formatted.
+
+        """
+        parts.append(u'<li class="geolink-formatter-file"><a href="')
+        parts.append(_text(file.href))
+        parts.append(u'" target="_blank">')
+        parts.append(_text(file.description or file.title))
+        parts.append(u'</a></li>')
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+import socket
+import threading
+import time
+
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+
+class METRIC(object):
+
+    FETCH = 'fetch'
+    """str: Duration of loading a geoLink via HTTP/HTTPS request."""
+
+    PARSE = 'parse'
+    """str: Duration of parsing the geoLink XML."""
+
+    VALIDATE = 'validate'
+    """str: Duration of the validation against XSD and DTD."""
+
+    ENTITIES = 'entities'
+    """str: Duration of creating the documents and files."""
+
+    FORMAT = 'format'
+    """str: Duration of formatting the documents as HTML."""
+
+    STAGES = (FETCH, PARSE, VALIDATE, ENTITIES, FORMAT)
+    """tuple[str]: All stages with timings."""
+
+    BYTES = 'bytes'
+    """str: Number of parsed bytes (characters for text input)."""
+
+    DOCUMENTS = 'documents'
+    """str: Number of created documents."""
+
+    FILES = 'files'
+    """str: Number of created files."""
+
+    CACHE_HIT = 'cache.hit'
+    """str: Number of geoLinks served by a fresh entry of the document cache."""
+
+    CACHE_MISS = 'cache.miss'
+    """str: Number of geoLinks loaded without usable entry in the document cache."""
+
+    CACHE_REVALIDATION = 'cache.revalidation'
+    """str: Number of geoLinks served by an expired entry of the document cache confirmed to be unchanged."""
+
+    HTML_CACHE_HIT = 'html_cache.hit'
+    """str: Number of geoLinks served by the HTML cache."""
+
+    HTML_CACHE_MISS = 'html_cache.miss'
+    """str: Number of geoLinks rendered without usable entry in the HTML cache."""
+
+
+class MetricsSink(object):
+    """Receiver of the metrics of parsers and formatters, ignoring all metrics.
+
+    Subclasses have to be thread-safe, as parsers and formatters may be used by multiple threads. Timings are
+    reported per stage (see :attr:`METRIC.STAGES`), counters by the names defined in :class:`METRIC`.
+
+    """
+
+    def timing(self, stage, seconds):
+        """Receives the duration of a processing stage.
+
+        Args:
+            stage (str): The name of the stage, e.g. :attr:`METRIC.PARSE`.
+            seconds (float): The duration in seconds.
+
+        """
+        pass
+
+    def increment(self, name, value=1):
+        """Receives an increment of a counter.
+
+        Args:
+            name (str): The name of the counter, e.g. :attr:`METRIC.DOCUMENTS`.
+            value (int): The increment. Defaults to 1.
+
+        """
+        pass
+
+
+class MemorySink(MetricsSink):
+    def __init__(self):
+        """Creates a thread-safe sink aggregating the metrics in memory, e.g. for logging or tests."""
+        self._lock = threading.Lock()
+        self._timings = dict()
+        self._counters = dict()
+
+    @property
+    def timings(self):
+        """dict: The number of timings and their total duration in seconds by stage, as tuple."""
+        with self._lock:
+            return dict(self._timings)
+
+    @property
+    def counters(self):
+        """dict: The value of each counter by name."""
+        with self._lock:
+            return dict(self._counters)
+
+    def timing(self, stage, seconds):
+        with self._lock:
+            count, total = self._timings.get(stage, (0, 0.0))
+            self._timings[stage] = (count + 1, total + seconds)
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def clear(self):
+        """Removes all metrics."""
+        with self._lock:
+            self._timings.clear()
+            self._counters.clear()
+
+
+class StatsdSink(MetricsSink):
+    def __init__(self, host='127.0.0.1', port=8125, prefix='geolink_formatter'):
+        """Creates a sink sending the metrics to a StatsD collector via UDP.
+
+        Timings are sent in milliseconds as `<prefix>.<stage>:<ms>|ms`, counters as
+        `<prefix>.<name>:<value>|c`. Collectors like the Prometheus StatsD exporter can map them to their own
+        metrics. Sending is fire-and-forget, errors are ignored.
+
+        Args:
+            host (str): The host of the collector. Defaults to `127.0.0.1`.
+            port (int): The UDP port of the collector. Defaults to 8125.
+            prefix (str): The prefix of the metric names. Defaults to `geolink_formatter`.
+
+        """
+        self._address = (host, port)
+        self._prefix = prefix
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def _send(self, line):
+        """Sends a single metric to the collector.
+
+        Args:
+            line (str): The metric in StatsD line format, without prefix.
+
+        """
+        try:
+            self._socket.sendto('{0}.{1}'.format(self._prefix, line).encode('utf-8'), self._address)
+        except (IOError, OSError):
+            pass
+
+    def timing(self, stage, seconds):
+        self._send('{0}:{1:.3f}|ms'.format(stage, seconds * 1000))
+
+    def increment(self, name, value=1):
+        self._send('{0}:{1}|c'.format(name, value))
+
+    def close(self):
+        """Closes the UDP socket."""
+        self._socket.close()
@@ -1,11 +1,30 @@
 # -*- coding: utf-8 -*-
 import datetime
+import hashlib
+import os
+import random
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from itertools import islice
 
-import pkg_resources
-import requests
-from lxml.etree import XMLSchema, DTD, DocumentInvalid
-from defusedxml.lxml import fromstring
-from geolink_formatter.entity import Document, File
+try:
+    from collections.abc import Sequence
+except ImportError:  # pragma: no cover
+    from collections import Sequence
+
+from lxml.etree import XMLSchema, XMLParser, DTD, DocumentInvalid, ElementDefaultClassLookup, \
+    iterparse
+from defusedxml.lxml import RestrictedElement, check_docinfo, fromstring, parse
+from geolink_formatter._specs import SPECS
+from geolink_formatter.cache import CacheEntry
+from geolink_formatter.entity import Document, File, LazyDocument, LazyFile, Msg, _absolute_url
+from geolink_formatter.metrics import METRIC, _clock
+from geolink_formatter.version import VersionDetector
+
+
+_schema_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schema')
+"""str: Directory containing the geoLink schema files."""
 
 
 class SCHEMA(object):
@@ -23,153 +42,1421 @@ class SCHEMA(object):
     V1_2_0 = '1.2.0'
     """str: geoLink schema version 1.2.0"""
 
+    ALL = (V1_0_0, V1_1_0, V1_1_1, V1_2_0)
+    """tuple[str]: All available geoLink schema versions"""
+
+    AUTO = 'auto'
+    """str: Detect the narrowest schema version accepting each geoLink, see :data:`version_detector`"""
+
+
+class SchemaRegistry(object):
+    def __init__(self):
+        """Creates a new registry for compiled geoLink schemas.
+
+        Each schema version is compiled on first use and shared afterwards. The registry is thread-safe, so
+        a single instance can be used by all parsers of a process.
+
+        """
+        self._schemas = dict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self):
+        """int: Number of schema requests served by an already compiled schema."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """int: Number of schema requests which needed the schema to be compiled."""
+        return self._misses
+
+    def get(self, version):
+        """Returns the compiled schema of the specified version, compiling it on first use.
+
+        Args:
+            version (str): The version of the geoLink schema.
+
+        Returns:
+            lxml.etree.XMLSchema: The compiled geoLink schema.
+
+        Raises:
+            IOError: Raised if no schema exists for the specified version.
+
+        """
+        with self._lock:
+            schema = self._schemas.get(version)
+            if schema is None:
+                self._misses += 1
+                schema = self._compile(version)
+                self._schemas[version] = schema
+            else:
+                self._hits += 1
+            return schema
+
+    def warm_up(self, versions=None):
+        """Compiles the specified schema versions in advance, e.g. before forking worker processes.
+
+        Args:
+            versions (list[str]): The schema versions to be compiled. Defaults to all available versions.
+
+        """
+        for version in versions or SCHEMA.ALL:
+            self.get(version)
+
+    def clear(self):
+        """Removes all compiled schemas and resets the counters."""
+        with self._lock:
+            self._schemas.clear()
+            self._hits = 0
+            self._misses = 0
+
+    @staticmethod
+    def _compile(version):
+        """Reads and compiles the geoLink schema of the specified version.
+
+        Args:
+            version (str): The version of the geoLink schema.
+
+        Returns:
+            lxml.etree.XMLSchema: The compiled geoLink schema.
+
+        """
+        xsd = os.path.join(_schema_directory, 'v{0}.xsd'.format(version))
+        with open(xsd) as f:
+            return XMLSchema(fromstring(f.read()))
+
+
+schema_registry = SchemaRegistry()
+"""geolink_formatter.parser.SchemaRegistry: Registry of compiled schemas shared by all parsers."""
+
+
+version_detector = VersionDetector(SPECS, SCHEMA.ALL)
+"""geolink_formatter.version.VersionDetector: Detector of the schema version used by parsers with version
+:attr:`SCHEMA.AUTO`. As v1.1.1 does not add anything to v1.1.0, geoLinks of both versions are detected as
+v1.1.0."""
+
+
+def create_session(pool_size=10, keep_alive=True, max_retries=0, backoff_factor=0.0,
+                   status_forcelist=(502, 503, 504)):
+    """Creates a HTTP session with connection pooling to load geoLinks.
+
+    Args:
+        pool_size (int): The maximum number of connections kept open per host. Defaults to 10.
+        keep_alive (bool): Enable/disable reusing connections for multiple requests. Optional, defaults to
+            True.
+        max_retries (int): The maximum number of retries for failed requests. Defaults to 0.
+        backoff_factor (float): The factor to calculate the delay between retries, see
+            :class:`urllib3.util.retry.Retry`. Defaults to 0.
+        status_forcelist (tuple[int]): The HTTP status codes to be retried. Defaults to 502, 503 and 504.
+
+    Returns:
+        requests.Session: The configured session.
+
+    """
+    # Imported on first use only, as loading requests takes longer than the rest of the package
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    return session
+
+
+class ValidationPolicy(object):
+    def __init__(self):
+        """Policy deciding whether a geoLink gets validated against the XSD. The base policy validates
+        every geoLink.
+
+        """
+        self._lock = threading.Lock()
+        self._validated = 0
+        self._skipped = 0
+
+    @property
+    def validated(self):
+        """int: Number of geoLinks the policy decided to validate."""
+        return self._validated
+
+    @property
+    def skipped(self):
+        """int: Number of geoLinks the policy decided not to validate."""
+        return self._skipped
+
+    def should_validate(self, xml, source=None):
+        """Decides whether the specified geoLink has to be validated and updates the statistics.
+
+        Args:
+            xml (str or bytes or bytearray or memoryview or file): The XML to be parsed. None if the XML is
+                not available in advance, e.g. for :meth:`geolink_formatter.parser.XML.iter_documents`.
+            source (str): The URL the XML has been loaded from. None for XML passed directly.
+
+        Returns:
+            bool: True if the geoLink has to be validated, False otherwise.
+
+        """
+        decision = self._decide(xml, source)
+        with self._lock:
+            if decision:
+                self._validated += 1
+            else:
+                self._skipped += 1
+        return decision
+
+    def _decide(self, xml, source):
+        """Decides whether the specified geoLink has to be validated.
+
+        Args:
+            xml (str or bytes or bytearray or memoryview or file): The XML to be parsed or None.
+            source (str): The URL the XML has been loaded from or None.
+
+        Returns:
+            bool: True if the geoLink has to be validated, False otherwise.
+
+        """
+        return True
+
+    def confirm(self, xml, source=None):
+        """Notifies the policy about a geoLink which has been validated successfully.
+
+        Args:
+            xml (str or bytes or bytearray or memoryview or file): The validated XML or None.
+            source (str): The URL the XML has been loaded from or None.
+
+        """
+        pass
+
+
+class NeverValidate(ValidationPolicy):
+    """Policy skipping the validation of all geoLinks."""
+
+    def _decide(self, xml, source):
+        return False
+
+
+class SampledValidation(ValidationPolicy):
+    def __init__(self, rate, seed=None):
+        """Creates a policy validating a random sample of the geoLinks.
+
+        Args:
+            rate (float): The share of geoLinks to be validated, between 0 and 1.
+            seed (int): Seed for the random number generator. Optional, defaults to a random seed.
+
+        """
+        super(SampledValidation, self).__init__()
+        self._rate = rate
+        self._random = random.Random(seed)
+
+    @property
+    def rate(self):
+        """float: The share of geoLinks to be validated."""
+        return self._rate
+
+    def _decide(self, xml, source):
+        return self._random.random() < self._rate
+
+
+class FirstSightValidation(ValidationPolicy):
+    def __init__(self, max_entries=1024):
+        """Creates a policy validating each distinct geoLink only until it has passed validation once.
+
+        geoLinks are identified by the SHA-256 digest of their content. XML which is not available in
+        advance, e.g. when parsing streams, is always validated.
+
+        Args:
+            max_entries (int): The maximum number of remembered digests. Defaults to 1024.
+
+        """
+        super(FirstSightValidation, self).__init__()
+        self._max_entries = max_entries
+        self._digests = OrderedDict()
+
+    @staticmethod
+    def _digest(xml):
+        """Returns the digest of the specified XML.
+
+        Args:
+            xml (str or bytes or bytearray or memoryview or file): The XML.
+
+        Returns:
+            str: The digest of the XML, or None if the XML is not available in advance.
+
+        """
+        if xml is None or hasattr(xml, 'read'):
+            return None
+        if not isinstance(xml, (bytes, bytearray, memoryview)):
+            xml = xml.encode('utf-8')
+        return hashlib.sha256(xml).hexdigest()
+
+    def _decide(self, xml, source):
+        digest = self._digest(xml)
+        if digest is None:
+            return True
+        with self._lock:
+            if digest in self._digests:
+                self._digests[digest] = self._digests.pop(digest)
+                return False
+        return True
+
+    def confirm(self, xml, source=None):
+        digest = self._digest(xml)
+        if digest is not None:
+            with self._lock:
+                self._digests.pop(digest, None)
+                self._digests[digest] = True
+                while len(self._digests) > self._max_entries:
+                    self._digests.popitem(last=False)
+
+
+class TrustedSourceValidation(ValidationPolicy):
+    def __init__(self, trusted_urls, trusted_policy=None, default_policy=None):
+        """Creates a policy applying a separate policy to geoLinks loaded from trusted sources.
+
+        Args:
+            trusted_urls (list[str]): URL prefixes of the trusted sources, e.g.
+                `https://oereblex.example.com/api/`.
+            trusted_policy (geolink_formatter.parser.ValidationPolicy): The policy for geoLinks from trusted
+                sources. Defaults to :class:`NeverValidate`.
+            default_policy (geolink_formatter.parser.ValidationPolicy): The policy for all other geoLinks,
+                including XML passed directly. Defaults to :class:`ValidationPolicy`, validating all
+                geoLinks.
+
+        """
+        super(TrustedSourceValidation, self).__init__()
+        self._trusted_urls = tuple(trusted_urls)
+        self._trusted_policy = trusted_policy or NeverValidate()
+        self._default_policy = default_policy or ValidationPolicy()
+
+    def _policy(self, source):
+        """Returns the policy for the specified source.
+
+        Args:
+            source (str): The URL the XML has been loaded from or None.
+
+        Returns:
+            geolink_formatter.parser.ValidationPolicy: The policy to be applied.
+
+        """
+        if isinstance(source, bytes):
+            source = source.decode('utf-8')
+        if source and source.startswith(self._trusted_urls):
+            return self._trusted_policy
+        return self._default_policy
+
+    def _decide(self, xml, source):
+        return self._policy(source).should_validate(xml, source)
+
+    def confirm(self, xml, source=None):
+        self._policy(source).confirm(xml, source)
+
+
+class LimitExceededError(ValueError):
+    def __init__(self, limit, maximum):
+        """Error raised if the input exceeds one of the limits configured for the parser.
+
+        Args:
+            limit (str): The name of the exceeded limit, e.g. `max_bytes`.
+            maximum (int): The configured maximum.
+
+        """
+        super(LimitExceededError, self).__init__(limit, maximum)
+        self.limit = limit
+        self.maximum = maximum
+
+    def __str__(self):
+        return Msg.limit_exceeded.format(limit=self.limit, maximum=self.maximum)
+
+
+class _LimitedReader(object):
+    def __init__(self, fileobj, max_bytes=None):
+        """File-like wrapper counting the read bytes and raising an error as soon as more than the allowed
+        number of bytes is read.
+
+        Args:
+            fileobj (file): The wrapped file-like object.
+            max_bytes (int): The maximum number of bytes to be read. Optional, defaults to no limit.
+
+        """
+        self._fileobj = fileobj
+        self._max_bytes = max_bytes
+        self._size = 0
+
+    def read(self, size=-1):
+        """Reads from the wrapped file-like object.
+
+        Args:
+            size (int): The maximum number of bytes to be read. Defaults to all remaining bytes.
+
+        Returns:
+            bytes: The read data.
+
+        Raises:
+            geolink_formatter.parser.LimitExceededError: Raised if the limit has been exceeded.
+
+        """
+        data = self._fileobj.read() if size is None or size < 0 else self._fileobj.read(size)
+        self._size += len(data)
+        if self._max_bytes is not None and self._size > self._max_bytes:
+            raise LimitExceededError('max_bytes', self._max_bytes)
+        return data
+
+
+class _ParserTLS(threading.local):
+    """Thread local lxml parsers for special cases not covered by the default parser of defusedxml."""
+
+    def __init__(self):
+        self.utf8 = XMLParser(resolve_entities=False, encoding='utf-8')
+        """lxml.etree.XMLParser: Parser ignoring declared encodings, with the settings of defusedxml."""
+        self.utf8.set_element_class_lookup(ElementDefaultClassLookup(element=RestrictedElement))
+
+
+_parsers = _ParserTLS()
+
+
+def _map_parallel(func, items, max_workers):
+    """Applies the specified function to all items on a bounded thread pool, collecting raised errors.
+
+    Args:
+        func (callable): The function to be applied to each item.
+        items (list): The items to be processed.
+        max_workers (int): The maximum number of threads.
+
+    Returns:
+        list: The results in the order of the items. For failed items, the raised exception is returned
+        instead of the result.
+
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, item) for item in items]
+    return [future.exception() or future.result() for future in futures]
+
+
+class DocumentFilter(object):
+
+    criteria = ('doctype', 'category', 'federal_level')
+    """tuple[str]: The document attributes which can be filtered by value."""
+
+    def __init__(self, doctype=None, category=None, federal_level=None, abrogated=None):
+        """Creates a filter selecting documents by their attributes.
+
+        The parser evaluates the filter on the attributes of the document elements, so rejected documents
+        are skipped before any entities are created. As for unfiltered geoLinks, only the first document
+        with a specific identifier is considered, so a duplicate is never accepted in place of a rejected
+        document. Criteria which are not set accept all documents.
+
+        Args:
+            doctype (str or list[str]): The accepted internal document types, e.g. `decree`.
+            category (str or list[str]): The accepted document categories, e.g. `main`.
+            federal_level (str or list[str]): The accepted federal levels, e.g. `Gemeinde`.
+            abrogated (bool): True to accept abrogated documents only, False to accept documents without
+                abrogation date only.
+
+        """
+        self._values = dict()
+        for name, value in zip(self.criteria, (doctype, category, federal_level)):
+            if value is not None:
+                self._values[name] = (value,) if isinstance(value, (str, type(u''))) else tuple(value)
+        self._abrogated = abrogated
+
+    @property
+    def key(self):
+        """str: A string identifying the criteria of the filter, e.g. for cache keys."""
+        parts = ['{0}={1}'.format(name, ','.join(self._values[name])) for name in self.criteria
+                 if name in self._values]
+        if self._abrogated is not None:
+            parts.append('abrogated={0}'.format(self._abrogated))
+        return u';'.join(parts)
+
+    def accepts(self, get):
+        """Checks whether a document is accepted, using a function to read its attributes.
+
+        Args:
+            get (callable): Function returning the value of the attribute with the specified name.
+
+        Returns:
+            bool: True if the document is accepted, False otherwise.
+
+        """
+        for name, values in self._values.items():
+            if get(name) not in values:
+                return False
+        if self._abrogated is not None and bool(get('abrogation_date')) != self._abrogated:
+            return False
+        return True
+
+    def matches(self, document):
+        """Checks whether a document instance is accepted.
+
+        Args:
+            document (geolink_formatter.entity.Document): The document to be checked.
+
+        Returns:
+            bool: True if the document is accepted, False otherwise.
+
+        """
+        return self.accepts(lambda name: getattr(document, name))
+
+
+class DocumentList(list):
+    def __init__(self, documents=(), version=None):
+        """List of the documents of a parsed geoLink, reporting the schema version used for parsing.
+
+        Args:
+            documents (list[geolink_formatter.entity.Document]): The documents.
+            version (str): The geoLink schema version, detected for parsers with version
+                :attr:`SCHEMA.AUTO`.
+
+        """
+        super(DocumentList, self).__init__(documents)
+        self.version = version
+
+    def __reduce__(self):
+        return self.__class__, (list(self), self.version)
+
+
+class DocumentView(Sequence):
+    def __init__(self, parser, elements, version=None):
+        """Read-only sequence of the documents of a parsed geoLink, created on first access.
+
+        The documents are :class:`geolink_formatter.entity.LazyDocument` instances reading their attributes
+        from the underlying elements, which are kept alive as long as the view or one of its documents
+        exists.
+
+        Args:
+            parser (geolink_formatter.parser.XML): The parser which has parsed the geoLink.
+            elements (list[tuple[lxml.etree._Element, str]]): The unique document elements and their
+                identifiers.
+            version (str): The geoLink schema version used for parsing.
+
+        """
+        self._parser = parser
+        self._elements = elements
+        self._documents = [None] * len(elements)
+        self._version = version
+
+    @property
+    def version(self):
+        """str: The geoLink schema version used for parsing, detected for parsers with version
+        :attr:`SCHEMA.AUTO`."""
+        return self._version
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        document = self._documents[index]
+        if document is None:
+            element, doc_id = self._elements[index]
+            document = LazyDocument(element, doc_id, self._parser)
+            self._documents[index] = document
+        return document
+
+    def materialize(self):
+        """Creates all documents with all attributes, independent of the underlying elements.
+
+        Returns:
+            geolink_formatter.parser.DocumentList: A list containing the parsed document elements, equal to
+            the result of :meth:`geolink_formatter.parser.XML.from_string` without `lazy`.
+
+        Raises:
+            geolink_formatter.parser.LimitExceededError: Raised if a document has too many files.
+
+        """
+        return DocumentList([document.materialize() for document in self], self._version)
+
 
 class XML(object):
 
+    document_fields = ('files', 'category', 'doctype', 'federal_level', 'authority', 'authority_url', 'title',
+                       'number', 'abbreviation', 'instance', 'type', 'subtype', 'decree_date',
+                       'enactment_date', 'abrogation_date', 'cycle')
+    """tuple[str]: The document fields which can be selected in projections. The identifier is always set."""
+
+    _date_fields = frozenset(('decree_date', 'enactment_date', 'abrogation_date'))
+    """frozenset[str]: The document fields containing dates."""
+
     _date_format = '%Y-%m-%d'
     """str: Format of date values in XML."""
 
-    def __init__(self, host_url=None, version='1.2.0', dtd_validation=False, xsd_validation=True):
+    _date_cache = dict()
+    """dict: Already parsed date values, shared by all parser instances."""
+
+    _date_cache_size = 4096
+    """int: Maximum number of entries in the date cache."""
+
+    def __init__(self, host_url=None, version='1.2.0', dtd_validation=False, xsd_validation=True,
+                 session=None, cache=None, max_bytes=None, max_documents=None, max_files=None, metrics=None):
         """Create a new XML parser instance containing the geoLink XSD for validation.
 
+        The compiled XSD is taken from :attr:`geolink_formatter.parser.schema_registry`, so the schema of a
+        specific version is compiled only once per process. With version :attr:`SCHEMA.AUTO`, the schema
+        version is detected for each parsed geoLink before validation and reported as `version` of the
+        result.
+
         Args:
             host_url (str): URL of the OEREBlex host to resolve relative URLs. The complete URL until but
                 without the */api* part has to be set, starting with *http://* or *https://*.
-            version (str): The version of the geoLink schema to be used. Defaults to `1.2.0`.
+            version (str): The version of the geoLink schema to be used or :attr:`SCHEMA.AUTO`. Defaults
+                to `1.2.0`.
             dtd_validation (bool): Enable/disable validation of document type definition (DTD).
                 Optional, defaults to False.
-            xsd_validation (bool): Enable/disable validation against XML schema (XSD).
-                Optional, defaults to True.
+            xsd_validation (bool or geolink_formatter.parser.ValidationPolicy): Enable/disable validation
+                against XML schema (XSD), or a policy deciding per geoLink. Optional, defaults to True.
+            session (requests.Session): The HTTP session used to load geoLinks. Optional, if not set, a
+                session created by :func:`geolink_formatter.parser.create_session` is used and closed
+                together with the parser.
+            cache (geolink_formatter.cache.Cache): Cache for the documents loaded by :meth:`from_url`.
+                Optional, defaults to no caching.
+            max_bytes (int): Maximum size of the XML in bytes (characters for text input), enforced
+                while downloading. Optional, defaults to no limit.
+            max_documents (int): Maximum number of documents, checked before validation. Optional,
+                defaults to no limit.
+            max_files (int): Maximum number of files per document. Optional, defaults to no limit.
+            metrics (geolink_formatter.metrics.MetricsSink): Sink receiving the durations of fetching,
+                parsing, validation and entity creation, the parsed bytes, the number of documents and files
+                and the cache outcomes. Optional, defaults to no instrumentation. :meth:`iter_documents`
+                validates while parsing, so its validation is included in the parse duration.
+
+        Exceeding a limit raises a :class:`geolink_formatter.parser.LimitExceededError`.
 
         """
         self._host_url = host_url
         self._version = version
         self._dtd_validation = dtd_validation
-        self._xsd_validation = xsd_validation
-        xsd = pkg_resources.resource_filename('geolink_formatter', 'schema/v{0}.xsd'.format(version))
-        with open(xsd) as f:
-            self._schema = XMLSchema(fromstring(f.read()))
+        self._xsd_validation = self._validation_policy(xsd_validation)
+        self._validator = None if version == SCHEMA.AUTO else schema_registry.get(version)
+        self._session = session
+        self._session_lock = threading.Lock()
+        self._owns_session = session is None
+        self._cache = cache
+        self._max_bytes = max_bytes
+        self._max_documents = max_documents
+        self._max_files = max_files
+        self._metrics = metrics
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     @property
     def host_url(self):
         """str: The OEREBlex host URL to resolve relative URLs."""
         return self._host_url
 
-    def _parse_xml(self, xml):
-        """Parses the specified XML string and validates it against the geoLink XSD.
+    @property
+    def xsd_validation(self):
+        """geolink_formatter.parser.ValidationPolicy: The policy for validation against the XSD."""
+        return self._xsd_validation
+
+    @staticmethod
+    def _validation_policy(validation):
+        """Converts a validation flag into a validation policy.
+
+        Args:
+            validation (bool or geolink_formatter.parser.ValidationPolicy): The validation flag or policy.
+
+        Returns:
+            geolink_formatter.parser.ValidationPolicy: The validation policy.
+
+        """
+        if isinstance(validation, ValidationPolicy):
+            return validation
+        return ValidationPolicy() if validation else NeverValidate()
+
+    @property
+    def version(self):
+        """str: The version of the geoLink schema or :attr:`SCHEMA.AUTO`."""
+        return self._version
+
+    @property
+    def _schema(self):
+        """lxml.etree.XMLSchema: The compiled geoLink schema, compiled on first use. Parsers with version
+        :attr:`SCHEMA.AUTO` use the newest version, which accepts the geoLinks of all versions."""
+        return schema_registry.get(SCHEMA.ALL[-1] if self._version == SCHEMA.AUTO else self._version)
+
+    @property
+    def metrics(self):
+        """geolink_formatter.metrics.MetricsSink: The sink receiving the metrics of the parser."""
+        return self._metrics
+
+    @property
+    def cache(self):
+        """geolink_formatter.cache.Cache: The cache for the documents loaded by :meth:`from_url`."""
+        return self._cache
+
+    @property
+    def session(self):
+        """requests.Session: The HTTP session used to load geoLinks, created on first use. Threads
+        accessing it concurrently share the same session."""
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = create_session()
+                session = self._session
+        return session
+
+    def close(self):
+        """Closes the HTTP session, if it has been created by the parser."""
+        with self._session_lock:
+            if self._owns_session and self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _parse_xml(self, xml, validation=None, source=None):
+        """Parses the specified XML string and validates it against the geoLink XSD, see :meth:`_parse`.
 
         Args:
-            xml (str or bytes): The XML to be parsed.
+            xml (str or bytes or bytearray or memoryview or file): The XML to be parsed.
+            validation (bool or geolink_formatter.parser.ValidationPolicy): Validation against the XSD for
+                this geoLink. Optional, defaults to the validation policy of the parser.
+            source (str): The URL the XML has been loaded from. Optional, defaults to None.
 
         Returns:
             lxml.etree._Element: The root element of the parsed geoLink XML.
 
+        """
+        return self._parse(xml, validation=validation, source=source)[0]
+
+    def _parse(self, xml, validation=None, source=None):
+        """Parses the specified XML string and validates it against the geoLink XSD.
+
+        Bytes and file-like objects are passed to lxml without copying. Other binary buffers are copied to
+        bytes once, as lxml before version 6 only accepts bytes. Text is parsed directly, unless it contains
+        an encoding declaration, in which case it is encoded as UTF-8 and the declared encoding is ignored.
+        Parsers with version :attr:`SCHEMA.AUTO` detect the schema version on the parsed XML, so it is parsed
+        only once.
+
+        Args:
+            xml (str or bytes or bytearray or memoryview or file): The XML to be parsed.
+            validation (bool or geolink_formatter.parser.ValidationPolicy): Validation against the XSD for
+                this geoLink. Optional, defaults to the validation policy of the parser.
+            source (str): The URL the XML has been loaded from. Optional, defaults to None.
+
+        Returns:
+            tuple[lxml.etree._Element, str]: The root element of the parsed geoLink XML and the schema
+            version.
+
         Raises:
             lxml.etree.XMLSyntaxError: Raised on failed validation.
+            geolink_formatter.parser.LimitExceededError: Raised if the XML exceeds a configured limit.
 
         """
-        if isinstance(xml, bytes):
-            content = fromstring(xml)
+        metrics = self._metrics
+        if metrics is not None:
+            start = _clock()
+        if hasattr(xml, 'read'):
+            if self._max_bytes is not None or metrics is not None:
+                xml = _LimitedReader(xml, self._max_bytes)
+            content = parse(xml).getroot()
+            if metrics is not None:
+                metrics.increment(METRIC.BYTES, xml._size)
         else:
-            content = fromstring(xml.encode('utf-16be'))
-        if self._xsd_validation:
-            self._schema.assertValid(content)
+            size = xml.nbytes if isinstance(xml, memoryview) else len(xml)
+            if self._max_bytes is not None and size > self._max_bytes:
+                raise LimitExceededError('max_bytes', self._max_bytes)
+            if metrics is not None:
+                metrics.increment(METRIC.BYTES, size)
+            if isinstance(xml, bytes):
+                content = fromstring(xml)
+            elif isinstance(xml, (bytearray, memoryview)):
+                content = fromstring(xml.tobytes() if isinstance(xml, memoryview) else bytes(xml))
+            else:
+                try:
+                    content = fromstring(xml)
+                except ValueError:
+                    # lxml does not accept text with encoding declaration
+                    content = fromstring(xml.encode('utf-8'), parser=_parsers.utf8)
+        if self._max_documents is not None and \
+                next(islice(content.iter('document'), self._max_documents, None), None) is not None:
+            raise LimitExceededError('max_documents', self._max_documents)
+        if metrics is not None:
+            now = _clock()
+            metrics.timing(METRIC.PARSE, now - start)
+            start = now
+        version = self._version
+        validator = self._validator
+        if validator is None:
+            version = version_detector.detect(content)
+            validator = schema_registry.get(version)
+        policy = self._xsd_validation if validation is None else self._validation_policy(validation)
+        if policy.should_validate(xml, source):
+            validator.assertValid(content)
+            policy.confirm(xml, source)
         if self._dtd_validation:
             dtd = content.getroottree().docinfo.internalDTD
             if isinstance(dtd, DTD):
                 dtd.assertValid(content)
             else:
                 raise DocumentInvalid('Missing DTD in parsed content')
-        return content
+        if metrics is not None:
+            metrics.timing(METRIC.VALIDATE, _clock() - start)
+        return content, version
+
+    @classmethod
+    def _parse_date(cls, value):
+        """Parses a date value of the XML.
 
-    def from_string(self, xml):
+        Dates in the canonical form *YYYY-MM-DD* are converted directly and memoized. Any other value is
+        passed to :func:`datetime.datetime.strptime`, so the accepted values and the raised errors are the
+        same as for parsing with :attr:`_date_format`.
+
+        Args:
+            value (str): The date value.
+
+        Returns:
+            datetime.date: The parsed date.
+
+        Raises:
+            ValueError: Raised on invalid date value.
+
+        """
+        date = cls._date_cache.get(value)
+        if date is None:
+            try:
+                year, month, day = value[0:4], value[5:7], value[8:10]
+                if len(value) != 10 or value[4] != '-' or value[7] != '-' or \
+                        not (year.isdigit() and month.isdigit() and day.isdigit()):
+                    raise ValueError()
+                date = datetime.date(int(year), int(month), int(day))
+            except ValueError:
+                date = datetime.datetime.strptime(value, cls._date_format).date()
+            if len(cls._date_cache) >= cls._date_cache_size:
+                cls._date_cache.clear()
+            cls._date_cache[value] = date
+        return date
+
+    def _document_id(self, document_el):
+        """Returns the identifier of the specified document element.
+
+        Args:
+            document_el (lxml.etree._Element): The document element.
+
+        Returns:
+            str: The document identifier, mangled for notices.
+
+        """
+        doc_id = document_el.attrib.get('id')
+        doctype = document_el.attrib.get('doctype')
+
+        # Mangle doc_id for notices. While IDs are unique between decrees
+        # and edicts, this is not the case when adding notices to the mix.
+        if doctype == 'notice':
+            doc_id += doctype
+
+        return doc_id
+
+    def _create_document(self, document_el, doc_id, fields=None):
+        """Creates a document instance from the specified document element.
+
+        Args:
+            document_el (lxml.etree._Element): The document element.
+            doc_id (str): The document identifier.
+            fields (frozenset[str]): The fields to be set, see :attr:`document_fields`. Optional, defaults
+                to all fields.
+
+        Returns:
+            geolink_formatter.entity.Document: The created document.
+
+        """
+        if fields is not None:
+            return self._create_projection(document_el, doc_id, fields)
+        files = self._create_files(document_el)
+        enactment_date = document_el.attrib.get('enactment_date')
+        if enactment_date:
+            enactment_date = self._parse_date(enactment_date)
+        decree_date = document_el.attrib.get('decree_date')
+        if decree_date:
+            decree_date = self._parse_date(decree_date)
+        abrogation_date = document_el.attrib.get('abrogation_date')
+        if abrogation_date:
+            abrogation_date = self._parse_date(abrogation_date)
+        return Document(
+            files=files,
+            id=doc_id,
+            category=document_el.attrib.get('category'),
+            doctype=document_el.attrib.get('doctype'),
+            federal_level=document_el.attrib.get('federal_level'),
+            authority=document_el.attrib.get('authority'),
+            authority_url=document_el.attrib.get('authority_url'),
+            title=document_el.attrib.get('title'),
+            number=document_el.attrib.get('number'),
+            abbreviation=document_el.attrib.get('abbreviation'),
+            instance=document_el.attrib.get('instance'),
+            type=document_el.attrib.get('type'),
+            subtype=document_el.attrib.get('subtype'),
+            decree_date=decree_date,
+            enactment_date=enactment_date,
+            abrogation_date=abrogation_date,
+            cycle=document_el.attrib.get('cycle')
+        )
+
+    def _create_projection(self, document_el, doc_id, fields):
+        """Creates a document instance containing only the specified fields of the document element.
+
+        Args:
+            document_el (lxml.etree._Element): The document element.
+            doc_id (str): The document identifier.
+            fields (frozenset[str]): The fields to be set.
+
+        Returns:
+            geolink_formatter.entity.Document: The created document.
+
+        """
+        values = dict()
+        for name in fields:
+            if name == 'files':
+                continue
+            value = document_el.attrib.get(name)
+            if value and name in self._date_fields:
+                value = self._parse_date(value)
+            values[name] = value
+        files = self._create_files(document_el) if 'files' in fields else list()
+        return Document(files=files, id=doc_id, **values)
+
+    @classmethod
+    def _projection(cls, fields):
+        """Validates the fields of a projection.
+
+        Args:
+            fields (list[str]): The fields to be set or None for all fields.
+
+        Returns:
+            frozenset[str]: The fields to be set or None for all fields.
+
+        Raises:
+            ValueError: Raised on unknown field.
+
+        """
+        if fields is None:
+            return None
+        fields = frozenset(fields)
+        for field in fields:
+            if field not in cls.document_fields:
+                raise ValueError(Msg.invalid_field.format(field=field, expected=cls.document_fields))
+        return fields
+
+    def _create_files(self, document_el, lazy=False):
+        """Creates the file instances of the specified document element.
+
+        Args:
+            document_el (lxml.etree._Element): The document element.
+            lazy (bool): Create :class:`geolink_formatter.entity.LazyFile` instances reading their
+                attributes from the file elements. Defaults to False.
+
+        Returns:
+            list[geolink_formatter.entity.File]: The created files.
+
+        Raises:
+            geolink_formatter.parser.LimitExceededError: Raised if the document has too many files.
+
+        """
+        files = list()
+        for file_el in document_el.iter('file'):
+            if len(files) == self._max_files:
+                raise LimitExceededError('max_files', self._max_files)
+            if lazy:
+                files.append(LazyFile(file_el, self.host_url))
+            else:
+                files.append(File(
+                    title=file_el.attrib.get('title'),
+                    description=file_el.attrib.get('description'),
+                    href=_absolute_url(file_el.attrib.get('href'), self.host_url),
+                    category=file_el.attrib.get('category')
+                ))
+        return files
+
+    def from_string(self, xml, validation=None, lazy=False, document_filter=None, fields=None):
         """Parses XML into internal structure.
 
-        The specified XML string is gets validated against the geoLink XSD on parsing.
+        The specified XML string is gets validated against the geoLink XSD on parsing, as decided by the
+        validation policy.
 
         Args:
-            xml (str or bytes): The XML to be parsed.
+            xml (str or bytes or bytearray or memoryview or file): The XML to be parsed.
+            validation (bool or geolink_formatter.parser.ValidationPolicy): Validation against the XSD for
+                this geoLink. Optional, defaults to the validation policy of the parser.
+            lazy (bool): Return a :class:`DocumentView` creating the documents on access, reading their
+                attributes from the parsed XML and converting dates on first use. The limit for files per
+                document is checked when the files of a document are accessed. The metrics sink receives
+                no entity creation timing and no document and file counts for lazy views. Defaults to
+                False.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents to be
+                returned. Optional, defaults to all documents.
+            fields (list[str]): The fields to be set on the returned documents, see
+                :attr:`document_fields`. Cannot be combined with `lazy`. Optional, defaults to all fields.
 
         Returns:
-            list[geolink_formatter.entity.Document]: A list containing the parsed document elements.
+            geolink_formatter.parser.DocumentList or geolink_formatter.parser.DocumentView: A list or view
+            containing the parsed document elements.
 
         Raises:
             lxml.etree.XMLSyntaxError: Raised on failed validation.
+            ValueError: Raised on unknown field or on fields combined with `lazy`.
         """
-        root = self._parse_xml(xml)
-        documents = list()
+        if lazy and fields is not None:
+            raise ValueError(Msg.incompatible_arguments.format(first='lazy', second='fields'))
+        fields = self._projection(fields)
+        root, version = self._parse(xml, validation=validation)
+        if lazy:
+            return DocumentView(self, list(self._unique_documents(root, document_filter)), version)
+        return self._documents(root, document_filter, fields, version)
 
+    def _unique_documents(self, root, document_filter=None):
+        """Yields the document elements of a parsed geoLink, skipping duplicates. The filter is applied after
+        skipping duplicates, so only the first document with a specific identifier is considered.
+
+        Args:
+            root (lxml.etree._Element): The root element of the parsed geoLink XML.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents.
+                Optional, defaults to all documents.
+
+        Yields:
+            tuple[lxml.etree._Element, str]: The document elements and their identifiers.
+
+        """
+        document_ids = set()
         for document_el in root.iter('document'):
-            doc_id = document_el.attrib.get('id')
-            doctype = document_el.attrib.get('doctype')
-
-            # Mangle doc_id for notices. While IDs are unique between decrees
-            # and edicts, this is not the case when adding notices to the mix.
-            if doctype == 'notice':
-                doc_id += doctype
-
-            if doc_id and doc_id not in [doc.id for doc in documents]:
-                files = list()
-                for file_el in document_el.iter('file'):
-                    href = file_el.attrib.get('href')
-                    if self.host_url and not href.startswith(u'http://') and not href.startswith(u'https://'):
-                        href = u'{host}{href}'.format(host=self.host_url, href=href)
-                    files.append(File(
-                        title=file_el.attrib.get('title'),
-                        description=file_el.attrib.get('description'),
-                        href=href,
-                        category=file_el.attrib.get('category')
-                    ))
-                enactment_date = document_el.attrib.get('enactment_date')
-                if enactment_date:
-                    enactment_date = datetime.datetime.strptime(enactment_date, self._date_format).date()
-                decree_date = document_el.attrib.get('decree_date')
-                if decree_date:
-                    decree_date = datetime.datetime.strptime(decree_date, self._date_format).date()
-                abrogation_date = document_el.attrib.get('abrogation_date')
-                if abrogation_date:
-                    abrogation_date = datetime.datetime.strptime(abrogation_date, self._date_format).date()
-                documents.append(Document(
-                    files=files,
-                    id=doc_id,
-                    category=document_el.attrib.get('category'),
-                    doctype=document_el.attrib.get('doctype'),
-                    federal_level=document_el.attrib.get('federal_level'),
-                    authority=document_el.attrib.get('authority'),
-                    authority_url=document_el.attrib.get('authority_url'),
-                    title=document_el.attrib.get('title'),
-                    number=document_el.attrib.get('number'),
-                    abbreviation=document_el.attrib.get('abbreviation'),
-                    instance=document_el.attrib.get('instance'),
-                    type=document_el.attrib.get('type'),
-                    subtype=document_el.attrib.get('subtype'),
-                    decree_date=decree_date,
-                    enactment_date=enactment_date,
-                    abrogation_date=abrogation_date,
-                    cycle=document_el.attrib.get('cycle')
-                ))
+            doc_id = self._document_id(document_el)
+            if doc_id and doc_id not in document_ids:
+                document_ids.add(doc_id)
+                if document_filter is None or document_filter.accepts(document_el.attrib.get):
+                    yield document_el, doc_id
 
+    def _documents(self, root, document_filter=None, fields=None, version=None):
+        """Creates the documents of a parsed geoLink, skipping duplicates.
+
+        Args:
+            root (lxml.etree._Element): The root element of the parsed geoLink XML.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents.
+                Optional, defaults to all documents.
+            fields (frozenset[str]): The fields to be set. Optional, defaults to all fields.
+            version (str): The schema version of the geoLink. Optional, defaults to the version of the
+                parser.
+
+        Returns:
+            geolink_formatter.parser.DocumentList: A list containing the parsed document elements.
+
+        """
+        metrics = self._metrics
+        if metrics is not None:
+            start = _clock()
+        documents = DocumentList((self._create_document(document_el, doc_id, fields)
+                                  for document_el, doc_id in self._unique_documents(root, document_filter)),
+                                 version or self._version)
+        if metrics is not None:
+            metrics.timing(METRIC.ENTITIES, _clock() - start)
+            metrics.increment(METRIC.DOCUMENTS, len(documents))
+            metrics.increment(METRIC.FILES, sum(len(document.files) for document in documents))
         return documents
 
-    def from_url(self, url, params=None, **kwargs):
+    def iter_documents(self, source, validation=None, document_filter=None, fields=None):
+        """Parses XML incrementally and yields each document as soon as its element has been read.
+
+        Processed elements are discarded immediately, so the memory usage does not depend on the size of
+        the geoLink. The XML is validated while parsing, but validation errors are raised at the end of the
+        input, so the documents read so far have already been yielded when the validation fails. As the
+        content is not known in advance, the validation policy is consulted without it, and parsers with
+        version :attr:`SCHEMA.AUTO` validate against the newest schema version.
+
+        The metrics are reported when the generator is exhausted or closed. The parse duration includes the
+        validation but not the time spent by the consumer between the yielded documents.
+
+        Args:
+            source (str or bytes or file): The XML to be parsed. Can be a XML string or a file-like object,
+                e.g. the raw stream of a :class:`requests.models.Response` requested with `stream=True`.
+            validation (bool or geolink_formatter.parser.ValidationPolicy): Validation against the XSD for
+                this geoLink. Optional, defaults to the validation policy of the parser.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents to be
+                yielded. Optional, defaults to all documents.
+            fields (list[str]): The fields to be set on the yielded documents, see :attr:`document_fields`.
+                Optional, defaults to all fields.
+
+        Yields:
+            geolink_formatter.entity.Document: The parsed documents.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: Raised on failed validation.
+            defusedxml.common.DefusedXmlException: Raised on forbidden entity declarations.
+            geolink_formatter.parser.LimitExceededError: Raised if the XML exceeds a configured limit.
+
+        """
+        fields = self._projection(fields)
+        encoding = None
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = BytesIO(source)
+        elif not hasattr(source, 'read'):
+            source = BytesIO(source.encode('utf-8'))
+            encoding = 'utf-8'
+        metrics = self._metrics
+        if self._max_bytes is not None or metrics is not None:
+            source = _LimitedReader(source, self._max_bytes)
+        policy = self._xsd_validation if validation is None else self._validation_policy(validation)
+        events = iterparse(
+            source,
+            events=('start', 'end'),
+            encoding=encoding,
+            dtd_validation=self._dtd_validation,
+            no_network=True,
+            resolve_entities=False,
+            schema=self._schema if policy.should_validate(None) else None
+        )
+        document_ids = set()
+        document_count = 0
+        checked = False
+        parse_time = 0.0
+        entities_time = 0.0
+        created_count = 0
+        file_count = 0
+        start = _clock() if metrics is not None else None
+
+        try:
+            for event, element in events:
+                if not checked:
+                    tree = element.getroottree()
+                    check_docinfo(tree)
+                    if self._dtd_validation and not isinstance(tree.docinfo.internalDTD, DTD):
+                        raise DocumentInvalid('Missing DTD in parsed content')
+                    checked = True
+                if event == 'start' and element.tag == 'document':
+                    document_count += 1
+                    if self._max_documents is not None and document_count > self._max_documents:
+                        raise LimitExceededError('max_documents', self._max_documents)
+                elif event == 'end' and element.tag == 'document':
+                    doc_id = self._document_id(element)
+                    if doc_id and doc_id not in document_ids:
+                        document_ids.add(doc_id)
+                        if document_filter is None or document_filter.accepts(element.attrib.get):
+                            if metrics is None:
+                                yield self._create_document(element, doc_id, fields)
+                            else:
+                                now = _clock()
+                                parse_time += now - start
+                                document = self._create_document(element, doc_id, fields)
+                                created_count += 1
+                                file_count += len(document.files)
+                                # the time spent by the consumer is not measured
+                                start = None
+                                entities_time += _clock() - now
+                                yield document
+                                start = _clock()
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+        finally:
+            if metrics is not None:
+                if start is not None:
+                    parse_time += _clock() - start
+                metrics.timing(METRIC.PARSE, parse_time)
+                metrics.timing(METRIC.ENTITIES, entities_time)
+                metrics.increment(METRIC.BYTES, source._size)
+                metrics.increment(METRIC.DOCUMENTS, created_count)
+                metrics.increment(METRIC.FILES, file_count)
+
+    def from_url(self, url, params=None, validation=None, document_filter=None, fields=None, **kwargs):
         """Loads the geoLink of the specified URL and parses it into the internal structure.
 
+        If the parser has a :attr:`cache`, fresh cached documents are returned without any request.
+        Expired documents are revalidated using the `ETag` and `Last-Modified` headers of the cached
+        response, so an unchanged geoLink is neither downloaded nor parsed again.
+
         Args:
             url (str): The URL of the geoLink to be parsed.
             params (dict): Dictionary or bytes to be sent in the query string for the
                 :class:`requests.models.Request`.
-            **kwargs: Optional arguments that ``requests.api.request`` takes.
+            validation (bool or geolink_formatter.parser.ValidationPolicy): Validation against the XSD for
+                this geoLink. Optional, defaults to the validation policy of the parser. The URL is passed
+                to the policy as source, e.g. for :class:`TrustedSourceValidation`.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents to be
+                returned. Optional, defaults to all documents.
+            fields (list[str]): The fields to be set on the returned documents, see
+                :attr:`document_fields`. Optional, defaults to all fields.
+            **kwargs: Optional arguments that :meth:`requests.Session.request` takes.
 
         Returns:
-            list[geolink_formatter.entity.Document]: A list containing the parsed document elements.
+            geolink_formatter.parser.DocumentList: A list containing the parsed document elements.
 
         Raises:
             lxml.etree.XMLSyntaxError: Raised on failed validation.
             requests.HTTPError: Raised on failed HTTP request.
+            geolink_formatter.parser.LimitExceededError: Raised if the geoLink exceeds a configured limit.
 
         """
-        response = requests.get(url, params=params, **kwargs)
-        if response.status_code == 200:
-            return self.from_string(response.content)
+        fields = self._projection(fields)
+        if self._cache is None:
+            response, content = self._get(url, params=params, **kwargs)
+            if response.status_code == 200:
+                root, version = self._parse(content, validation=validation, source=url)
+                return self._documents(root, document_filter, fields, version)
+            else:
+                self._raise_for_status(response)
         else:
-            response.raise_for_status()
+            return self._from_url_cached(url, params, validation, document_filter, fields, **kwargs)
+
+    def _fetch(self, url, params=None, **kwargs):
+        """Loads the content of the specified URL.
+
+        Args:
+            url (str): The URL to be loaded.
+            params (dict): Dictionary or bytes to be sent in the query string.
+            **kwargs: Optional arguments that :meth:`requests.Session.request` takes.
+
+        Returns:
+            bytes: The response body.
+
+        Raises:
+            requests.HTTPError: Raised on failed HTTP request.
+
+        """
+        response, content = self._get(url, params=params, **kwargs)
+        if response.status_code != 200:
+            self._raise_for_status(response)
+        return content
+
+    @staticmethod
+    def _raise_for_status(response):
+        """Raises an error for a response without geoLink content.
+
+        Besides failed requests, this includes other successful or redirection status codes than 200, e.g.
+        304 for a conditional request without cached content.
+
+        Args:
+            response (requests.Response): The response.
+
+        Raises:
+            requests.HTTPError: Raised in any case.
+
+        """
+        import requests
+
+        response.raise_for_status()
+        raise requests.HTTPError(Msg.unexpected_status.format(status=response.status_code, url=response.url),
+                                 response=response)
+
+    def _get(self, url, params=None, **kwargs):
+        """Sends a GET request and reads the response body, enforcing the maximum size while downloading.
+
+        Args:
+            url (str): The URL to be loaded.
+            params (dict): Dictionary or bytes to be sent in the query string.
+            **kwargs: Optional arguments that :meth:`requests.Session.request` takes.
+
+        Returns:
+            tuple[requests.Response, bytes]: The response and its body.
+
+        Raises:
+            geolink_formatter.parser.LimitExceededError: Raised if the body exceeds the maximum size.
+
+        """
+        if self._metrics is None:
+            return self._download(url, params, **kwargs)
+        start = _clock()
+        try:
+            return self._download(url, params, **kwargs)
+        finally:
+            self._metrics.timing(METRIC.FETCH, _clock() - start)
+
+    def _download(self, url, params, **kwargs):
+        """Sends a GET request and reads the response body, see :meth:`_get`.
+
+        Args:
+            url (str): The URL to be loaded.
+            params (dict): Dictionary or bytes to be sent in the query string.
+            **kwargs: Optional arguments that :meth:`requests.Session.request` takes.
+
+        Returns:
+            tuple[requests.Response, bytes]: The response and its body.
+
+        """
+        if self._max_bytes is None:
+            response = self.session.get(url, params=params, **kwargs)
+            return response, response.content
+        kwargs['stream'] = True
+        response = self.session.get(url, params=params, **kwargs)
+        try:
+            length = response.headers.get('Content-Length')
+            if length and length.isdigit() and int(length) > self._max_bytes:
+                raise LimitExceededError('max_bytes', self._max_bytes)
+            chunks = list()
+            size = 0
+            for chunk in response.iter_content(chunk_size=65536):
+                size += len(chunk)
+                if size > self._max_bytes:
+                    raise LimitExceededError('max_bytes', self._max_bytes)
+                chunks.append(chunk)
+            return response, b''.join(chunks)
+        finally:
+            response.close()
+
+    def _increment(self, name):
+        """Increments a counter of the metrics sink, if the parser has one.
+
+        Args:
+            name (str): The name of the counter.
+
+        """
+        if self._metrics is not None:
+            self._metrics.increment(name)
+
+    def _cache_key(self, url, params, document_filter=None, fields=None, validation=None):
+        """Returns the cache key for the specified request and the configuration of the parser.
+
+        Args:
+            url (str): The URL of the geoLink.
+            params (dict): Dictionary or bytes to be sent in the query string.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents.
+            fields (frozenset[str]): The fields to be set.
+            validation (bool or geolink_formatter.parser.ValidationPolicy): Validation override for this
+                request, so documents loaded without validation are not returned to validating requests.
+
+        Returns:
+            str: The cache key.
+
+        """
+        import requests
+
+        request_url = requests.Request('GET', url, params=params).prepare().url
+        policy = self._xsd_validation if validation is None else self._validation_policy(validation)
+        return u'|'.join([
+            request_url,
+            self._host_url or u'',
+            self._version,
+            str(self._dtd_validation),
+            policy.__class__.__name__,
+            document_filter.key if document_filter else u'',
+            u','.join(sorted(fields)) if fields is not None else u''
+        ])
+
+    def _from_url_cached(self, url, params=None, validation=None, document_filter=None, fields=None,
+                         **kwargs):
+        """Loads the geoLink of the specified URL using the cache of the parser.
+
+        Args:
+            url (str): The URL of the geoLink to be parsed.
+            params (dict): Dictionary or bytes to be sent in the query string.
+            validation (bool or geolink_formatter.parser.ValidationPolicy): Validation against the XSD for
+                this geoLink, applied if it has to be parsed.
+            document_filter (geolink_formatter.parser.DocumentFilter): Filter selecting the documents.
+            fields (frozenset[str]): The fields to be set.
+            **kwargs: Optional arguments that :meth:`requests.Session.request` takes.
+
+        Returns:
+            geolink_formatter.parser.DocumentList: A list containing the parsed document elements.
+
+        """
+        key = self._cache_key(url, params, document_filter, fields, validation)
+
+        def load(content):
+            root, version = self._parse(content, validation=validation, source=url)
+            return self._documents(root, document_filter, fields, version)
+
+        return self._cached_documents(self._load_cached(key, load, url, params, **kwargs))
+
+    def _load_cached(self, key, load, url, params=None, **kwargs):
+        """Loads a value derived from the content of the specified URL using the cache of the parser.
+
+        Fresh entries are returned without any request. Expired entries are revalidated using the `ETag`
+        and `Last-Modified` headers of the cached response.
+
+        Args:
+            key (str): The cache key of the value.
+            load (callable): Function deriving the value from the downloaded content.
+            url (str): The URL to be loaded.
+            params (dict): Dictionary or bytes to be sent in the query string.
+            **kwargs: Optional arguments that :meth:`requests.Session.request` takes.
+
+        Returns:
+            object: The cached or loaded value.
+
+        Raises:
+            requests.HTTPError: Raised on failed HTTP request or unexpected status code.
+
+        """
+        entry = self._cache.get(key)
+        if entry is not None and entry.is_fresh(self._cache.ttl):
+            self._cache._record(hits=1)
+            self._increment(METRIC.CACHE_HIT)
+            return entry.value
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        response, content = self._get(url, params=params, headers=headers, **kwargs)
+
+        if entry is not None and response.status_code == 304:
+            self._cache._record(revalidations=1)
+            self._increment(METRIC.CACHE_REVALIDATION)
+            self._cache.set(key, CacheEntry(
+                entry.value,
+                etag=response.headers.get('ETag', entry.etag),
+                last_modified=response.headers.get('Last-Modified', entry.last_modified)
+            ))
+            return entry.value
+        elif response.status_code == 200:
+            value = load(content)
+            self._cache._record(misses=1)
+            self._increment(METRIC.CACHE_MISS)
+            self._cache.set(key, CacheEntry(
+                value,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            ))
+            return value
+        else:
+            self._raise_for_status(response)
+
+    def _cached_documents(self, documents):
+        """Copies cached documents, so changing the returned list does not affect the cache.
+
+        Args:
+            documents (list[geolink_formatter.entity.Document]): The cached documents.
+
+        Returns:
+            geolink_formatter.parser.DocumentList: A list containing the cached documents.
+
+        """
+        return DocumentList(documents, getattr(documents, 'version', self._version))
+
+    def from_urls(self, urls, params=None, max_workers=10, **kwargs):
+        """Loads the geoLinks of the specified URLs in parallel and parses them into the internal structure.
+
+        All requests share the connection pool of :attr:`session`, which should provide at least
+        `max_workers` connections per host.
+
+        Args:
+            urls (list[str]): The URLs of the geoLinks to be parsed.
+            params (dict): Dictionary or bytes to be sent in the query string for the
+                :class:`requests.models.Request`.
+            max_workers (int): The maximum number of concurrent requests. Defaults to 10.
+            **kwargs: Optional arguments that :meth:`requests.Session.request` takes.
+
+        Returns:
+            list[geolink_formatter.parser.DocumentList or Exception]: The parsed documents for each URL,
+            in the order of the specified URLs. If loading or parsing a geoLink fails, the raised exception
+            is returned at its position instead of aborting the whole batch.
+
+        """
+        def load(url):
+            return self.from_url(url, params=params, **kwargs)
+        return _map_parallel(load, urls, max_workers)
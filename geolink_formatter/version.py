@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""Detection of the geoLink schema version using rules generated ahead of time from the geoLink schemas.
+
+The rules for all schema versions are stored in :mod:`geolink_formatter._specs`. After changing or adding a
+schema file, they have to be regenerated using::
+
+    python -m geolink_formatter.version
+
+"""
+from __future__ import print_function
+
+import os
+
+from lxml.etree import XPath, parse
+
+from geolink_formatter.entity import Msg
+
+
+_XS = '{http://www.w3.org/2001/XMLSchema}'
+"""str: Namespace of XML schema elements, as used in lxml tags."""
+
+_specs_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_specs.py')
+"""str: The module containing the generated rules."""
+
+
+class VersionDetector(object):
+    def __init__(self, specs, versions):
+        """Creates a detector for the narrowest schema version accepting a parsed geoLink.
+
+        Every schema version only adds attributes and attribute values to the previous one, so a geoLink is
+        valid against the newest version whose additions it uses if it is valid against any version. The
+        detector checks the additions of each version using one XPath expression, newest first.
+
+        Args:
+            specs (dict): The rules generated by :func:`generate_specs`.
+            versions (list[str]): The schema versions, oldest first.
+
+        Raises:
+            ValueError: Raised if a version removes attributes or attribute values of the previous one.
+
+        """
+        self._versions = tuple(versions)
+        self._markers = list()
+        self._variables = dict()
+        for previous, version in zip(self._versions, self._versions[1:]):
+            spec = specs[version]
+            condition = None
+            for kind, path in (('file', spec['file']), ('document', spec['document']), ('root', 'self::*')):
+                alternatives = self._additions(specs[previous][kind + '_attributes'],
+                                               spec[kind + '_attributes'])
+                if condition is not None:
+                    alternatives.append(condition)
+                condition = '{0}[{1}]'.format(path, ' or '.join(alternatives)) if alternatives else None
+            if condition is not None:
+                self._markers.append((version, XPath('boolean({0})'.format(condition))))
+        self._markers.reverse()
+
+    def _additions(self, old, new):
+        """Returns XPath conditions matching the attributes and attribute values added by a schema version.
+
+        Args:
+            old (dict): The attributes declared by the previous version, see :func:`generate_spec`.
+            new (dict): The attributes declared by the version.
+
+        Returns:
+            list[str]: The conditions, using variables for attribute values.
+
+        Raises:
+            ValueError: Raised if the version removes attributes or attribute values.
+
+        """
+        conditions = list()
+        for name in sorted(new):
+            if name not in old:
+                conditions.append('@{0}'.format(name))
+            elif new[name] is not None:
+                if old[name] is None or set(old[name]) - set(new[name]):
+                    raise ValueError(Msg.unsupported_schema.format(construct='removed attribute value'))
+                for value in sorted(set(new[name]) - set(old[name])):
+                    variable = 'value_{0}'.format(len(self._variables))
+                    self._variables[variable] = value
+                    conditions.append('@{0}=${1}'.format(name, variable))
+        if set(old) - set(new):
+            raise ValueError(Msg.unsupported_schema.format(construct='removed attribute'))
+        return conditions
+
+    @property
+    def versions(self):
+        """tuple[str]: The schema versions, oldest first."""
+        return self._versions
+
+    def detect(self, root):
+        """Detects the narrowest schema version accepting a parsed geoLink.
+
+        The result is only meaningful for valid geoLinks. Invalid geoLinks are invalid against every version,
+        so validating them against the detected version fails as well.
+
+        Args:
+            root (lxml.etree._Element): The root element of the parsed geoLink XML.
+
+        Returns:
+            str: The detected schema version.
+
+        """
+        for version, marker in self._markers:
+            if marker(root, **self._variables):
+                return version
+        return self._versions[0]
+
+
+def _particle(complex_type, name):
+    """Returns the only child element of a complex type.
+
+    Args:
+        complex_type (lxml.etree._Element): The complex type.
+        name (str): The expected name of the child element.
+
+    Returns:
+        lxml.etree._Element: The declaration of the child element.
+
+    Raises:
+        ValueError: Raised on any other content model or a bounded number of occurrences.
+
+    """
+    groups = [child for child in complex_type if child.tag in (_XS + 'sequence', _XS + 'choice')]
+    if len(groups) != 1 or len(groups[0]) != 1 or groups[0][0].tag != _XS + 'element' or \
+            groups[0][0].get('name') != name:
+        raise ValueError(Msg.unsupported_schema.format(construct='content model'))
+    group, element = groups[0], groups[0][0]
+    maxima = (group.get('maxOccurs', '1'), element.get('maxOccurs', '1'))
+    if 'unbounded' not in maxima or any(maximum not in ('1', 'unbounded') for maximum in maxima):
+        raise ValueError(Msg.unsupported_schema.format(construct='bounded maxOccurs'))
+    return element
+
+
+def _attributes(complex_type):
+    """Returns the attributes declared by a complex type.
+
+    Args:
+        complex_type (lxml.etree._Element): The complex type.
+
+    Returns:
+        dict: The declared attributes, mapping their names to the sorted allowed values or to None if all
+        values are allowed.
+
+    Raises:
+        ValueError: Raised on unsupported attribute declarations.
+
+    """
+    attributes = dict()
+    for attribute in complex_type.iterchildren(_XS + 'attribute'):
+        if set(attribute.attrib) - {'name', 'type'}:
+            raise ValueError(Msg.unsupported_schema.format(construct='attribute declaration'))
+        if attribute.get('type') == 'xs:string' and len(attribute) == 0:
+            attributes[attribute.get('name')] = None
+            continue
+        restriction = attribute.find('{0}simpleType/{0}restriction'.format(_XS))
+        if attribute.get('type') is not None or restriction is None or \
+                restriction.get('base') != 'xs:string' or \
+                any(facet.tag != _XS + 'enumeration' for facet in restriction):
+            raise ValueError(Msg.unsupported_schema.format(construct='attribute type'))
+        attributes[attribute.get('name')] = tuple(sorted(facet.get('value') for facet in restriction))
+    for child in complex_type:
+        if child.tag not in (_XS + 'attribute', _XS + 'sequence', _XS + 'choice') and not callable(child.tag):
+            raise ValueError(Msg.unsupported_schema.format(construct=child.tag))
+    return attributes
+
+
+def generate_spec(xsd):
+    """Generates the rules of a geoLink schema used to detect its version, i.e. the names of the document
+    and file elements and the declared attributes.
+
+    Only the constructs used by the geoLink schemas are supported.
+
+    Args:
+        xsd (str): The path of the schema file.
+
+    Returns:
+        dict: The rules of the schema.
+
+    Raises:
+        ValueError: Raised if the schema uses unsupported constructs.
+
+    """
+    schema = parse(xsd).getroot()
+    roots = list(schema.iterchildren(_XS + 'element'))
+    if len(roots) != 1 or len(schema) != 1:
+        raise ValueError(Msg.unsupported_schema.format(construct='multiple global declarations'))
+    root_type = roots[0].find(_XS + 'complexType')
+    document = _particle(root_type, 'document')
+    document_type = document.find(_XS + 'complexType')
+    file_el = _particle(document_type, 'file')
+    file_type = file_el.find(_XS + 'complexType')
+    if any(child.tag in (_XS + 'sequence', _XS + 'choice', _XS + 'all') for child in file_type) or \
+            any(child.get('mixed') == 'true' for child in (root_type, document_type, file_type)):
+        raise ValueError(Msg.unsupported_schema.format(construct='content model'))
+    return {
+        'document': document.get('name'),
+        'file': file_el.get('name'),
+        'root_attributes': _attributes(root_type),
+        'document_attributes': _attributes(document_type),
+        'file_attributes': _attributes(file_type)
+    }
+
+
+def generate_specs(directory, versions):
+    """Generates the rules of multiple geoLink schema versions.
+
+    Args:
+        directory (str): The directory containing the schema files.
+        versions (list[str]): The schema versions.
+
+    Returns:
+        dict: The rules by version.
+
+    """
+    return dict((version, generate_spec(os.path.join(directory, 'v{0}.xsd'.format(version))))
+                for version in versions)
+
+
+def _format(value, indent=0):
+    """Formats the generated rules as Python source code.
+
+    Args:
+        value (dict or tuple or str or int or None): The value to be formatted.
+        indent (int): The indentation of the value in spaces.
+
+    Returns:
+        str: The Python source code of the value.
+
+    """
+    if isinstance(value, dict) and value:
+        lines = ['{']
+        for key in sorted(value):
+            lines.append('{0}{1!r}: {2},'.format(' ' * (indent + 4), key, _format(value[key], indent + 4)))
+        lines.append(' ' * indent + '}')
+        return '\n'.join(lines)
+    return repr(value)
+
+
+def main():
+    """Regenerates :mod:`geolink_formatter._specs` from the bundled schema files."""
+    from geolink_formatter.parser import SCHEMA, _schema_directory
+    specs = generate_specs(_schema_directory, SCHEMA.ALL)
+    with open(_specs_file, 'w') as f:
+        f.write('# -*- coding: utf-8 -*-\n')
+        f.write('# Generated from the geoLink schemas by "python -m geolink_formatter.version".\n')
+        f.write('# Do not edit.\n')
+        f.write('\n')
+        f.write('SPECS = {0}\n'.format(_format(specs)))
+    print(u'Generated {0}'.format(_specs_file))
+
+
+if __name__ == '__main__':
+    main()
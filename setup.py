@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 
 import os
+import sys
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
 
 here = os.path.abspath(os.path.dirname(__file__))
 with open(os.path.join(here, 'README.rst')) as f:
@@ -12,9 +14,21 @@ with open(os.path.join(here, 'CHANGELOG')) as f:
 requires = [
     'lxml>=3.7.0',
     'defusedxml',
-    'requests'
+    'requests',
+    'futures; python_version < "3"'
 ]
 
+
+class BuildPy(build_py):
+    """Skips the asyncio module, which cannot be compiled before Python 3.5."""
+
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+        if sys.version_info < (3, 5):
+            modules = [m for m in modules if (m[0], m[1]) != ('geolink_formatter', 'aio')]
+        return modules
+
+
 setup(name='geolink_formatter',
       version='1.5.0',
       description='OEREBlex geoLink Formatter',
@@ -36,8 +50,14 @@ setup(name='geolink_formatter',
       author_email='karsten.deininger@bl.ch',
       url='https://gitlab.com/gf-bl/python-geolink-formatter',
       keywords='oereb lex geolink formatter html',
-      packages=find_packages(),
+      packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
       include_package_data=True,
       zip_safe=False,
-      install_requires=requires
+      install_requires=requires,
+      extras_require={
+          'async': ['aiohttp; python_version >= "3.5"']
+      },
+      cmdclass={
+          'build_py': BuildPy
+      }
       )
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import datetime
+import sys
 from contextlib import contextmanager
 
 import pytest
@@ -8,6 +9,10 @@ import requests_mock
 from geolink_formatter.entity import Document, File
 
 
+if sys.version_info < (3, 5):
+    collect_ignore = ['test_aio.py']
+
+
 @pytest.fixture()
 def documents():
     return [
@@ -53,14 +58,17 @@ def document_archived():
     ]
 
 
-@contextmanager
-def _mock_request():
-    with requests_mock.mock() as m:
-        with open('tests/resources/geolink_v1.2.0.xml', 'rb') as f:
-            m.get('http://oereblex.test.com/api/geolinks/1500.xml', content=f.read())
-        yield m
+@pytest.fixture(scope='session')
+def geolink_v1_2_0():
+    with open('tests/resources/geolink_v1.2.0.xml', 'rb') as f:
+        return f.read()
 
 
 @pytest.fixture()
-def mock_request():
+def mock_request(geolink_v1_2_0):
+    @contextmanager
+    def _mock_request():
+        with requests_mock.mock() as m:
+            m.get('http://oereblex.test.com/api/geolinks/1500.xml', content=geolink_v1_2_0)
+            yield m
     return _mock_request
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+from lxml.etree import DocumentInvalid
+
+from geolink_formatter import GeoLinkFormatter
+from geolink_formatter.parser import XML
+
+aiohttp = pytest.importorskip('aiohttp')
+web = pytest.importorskip('aiohttp.web')
+test_utils = pytest.importorskip('aiohttp.test_utils')
+
+from geolink_formatter.aio import AsyncGeoLinkFormatter, AsyncXML  # noqa: E402
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def _server(content):
+    async def geolink(request):
+        if request.match_info['id'] == '1501':
+            return web.Response(status=500, text='error')
+        if request.match_info['id'] == '1502':
+            return web.Response(status=204)
+        return web.Response(body=content, content_type='application/xml')
+    app = web.Application()
+    app.router.add_get('/api/geolinks/{id}.xml', geolink)
+    server = test_utils.TestServer(app)
+    await server.start_server()
+    return server
+
+
+def test_async_xml_from_url(geolink_v1_2_0):
+    async def test():
+        server = await _server(geolink_v1_2_0)
+        try:
+            async with AsyncXML(host_url='http://oereblex.test.com') as parser:
+                documents = await parser.from_url(str(server.make_url('/api/geolinks/1500.xml')))
+                session = parser.session
+            assert session.closed
+        finally:
+            await server.close()
+        return documents
+    documents = run(test())
+    expected = XML(host_url='http://oereblex.test.com').from_string(geolink_v1_2_0)
+    assert [document.id for document in documents] == [document.id for document in expected]
+    assert documents[0].files[0].href == expected[0].files[0].href
+
+
+@pytest.mark.parametrize('doc_id,status', [('1501', 500), ('1502', 204)])
+def test_async_xml_from_url_error(doc_id, status, geolink_v1_2_0):
+    async def test():
+        server = await _server(geolink_v1_2_0)
+        try:
+            async with AsyncXML() as parser:
+                await parser.from_url(str(server.make_url('/api/geolinks/{0}.xml'.format(doc_id))))
+        finally:
+            await server.close()
+    with pytest.raises(aiohttp.ClientResponseError) as error:
+        run(test())
+    assert error.value.status == status
+
+
+def test_async_xml_from_string_invalid():
+    with pytest.raises(DocumentInvalid):
+        run(AsyncXML().from_string(b'<invalid/>'))
+
+
+def test_async_xml_injected_session():
+    async def test():
+        session = aiohttp.ClientSession()
+        async with AsyncXML(session=session) as parser:
+            assert parser.session is session
+        assert not session.closed
+        await session.close()
+    run(test())
+
+
+def test_async_formatter_html(geolink_v1_2_0):
+    async def test():
+        server = await _server(geolink_v1_2_0)
+        try:
+            async with AsyncGeoLinkFormatter() as formatter:
+                return await formatter.html_many([
+                    str(server.make_url('/api/geolinks/1500.xml')),
+                    geolink_v1_2_0,
+                    str(server.make_url('/api/geolinks/1501.xml')),
+                    1
+                ])
+        finally:
+            await server.close()
+    html = run(test())
+    assert html[0] == html[1] == GeoLinkFormatter().html(geolink_v1_2_0)
+    assert isinstance(html[2], aiohttp.ClientResponseError)
+    assert isinstance(html[3], TypeError)
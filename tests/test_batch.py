@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import pickle
+import types
+
+import pytest
+
+from geolink_formatter import GeoLinkFormatter
+from geolink_formatter.batch import BatchError, parse_all, render_all
+from geolink_formatter.parser import SCHEMA
+
+
+def _sources(valid):
+    return [valid, b'<invalid/>', 1, valid.decode('utf-8')]
+
+
+@pytest.mark.parametrize('chunksize', [1, 3])
+def test_render_all(chunksize, geolink_v1_2_0):
+    sources = _sources(geolink_v1_2_0)
+    results = render_all(iter(sources), processes=2, chunksize=chunksize, host_url='http://oereblex.test.com')
+    assert isinstance(results, types.GeneratorType)
+    results = list(results)
+    expected = GeoLinkFormatter(host_url='http://oereblex.test.com').html(sources[0])
+    assert len(results) == 4
+    assert results[0] == results[3] == expected
+    assert isinstance(results[1], BatchError)
+    assert results[1].error_type == 'lxml.etree.DocumentInvalid'
+    assert isinstance(results[2], TypeError)
+
+
+def test_parse_all(geolink_v1_2_0):
+    results = list(parse_all(_sources(geolink_v1_2_0), processes=2, version=SCHEMA.V1_2_0))
+    assert len(results) == 4
+    assert len(results[0]) == 5
+    assert results[0][4].doctype == 'notice'
+    assert [document.id for document in results[3]] == [document.id for document in results[0]]
+    assert isinstance(results[1], BatchError)
+    assert isinstance(results[2], TypeError)
+
+
+def test_parse_all_auto(geolink_v1_2_0):
+    with open('tests/resources/geolink_v1.0.0.xml', 'rb') as f:
+        v1_0_0 = f.read()
+    sources = _sources(geolink_v1_2_0)
+    results = list(parse_all([sources[0], v1_0_0, sources[1]], processes=2, version=SCHEMA.AUTO))
+    assert len(results) == 3
+    assert results[0].version == SCHEMA.V1_2_0
+    assert results[1].version == SCHEMA.V1_0_0
+    assert isinstance(results[2], BatchError)
+
+
+def test_render_all_auto(geolink_v1_2_0):
+    sources = _sources(geolink_v1_2_0)
+    results = list(render_all(sources[:1], processes=1, host_url='http://oereblex.test.com',
+                              version=SCHEMA.AUTO))
+    assert results == [GeoLinkFormatter(host_url='http://oereblex.test.com').html(sources[0])]
+
+
+@pytest.mark.parametrize('func', [parse_all, render_all])
+def test_batch_invalid_version(func, geolink_v1_2_0):
+    with pytest.raises(IOError):
+        func(_sources(geolink_v1_2_0), processes=1, version='0.0.0')
+
+
+def test_batch_error():
+    error = pickle.loads(pickle.dumps(BatchError('Invalid document', 'lxml.etree.DocumentInvalid')))
+    assert error.message == 'Invalid document'
+    assert error.error_type == 'lxml.etree.DocumentInvalid'
+    assert str(error) == 'lxml.etree.DocumentInvalid: Invalid document'
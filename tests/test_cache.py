@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import datetime
+import time
+
+import pytest
+
+from geolink_formatter.cache import CacheEntry, DiskCache, MemoryCache
+from geolink_formatter.entity import Document, File
+
+
+def test_cache_entry():
+    entry = CacheEntry('value', etag='"abc"', last_modified='Mon, 01 Jan 2018 00:00:00 GMT')
+    assert entry.value == 'value'
+    assert entry.etag == '"abc"'
+    assert entry.last_modified == 'Mon, 01 Jan 2018 00:00:00 GMT'
+    assert entry.is_fresh(60)
+    assert entry.is_fresh(None)
+    assert not CacheEntry('value', timestamp=time.time() - 61).is_fresh(60)
+
+
+@pytest.fixture(params=['memory', 'disk'])
+def cache_factory(request, tmpdir):
+    def create(**kwargs):
+        if request.param == 'memory':
+            return MemoryCache(**kwargs)
+        return DiskCache(str(tmpdir.join('cache')), **kwargs)
+    return create
+
+
+def test_cache_get_set(cache_factory):
+    cache = cache_factory(ttl=60, max_entries=2)
+    assert cache.ttl == 60
+    assert cache.max_entries == 2
+    assert cache.get('a') is None
+    cache.set('a', CacheEntry('value a', etag='"a"'))
+    entry = cache.get('a')
+    assert entry.value == 'value a'
+    assert entry.etag == '"a"'
+    assert len(cache) == 1
+
+
+def test_cache_lru_eviction(cache_factory):
+    cache = cache_factory(max_entries=2)
+    cache.set('a', CacheEntry('value a'))
+    time.sleep(0.01)
+    cache.set('b', CacheEntry('value b'))
+    time.sleep(0.01)
+    assert cache.get('a').value == 'value a'
+    time.sleep(0.01)
+    cache.set('c', CacheEntry('value c'))
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert cache.get('a').value == 'value a'
+    assert cache.get('c').value == 'value c'
+
+
+def test_cache_clear(cache_factory):
+    cache = cache_factory()
+    cache.set('a', CacheEntry('value a'))
+    cache._record(hits=2, misses=1, revalidations=3)
+    assert (cache.hits, cache.misses, cache.revalidations) == (2, 1, 3)
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses, cache.revalidations) == (0, 0, 0)
+
+
+def test_disk_cache_documents(tmpdir):
+    documents = [Document(
+        [File(category='main', href='/api/attachments/1', title='test.pdf')],
+        id='1',
+        title='Document',
+        enactment_date=datetime.date(2017, 1, 15)
+    )]
+    DiskCache(str(tmpdir)).set('key', CacheEntry(documents))
+    cached = DiskCache(str(tmpdir)).get('key').value
+    assert cached[0].id == '1'
+    assert cached[0].title == 'Document'
+    assert cached[0].enactment_date == datetime.date(2017, 1, 15)
+    assert cached[0].files[0].href == '/api/attachments/1'
+
+
+def test_disk_cache_corrupt_entry(tmpdir):
+    cache = DiskCache(str(tmpdir))
+    cache.set('key', CacheEntry('value'))
+    with open(cache._path('key'), 'wb') as f:
+        f.write(b'')
+    assert cache.get('key') is None
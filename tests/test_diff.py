@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import pickle
+
+import pytest
+import requests_mock
+from lxml.etree import DocumentInvalid
+
+from geolink_formatter.diff import SnapshotDiffer
+from geolink_formatter.format import HTML
+from geolink_formatter.metrics import METRIC, MemorySink
+from geolink_formatter.parser import XML, DocumentFilter
+
+
+def _geolink(*documents):
+    return u'<geolinks>{0}</geolinks>'.format(u''.join(documents)).encode('utf-8')
+
+
+def _document(doc_id, title=u'Example', files=u''):
+    return u'<document id="{0}" doctype="decree" title="{1}">{2}</document>'.format(doc_id, title, files)
+
+
+_file = u'<file category="main" href="/api/attachments/1" title="example.pdf"/>'
+
+
+def _ids(documents):
+    return [document.id for document in documents]
+
+
+def test_diff_initial():
+    xml = _geolink(_document('1'), _document('2', files=_file))
+    diff = SnapshotDiffer().diff(None, xml)
+    assert _ids(diff.added) == ['1', '2']
+    assert diff.removed == [] and diff.changed == []
+    assert diff.has_changes
+    assert _ids(diff.snapshot.documents) == ['1', '2']
+    assert diff.snapshot.version == '1.2.0'
+    assert diff.snapshot.html == HTML.format(XML().from_string(xml))
+
+
+def test_diff_changes():
+    differ = SnapshotDiffer(XML(host_url='http://oereblex.test.com'))
+    previous = differ.snapshot(_geolink(_document('1'), _document('2'), _document('3', files=_file)))
+    xml = _geolink(_document('4'), _document('3'), _document('1'), _document('2', title=u'Changed'))
+    diff = differ.diff(previous, xml)
+    assert _ids(diff.added) == ['4']
+    assert _ids(diff.removed) == []
+    assert _ids(diff.changed) == ['3', '2']
+    assert diff.changed[0].files == []
+    assert diff.changed[1].title == u'Changed'
+    assert diff.snapshot.documents[2] is previous.documents[0]
+    assert diff.snapshot.html == HTML.format(XML(host_url='http://oereblex.test.com').from_string(xml))
+
+    diff = differ.diff(diff.snapshot, _geolink(_document('4'), _document('1')))
+    assert _ids(diff.removed) == ['3', '2']
+    assert diff.added == [] and diff.changed == []
+    assert diff.snapshot.html == HTML.format(XML().from_string(_geolink(_document('4'), _document('1'))))
+
+
+def test_diff_unchanged_not_parsed():
+    metrics = MemorySink()
+    differ = SnapshotDiffer(XML(metrics=metrics))
+    xml = _geolink(_document('1'), _document('2'))
+    previous = differ.snapshot(xml)
+    diff = differ.diff(previous, xml)
+    assert not diff.has_changes
+    assert diff.snapshot is previous
+    assert metrics.timings[METRIC.PARSE][0] == 1
+
+
+def test_diff_reformatted():
+    differ = SnapshotDiffer()
+    previous = differ.snapshot(_geolink(_document('1'), _document('2')))
+    diff = differ.diff(previous, b'<?xml version="1.0"?>\n' + _geolink(_document('2'), _document('1')))
+    assert not diff.has_changes
+    assert _ids(diff.snapshot.documents) == ['2', '1']
+
+
+def test_diff_document_filter():
+    differ = SnapshotDiffer(document_filter=DocumentFilter(doctype='edict'))
+    xml = _geolink(_document('1'), u'<document id="2" doctype="edict"/>')
+    assert _ids(differ.snapshot(xml).documents) == ['2']
+    previous = SnapshotDiffer().snapshot(xml)
+    assert _ids(differ.diff(previous, xml).added) == ['2']
+
+
+def test_diff_invalid():
+    differ = SnapshotDiffer()
+    previous = differ.snapshot(_geolink(_document('1')))
+    with pytest.raises(DocumentInvalid):
+        differ.diff(previous, b'<geolinks><document id="1" doctype="invalid"/></geolinks>')
+
+
+def test_diff_url():
+    differ = SnapshotDiffer()
+    with requests_mock.mock() as m:
+        m.get('http://oereblex.test.com/api/geolinks/1.xml', content=_geolink(_document('1')))
+        previous = differ.snapshot('http://oereblex.test.com/api/geolinks/1.xml')
+        m.get('http://oereblex.test.com/api/geolinks/1.xml', content=_geolink(_document('1'), _document('2')))
+        diff = differ.diff(previous, 'http://oereblex.test.com/api/geolinks/1.xml')
+    assert _ids(diff.added) == ['2']
+
+
+def test_diff_invalid_source():
+    with pytest.raises(TypeError):
+        SnapshotDiffer().snapshot(None)
+
+
+def test_snapshot_pickle():
+    differ = SnapshotDiffer()
+    previous = pickle.loads(pickle.dumps(differ.snapshot(_geolink(_document('1'), _document('2')))))
+    diff = differ.diff(previous, _geolink(_document('1', title=u'Changed'), _document('2')))
+    assert _ids(diff.changed) == ['1']
+    assert diff.added == [] and diff.removed == []
@@ -2,8 +2,10 @@
 import datetime
 
 import pytest
+from lxml.etree import fromstring
 
-from geolink_formatter.entity import File, Document
+from geolink_formatter.entity import File, Document, LazyDocument, LazyFile
+from geolink_formatter.parser import XML
 
 
 def test_file():
@@ -92,3 +94,28 @@ def test_document_invalid_abrogation_date():
 def test_document_invalid_files():
     with pytest.raises(TypeError):
         Document('invalid')
+
+
+def test_file_slots():
+    f = File()
+    assert not hasattr(f, '__dict__')
+    with pytest.raises(AttributeError):
+        f.undefined = 'value'
+
+
+def test_document_slots():
+    d = Document([])
+    assert not hasattr(d, '__dict__')
+    with pytest.raises(AttributeError):
+        d.undefined = 'value'
+
+
+def test_lazy_entity_slots():
+    element = fromstring(b'<document id="1" title="Lazy"><file href="/a.pdf" title="a.pdf"/></document>')
+    document = LazyDocument(element, '1', XML(host_url='http://oereblex.test.com'))
+    assert not hasattr(document, '__dict__')
+    assert document.title == 'Lazy'
+    assert document.enactment_date is None
+    assert isinstance(document.files[0], LazyFile)
+    assert not hasattr(document.files[0], '__dict__')
+    assert document.files[0].href == 'http://oereblex.test.com/a.pdf'
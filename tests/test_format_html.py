@@ -1,5 +1,13 @@
 # -*- coding: utf-8 -*-
+import datetime
+import io
+import types
+
+import pytest
+
+from geolink_formatter.entity import Document, File
 from geolink_formatter.format import HTML
+from geolink_formatter.parser import DocumentFilter
 
 
 def test_format_with_file(documents):
@@ -33,3 +41,68 @@ def test_format_archived(document_archived):
                    '<strike>Archived document (15.01.2017)</strike> (01.01.2019)' \
                    '</li>' \
                    '</ul>'
+
+
+def test_iter_format(documents, document_archived):
+    fragments = HTML.iter_format(iter(documents + document_archived))
+    assert isinstance(fragments, types.GeneratorType)
+    fragments = list(fragments)
+    assert len(fragments) == 4
+    assert fragments[0] == '<ul class="geolink-formatter">'
+    assert fragments[-1] == '</ul>'
+    assert ''.join(fragments) == HTML.format(documents + document_archived)
+
+
+def test_iter_format_empty():
+    assert list(HTML.iter_format([])) == ['<ul class="geolink-formatter">', '</ul>']
+
+
+def test_write_to(documents):
+    fileobj = io.StringIO()
+    HTML.write_to(documents, fileobj)
+    assert fileobj.getvalue() == HTML.format(documents)
+
+
+def test_write_to_encoded(documents):
+    fileobj = io.BytesIO()
+    HTML.write_to(documents, fileobj, encoding='utf-8')
+    assert fileobj.getvalue() == HTML.format(documents).encode('utf-8')
+
+
+@pytest.mark.parametrize('kwargs,expected', [
+    ({'type': 'Type'}, 'Type: None  '),
+    ({'subtype': 'Subtype', 'title': 'Title'}, ' (Subtype): Title  '),
+    ({'type': 'Type', 'subtype': 'Subtype', 'title': u'Tïtle', 'enactment_date': datetime.date(2001, 3, 27)},
+     u'Type (Subtype): Tïtle (27.03.2001) '),
+    ({'title': 'Title', 'abrogation_date': datetime.date(2008, 12, 31)},
+     '<strike>Title </strike> (31.12.2008)')
+])
+def test_format_document(kwargs, expected):
+    html = HTML.format([Document([], **kwargs)])
+    assert html == u'<ul class="geolink-formatter">' \
+                   u'<li class="geolink-formatter-document">{0}</li>' \
+                   u'</ul>'.format(expected)
+
+
+def test_format_file_fallback():
+    html = HTML.format([Document([File(href='/api/attachments/1', title='test.pdf', description=''),
+                                  File(title='test.pdf')], title='Title')])
+    assert html == '<ul class="geolink-formatter"><li class="geolink-formatter-document">Title  ' \
+                   '<ul class="geolink-formatter">' \
+                   '<li class="geolink-formatter-file">' \
+                   '<a href="/api/attachments/1" target="_blank">test.pdf</a>' \
+                   '</li>' \
+                   '<li class="geolink-formatter-file">' \
+                   '<a href="None" target="_blank">test.pdf</a>' \
+                   '</li>' \
+                   '</ul>' \
+                   '</li></ul>'
+
+
+@pytest.mark.parametrize('abrogated,expected', [(None, 2), (True, 1), (False, 1)])
+def test_format_document_filter(documents, document_archived, abrogated, expected):
+    html = HTML.format(documents + document_archived, document_filter=DocumentFilter(abrogated=abrogated))
+    assert html.count(u'<li class="geolink-formatter-document">') == expected
+    stream = io.StringIO()
+    HTML.write_to(documents + document_archived, stream, document_filter=DocumentFilter(abrogated=abrogated))
+    assert stream.getvalue() == html
@@ -1,7 +1,22 @@
 # -*- coding: utf-8 -*-
+import subprocess
+import sys
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
+
 import pytest
+import requests_mock
+from lxml.etree import DocumentInvalid
+from requests import HTTPError, Session
 
 from geolink_formatter import GeoLinkFormatter
+from geolink_formatter.cache import MemoryCache
+from geolink_formatter.format import HTML
+from geolink_formatter.parser import XML, DocumentFilter, LimitExceededError, NeverValidate, \
+    TrustedSourceValidation
 
 
 def test_init():
@@ -101,3 +116,163 @@ def test_html_url(mock_request):
 def test_html_invalid_source():
     with pytest.raises(TypeError):
         GeoLinkFormatter().html(1)
+
+
+def test_html_reuses_parser_and_formatter():
+    formatter = GeoLinkFormatter(host_url='http://example.com', version='1.1.1')
+    parser = formatter._parser
+    html_formatter = formatter._formatter
+    assert parser.host_url == 'http://example.com'
+    assert parser._version == '1.1.1'
+    with open('tests/resources/geolink_v1.1.1.xml', 'rb') as f:
+        formatter.html(f.read())
+    assert formatter._parser is parser
+    assert formatter._formatter is html_formatter
+
+
+def test_html_many(mock_request, geolink_v1_2_0):
+    formatter = GeoLinkFormatter()
+    with mock_request():
+        html = formatter.html_many([geolink_v1_2_0, 'http://oereblex.test.com/api/geolinks/1500.xml'])
+    assert len(html) == 2
+    assert html[0] == html[1] == formatter.html(geolink_v1_2_0)
+
+
+def test_html_many_errors(mock_request):
+    with mock_request() as m:
+        m.get('http://oereblex.test.com/api/geolinks/1501.xml', text='error', status_code=500)
+        html = GeoLinkFormatter().html_many([
+            'http://oereblex.test.com/api/geolinks/1500.xml',
+            1,
+            'http://oereblex.test.com/api/geolinks/1501.xml',
+            'http://oereblex.test.com/api/geolinks/1500.xml'
+        ], max_workers=2)
+    assert len(html) == 4
+    assert html[0].startswith(u'<ul class="geolink-formatter">')
+    assert isinstance(html[1], TypeError)
+    assert isinstance(html[2], HTTPError)
+    assert html[3] == html[0]
+
+
+def test_streaming_equals_html(geolink_v1_2_0):
+    fragments = HTML.iter_format(XML().iter_documents(geolink_v1_2_0))
+    assert u''.join(fragments) == GeoLinkFormatter().html(geolink_v1_2_0)
+
+
+def test_session(mock_request):
+    session = Session()
+    with GeoLinkFormatter(session=session) as formatter:
+        assert formatter._parser.session is session
+        with mock_request():
+            formatter.html('http://oereblex.test.com/api/geolinks/1500.xml')
+
+
+def test_close():
+    formatter = GeoLinkFormatter()
+    session = formatter._parser.session
+    with mock.patch.object(session, 'close') as close:
+        formatter.close()
+        close.assert_called_once_with()
+
+
+def test_html_cache(mock_request, geolink_v1_2_0):
+    html_cache = MemoryCache(ttl=None, max_entries=10)
+    formatter = GeoLinkFormatter(html_cache=html_cache)
+    html = formatter.html(geolink_v1_2_0)
+    assert html == GeoLinkFormatter().html(geolink_v1_2_0)
+    with mock.patch.object(formatter._parser, '_parse') as parse:
+        assert formatter.html(geolink_v1_2_0) == html
+        with mock_request():
+            assert formatter.html('http://oereblex.test.com/api/geolinks/1500.xml') == html
+        parse.assert_not_called()
+    assert (html_cache.hits, html_cache.misses) == (2, 1)
+    formatter = GeoLinkFormatter(host_url='http://oereblex.test.com', html_cache=html_cache)
+    assert formatter.html(geolink_v1_2_0) != html
+    assert html_cache.misses == 2
+    assert len(html_cache) == 2
+
+
+def test_html_cache_with_document_cache(geolink_v1_2_0):
+    url = 'http://oereblex.test.com/api/geolinks/1500.xml'
+    cache = MemoryCache(ttl=0)
+    formatter = GeoLinkFormatter(cache=cache, html_cache=MemoryCache())
+    with requests_mock.mock() as m:
+        m.get(url, content=geolink_v1_2_0, headers={'ETag': '"1"'})
+        html = formatter.html(url)
+        m.get(url, status_code=304)
+        with mock.patch.object(formatter._parser, '_parse') as parse:
+            assert formatter.html(url) == html
+            parse.assert_not_called()
+        assert m.last_request.headers['If-None-Match'] == '"1"'
+    assert (cache.misses, cache.revalidations) == (1, 1)
+    cache._ttl = None
+    with requests_mock.mock() as m:
+        assert formatter.html(url) == html
+        assert m.call_count == 0
+    assert cache.hits == 1
+
+
+def test_html_cache_string(geolink_v1_2_0):
+    html_cache = MemoryCache()
+    xml = geolink_v1_2_0.decode('utf-8').replace('encoding="utf-8"', '')
+    formatter = GeoLinkFormatter(html_cache=html_cache)
+    assert formatter.html(xml) == formatter.html(xml) == GeoLinkFormatter().html(xml)
+    assert (html_cache.hits, html_cache.misses) == (1, 1)
+
+
+def test_html_cache_error():
+    with mock.patch('geolink_formatter.parser.XML._fetch', side_effect=HTTPError()):
+        with pytest.raises(HTTPError):
+            GeoLinkFormatter(html_cache=MemoryCache()).html('http://oereblex.test.com/api/geolinks/1501.xml')
+
+
+def test_html_limits(geolink_v1_2_0):
+    with pytest.raises(LimitExceededError):
+        GeoLinkFormatter(max_documents=1).html(geolink_v1_2_0)
+
+
+def test_html_validation():
+    xml = b'<geolinks><document doctype="invalid" id="1" title="Invalid"/></geolinks>'
+    with pytest.raises(DocumentInvalid):
+        GeoLinkFormatter().html(xml)
+    assert 'Invalid' in GeoLinkFormatter(xsd_validation=False).html(xml)
+    assert 'Invalid' in GeoLinkFormatter(xsd_validation=NeverValidate()).html(xml)
+
+
+def test_html_version_auto():
+    formatter = GeoLinkFormatter(version='auto')
+    for version in ('1.0.0', '1.1.1', '1.2.0'):
+        with open('tests/resources/geolink_v{0}.xml'.format(version), 'rb') as f:
+            xml = f.read()
+        assert formatter.html(xml) == GeoLinkFormatter(version=version).html(xml)
+    with pytest.raises(DocumentInvalid):
+        formatter.html(b'<geolinks><document doctype="invalid" id="1" title="Invalid"/></geolinks>')
+
+
+@pytest.mark.parametrize('html_cache', [None, MemoryCache()])
+def test_html_validation_trusted_source(html_cache):
+    xml = b'<geolinks><document doctype="invalid" id="1" title="Invalid"/></geolinks>'
+    formatter = GeoLinkFormatter(html_cache=html_cache,
+                                 xsd_validation=TrustedSourceValidation(['http://oereblex.test.com/']))
+    with pytest.raises(DocumentInvalid):
+        formatter.html(xml)
+    with requests_mock.mock() as m:
+        m.get('http://oereblex.test.com/api/geolinks/1.xml', content=xml)
+        assert 'Invalid' in formatter.html('http://oereblex.test.com/api/geolinks/1.xml')
+
+
+@pytest.mark.parametrize('html_cache', [None, MemoryCache()])
+def test_html_document_filter(html_cache, geolink_v1_2_0):
+    document_filter = DocumentFilter(doctype='edict', federal_level='Kanton')
+    formatter = GeoLinkFormatter(html_cache=html_cache)
+    expected = HTML.format(XML().from_string(geolink_v1_2_0), document_filter=document_filter)
+    assert formatter.html(geolink_v1_2_0, document_filter=document_filter) == expected
+    assert formatter.html(geolink_v1_2_0) != expected
+    assert formatter.html_many([geolink_v1_2_0], document_filter=document_filter) == [expected]
+
+
+def test_import_loads_http_modules_lazily():
+    code = 'import sys, geolink_formatter; print(" ".join(sorted(sys.modules)))'
+    modules = subprocess.check_output([sys.executable, '-c', code]).decode('utf-8').split()
+    for module in ('requests', 'pkg_resources', 'concurrent.futures'):
+        assert module not in modules
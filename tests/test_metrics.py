@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import socket
+from io import BytesIO
+
+import pytest
+import requests_mock
+
+from geolink_formatter import GeoLinkFormatter
+from geolink_formatter.cache import MemoryCache
+from geolink_formatter.metrics import METRIC, MemorySink, MetricsSink, StatsdSink
+from geolink_formatter.parser import XML
+
+
+def test_metrics_sink():
+    sink = MetricsSink()
+    sink.timing(METRIC.PARSE, 0.1)
+    sink.increment(METRIC.DOCUMENTS)
+
+
+def test_memory_sink():
+    sink = MemorySink()
+    sink.timing(METRIC.PARSE, 0.5)
+    sink.timing(METRIC.PARSE, 0.25)
+    sink.increment(METRIC.DOCUMENTS)
+    sink.increment(METRIC.DOCUMENTS, 4)
+    assert sink.timings == {METRIC.PARSE: (2, 0.75)}
+    assert sink.counters == {METRIC.DOCUMENTS: 5}
+    sink.clear()
+    assert sink.timings == {}
+    assert sink.counters == {}
+
+
+def test_statsd_sink():
+    collector = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    collector.bind(('127.0.0.1', 0))
+    collector.settimeout(5)
+    sink = StatsdSink(port=collector.getsockname()[1], prefix='test')
+    try:
+        sink.timing(METRIC.FETCH, 0.0125)
+        sink.increment(METRIC.CACHE_HIT)
+        assert collector.recv(1024) == b'test.fetch:12.500|ms'
+        assert collector.recv(1024) == b'test.cache.hit:1|c'
+    finally:
+        sink.close()
+        collector.close()
+
+
+def test_xml_metrics(geolink_v1_2_0):
+    sink = MemorySink()
+    XML(metrics=sink).from_string(geolink_v1_2_0)
+    assert set(sink.timings) == {METRIC.PARSE, METRIC.VALIDATE, METRIC.ENTITIES}
+    assert sink.counters == {METRIC.BYTES: len(geolink_v1_2_0), METRIC.DOCUMENTS: 5, METRIC.FILES: 9}
+
+
+def test_xml_metrics_file(geolink_v1_2_0):
+    sink = MemorySink()
+    XML(metrics=sink).from_string(BytesIO(geolink_v1_2_0))
+    assert set(sink.timings) == {METRIC.PARSE, METRIC.VALIDATE, METRIC.ENTITIES}
+    assert sink.counters == {METRIC.BYTES: len(geolink_v1_2_0), METRIC.DOCUMENTS: 5, METRIC.FILES: 9}
+
+
+@pytest.mark.parametrize('wrap', [bytes, BytesIO])
+def test_xml_metrics_iter_documents(wrap, geolink_v1_2_0):
+    sink = MemorySink()
+    documents = list(XML(metrics=sink).iter_documents(wrap(geolink_v1_2_0)))
+    assert len(documents) == 5
+    assert set(sink.timings) == {METRIC.PARSE, METRIC.ENTITIES}
+    assert sink.counters == {METRIC.BYTES: len(geolink_v1_2_0), METRIC.DOCUMENTS: 5, METRIC.FILES: 9}
+
+
+def test_xml_metrics_iter_documents_closed(geolink_v1_2_0):
+    sink = MemorySink()
+    documents = XML(metrics=sink).iter_documents(geolink_v1_2_0)
+    next(documents)
+    assert sink.counters == {}
+    documents.close()
+    assert set(sink.timings) == {METRIC.PARSE, METRIC.ENTITIES}
+    assert sink.counters[METRIC.DOCUMENTS] == 1
+    assert 0 < sink.counters[METRIC.BYTES] <= len(geolink_v1_2_0)
+
+
+def test_xml_metrics_cache(geolink_v1_2_0):
+    sink = MemorySink()
+    parser = XML(metrics=sink, cache=MemoryCache())
+    with requests_mock.mock() as m:
+        m.get('http://oereblex.test.com/api/geolinks/1500.xml', content=geolink_v1_2_0)
+        parser.from_url('http://oereblex.test.com/api/geolinks/1500.xml')
+        parser.from_url('http://oereblex.test.com/api/geolinks/1500.xml')
+    assert sink.timings[METRIC.FETCH][0] == 1
+    assert sink.counters[METRIC.CACHE_MISS] == 1
+    assert sink.counters[METRIC.CACHE_HIT] == 1
+
+
+@pytest.mark.parametrize('html_cache', [None, MemoryCache()])
+def test_formatter_metrics(html_cache, geolink_v1_2_0):
+    sink = MemorySink()
+    formatter = GeoLinkFormatter(metrics=sink, html_cache=html_cache)
+    with requests_mock.mock() as m:
+        m.get('http://oereblex.test.com/api/geolinks/1500.xml', content=geolink_v1_2_0)
+        formatter.html('http://oereblex.test.com/api/geolinks/1500.xml')
+    assert set(sink.timings) == set(METRIC.STAGES)
+    assert all(count == 1 for count, _ in sink.timings.values())
+    if html_cache is not None:
+        formatter.html(geolink_v1_2_0)
+        assert sink.counters[METRIC.HTML_CACHE_MISS] == 1
+        assert sink.counters[METRIC.HTML_CACHE_HIT] == 1
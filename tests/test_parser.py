@@ -1,10 +1,27 @@
 # -*- coding: utf-8 -*-
+import datetime
+import io
+import pickle
+import time
+import types
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
+
 import pytest
 import requests_mock
-from lxml.etree import _Element, DocumentInvalid
-from requests import RequestException
+from defusedxml import EntitiesForbidden
+from lxml.etree import _Element, DocumentInvalid, XMLSchema, XMLSyntaxError
+from requests import HTTPError, RequestException, Session
 
-from geolink_formatter.parser import XML, SCHEMA
+from geolink_formatter.cache import MemoryCache
+from geolink_formatter.entity import Document
+from geolink_formatter.format import HTML
+from geolink_formatter.parser import XML, SCHEMA, DocumentFilter, DocumentList, DocumentView, \
+    FirstSightValidation, LimitExceededError, NeverValidate, SampledValidation, SchemaRegistry, \
+    TrustedSourceValidation, ValidationPolicy, create_session, schema_registry
 
 
 def test_xml_init():
@@ -185,10 +202,9 @@ def test_schema_version_1_1_1():
     assert documents[0].abrogation_date is None
 
 
-def test_schema_version_1_2_0():
+def test_schema_version_1_2_0(geolink_v1_2_0):
     with requests_mock.mock() as m:
-        with open('tests/resources/geolink_v1.2.0.xml', 'rb') as f:
-            m.get('http://oereblex.test.com/api/geolinks/1500.xml', content=f.read())
+        m.get('http://oereblex.test.com/api/geolinks/1500.xml', content=geolink_v1_2_0)
         documents = XML(version=SCHEMA.V1_2_0).from_url('http://oereblex.test.com/api/geolinks/1500.xml')
     assert len(documents) == 5
     assert documents[-1].doctype == 'notice'
@@ -208,10 +224,9 @@ def test_schema_version_1_1_1_with_bezirk():
     assert documents[0].federal_level == 'Bezirk'
 
 
-def test_default_version_with_locale():
+def test_default_version_with_locale(geolink_v1_2_0):
     with requests_mock.mock() as m:
-        with open('tests/resources/geolink_v1.2.0.xml', 'rb') as f:
-            m.get('http://oereblex.test.com/api/geolinks/1500.xml?locale=fr', content=f.read())
+        m.get('http://oereblex.test.com/api/geolinks/1500.xml?locale=fr', content=geolink_v1_2_0)
         documents = XML().from_url('http://oereblex.test.com/api/geolinks/1500.xml', {'locale': 'fr'})
     assert documents[0].number == '1A'
     assert documents[0].abbreviation == 'abbr'
@@ -234,3 +249,729 @@ def test_dtd_validation_invalid():
             <root></root>
             """
         )
+
+
+def test_schema_registry():
+    registry = SchemaRegistry()
+    assert registry.hits == 0
+    assert registry.misses == 0
+    schema = registry.get(SCHEMA.V1_2_0)
+    assert isinstance(schema, XMLSchema)
+    assert registry.misses == 1
+    assert registry.get(SCHEMA.V1_2_0) is schema
+    assert registry.hits == 1
+    assert registry.misses == 1
+
+
+def test_schema_registry_warm_up():
+    registry = SchemaRegistry()
+    registry.warm_up()
+    assert registry.misses == len(SCHEMA.ALL)
+    for version in SCHEMA.ALL:
+        registry.get(version)
+    assert registry.hits == len(SCHEMA.ALL)
+    registry.clear()
+    assert registry.hits == 0
+    assert registry.misses == 0
+
+
+def test_schema_registry_invalid_version():
+    with pytest.raises(IOError):
+        SchemaRegistry().get('0.0.0')
+
+
+def test_schema_registry_shared():
+    assert XML()._schema is XML()._schema
+    assert XML(version=SCHEMA.V1_1_1)._schema is schema_registry.get(SCHEMA.V1_1_1)
+
+
+def test_xml_duplicate_document_first_wins():
+    xml = """<?xml version="1.0" encoding="utf-8"?>
+    <geolinks>
+        <document doctype='decree' id='1' title='First'></document>
+        <document doctype='notice' id='1' title='Notice'></document>
+        <document doctype='decree' id='1' title='Second'></document>
+        <document doctype='notice' id='1' title='Another notice'></document>
+        <document doctype='edict' id='2' title='Edict'></document>
+    </geolinks>
+    """
+    documents = XML().from_string(xml)
+    assert [(document.id, document.title) for document in documents] == [
+        ('1', 'First'),
+        ('1notice', 'Notice'),
+        ('2', 'Edict')
+    ]
+
+
+@pytest.mark.parametrize('version', SCHEMA.ALL)
+def test_iter_documents(version):
+    resource = 'tests/resources/geolink_v{0}.xml'.format(version)
+    parser = XML(host_url='http://oereblex.test.com', version=version)
+    with open(resource, 'rb') as f:
+        xml = f.read()
+    expected = parser.from_string(xml)
+    with open(resource, 'rb') as f:
+        documents = parser.iter_documents(f)
+        assert isinstance(documents, types.GeneratorType)
+        documents = list(documents)
+    assert len(documents) == len(expected)
+    for document, expected_document in zip(documents, expected):
+        assert document.id == expected_document.id
+        assert document.title == expected_document.title
+        assert document.enactment_date == expected_document.enactment_date
+        assert [f.href for f in document.files] == [f.href for f in expected_document.files]
+
+
+@pytest.mark.parametrize('as_bytes', [False, True])
+def test_iter_documents_string(as_bytes):
+    xml = u"""<?xml version="1.0" encoding="utf-8"?>
+    <geolinks>
+        <document doctype='decree' id='1' title='Fïrst'></document>
+        <document doctype='notice' id='1' title='Notice'></document>
+        <document doctype='decree' id='1' title='Second'></document>
+    </geolinks>
+    """
+    if as_bytes:
+        xml = xml.encode('utf-8')
+    documents = list(XML().iter_documents(xml))
+    assert [(document.id, document.title) for document in documents] == [
+        ('1', u'Fïrst'),
+        ('1notice', 'Notice')
+    ]
+
+
+def test_iter_documents_invalid():
+    xml = b"""<?xml version="1.0" encoding="utf-8"?>
+    <geolinks>
+        <document doctype='decree' id='1' title='Valid'></document>
+        <document doctype='invalid' id='2' title='Invalid'></document>
+    </geolinks>
+    """
+    with pytest.raises(XMLSyntaxError):
+        list(XML().iter_documents(xml))
+
+
+def test_iter_documents_entities_forbidden():
+    xml = b"""<?xml version="1.0" encoding="utf-8"?>
+    <!DOCTYPE geolinks [<!ENTITY title "Entity">]>
+    <geolinks>
+        <document doctype='decree' id='1' title='&title;'></document>
+    </geolinks>
+    """
+    with pytest.raises(EntitiesForbidden):
+        list(XML().iter_documents(xml))
+
+
+def test_iter_documents_dtd_validation_invalid():
+    xml = b"""<?xml version="1.0" encoding="utf-8"?>
+    <geolinks>
+        <document doctype='decree' id='1' title='Document'></document>
+    </geolinks>
+    """
+    with pytest.raises(DocumentInvalid):
+        list(XML(dtd_validation=True).iter_documents(xml))
+
+
+def test_create_session():
+    session = create_session(pool_size=4, keep_alive=False, max_retries=3, backoff_factor=0.5)
+    assert isinstance(session, Session)
+    adapter = session.get_adapter('https://oereblex.test.com')
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.backoff_factor == 0.5
+    assert session.headers['Connection'] == 'close'
+    session.close()
+
+
+def test_xml_session_owned(mock_request):
+    with XML() as parser:
+        session = parser.session
+        assert isinstance(session, Session)
+        assert parser.session is session
+        with mock_request():
+            assert len(parser.from_url('http://oereblex.test.com/api/geolinks/1500.xml')) == 5
+        with mock_request():
+            assert len(parser.from_url('http://oereblex.test.com/api/geolinks/1500.xml')) == 5
+        assert parser.session is session
+    assert parser._session is None
+
+
+def test_xml_session_injected(mock_request):
+    session = Session()
+    with mock.patch.object(session, 'close') as close:
+        with XML(session=session) as parser:
+            assert parser.session is session
+            with mock_request() as m:
+                parser.from_url('http://oereblex.test.com/api/geolinks/1500.xml')
+                assert m.call_count == 1
+        assert parser.session is session
+        close.assert_not_called()
+
+
+@pytest.mark.parametrize('cache', [None, MemoryCache()])
+@pytest.mark.parametrize('status_code', [204, 304])
+def test_xml_from_url_unexpected_status(cache, status_code):
+    url = 'http://oereblex.test.com/api/geolinks/1500.xml'
+    parser = XML(cache=cache)
+    with requests_mock.mock() as m:
+        m.get(url, status_code=status_code)
+        with pytest.raises(HTTPError):
+            parser.from_url(url, headers={'If-None-Match': '"1"'})
+        with pytest.raises(HTTPError):
+            parser._fetch(url)
+
+
+def test_xml_session_created_once(mock_request):
+    sessions = list()
+
+    def slow_session():
+        time.sleep(0.05)
+        sessions.append(create_session())
+        return sessions[-1]
+
+    urls = ['http://oereblex.test.com/api/geolinks/1500.xml'] * 10
+    with mock.patch('geolink_formatter.parser.create_session', slow_session):
+        with XML() as parser, mock_request():
+            results = parser.from_urls(urls, max_workers=10)
+    assert all(len(result) == 5 for result in results)
+    assert len(sessions) == 1
+
+
+def test_xml_from_urls(mock_request):
+    urls = ['http://oereblex.test.com/api/geolinks/{0}.xml'.format(i) for i in (1500, 1501, 1502, 1500)]
+    with mock_request() as m:
+        m.get(urls[1], text='error', status_code=500)
+        m.get(urls[2], text='<invalid/>')
+        with XML() as parser:
+            results = parser.from_urls(urls, params={'locale': 'de'}, max_workers=3)
+        assert m.call_count == 4
+        assert all(request.qs == {'locale': ['de']} for request in m.request_history)
+    assert len(results) == 4
+    assert len(results[0]) == 5
+    assert isinstance(results[1], RequestException)
+    assert isinstance(results[2], DocumentInvalid)
+    assert [document.id for document in results[3]] == [document.id for document in results[0]]
+
+
+def test_xml_from_urls_empty():
+    assert XML().from_urls([]) == []
+
+
+def test_xml_from_url_cached(mock_request):
+    cache = MemoryCache(ttl=60)
+    url = 'http://oereblex.test.com/api/geolinks/1500.xml'
+    with mock_request() as m:
+        parser = XML(cache=cache)
+        assert parser.cache is cache
+        first = parser.from_url(url, {'locale': 'de'})
+        second = parser.from_url(url, {'locale': 'de'})
+        XML(cache=cache).from_url(url, {'locale': 'fr'})
+        XML(cache=cache, host_url='http://oereblex.test.com').from_url(url, {'locale': 'de'})
+        assert m.call_count == 3
+    assert [document.id for document in first] == [document.id for document in second]
+    assert first is not second
+    assert (cache.hits, cache.misses, cache.revalidations) == (1, 3, 0)
+
+
+@pytest.mark.parametrize('response_headers,request_header', [
+    ({'ETag': '"v1"'}, ('If-None-Match', '"v1"')),
+    ({'Last-Modified': 'Mon, 01 Jan 2018 00:00:00 GMT'},
+     ('If-Modified-Since', 'Mon, 01 Jan 2018 00:00:00 GMT'))
+])
+def test_xml_from_url_cache_revalidation(response_headers, request_header, geolink_v1_2_0):
+    cache = MemoryCache(ttl=0)
+    url = 'http://oereblex.test.com/api/geolinks/1500.xml'
+    parser = XML(cache=cache)
+    with requests_mock.mock() as m:
+        m.get(url, content=geolink_v1_2_0, headers=response_headers)
+        documents = parser.from_url(url)
+        m.get(url, status_code=304, request_headers=dict([request_header]))
+        with mock.patch.object(parser, '_parse') as parse:
+            revalidated = parser.from_url(url)
+            parse.assert_not_called()
+        m.get(url, content=geolink_v1_2_0)
+        changed = parser.from_url(url)
+    assert [document.id for document in revalidated] == [document.id for document in documents]
+    assert len(changed) == len(documents)
+    assert (cache.hits, cache.misses, cache.revalidations) == (0, 2, 1)
+
+
+def test_xml_from_url_cache_error():
+    cache = MemoryCache()
+    with requests_mock.mock() as m:
+        m.get('http://oereblex.test.com/api/geolinks/1501.xml', text='error', status_code=500)
+        with pytest.raises(RequestException):
+            XML(cache=cache).from_url('http://oereblex.test.com/api/geolinks/1501.xml')
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize('value', [
+    '2001-03-27', '1999-12-31', '2000-02-29', '2001-3-7', '2001-03-7'
+])
+def test_parse_date(value):
+    expected = datetime.datetime.strptime(value, '%Y-%m-%d').date()
+    assert XML._parse_date(value) == expected
+    assert XML._parse_date(value) == expected
+
+
+@pytest.mark.parametrize('value', [
+    '2001-02-30', '2001-13-01', '2001-00-10', '2001/03/27', '27.03.2001', '2001-03-27T00:00:00',
+    ' 2001-03-27', '+001-03-27', '2001-+3-27', '2001- 3-27', '2001-03-2 ', '20010327', 'invalid'
+])
+def test_parse_date_invalid(value):
+    with pytest.raises(ValueError) as expected:
+        datetime.datetime.strptime(value, '%Y-%m-%d')
+    with pytest.raises(ValueError) as error:
+        XML._parse_date(value)
+    assert str(error.value) == str(expected.value)
+
+
+@pytest.mark.parametrize('wrap', [bytes, bytearray, memoryview, io.BytesIO])
+def test_xml_parse_binary(wrap, geolink_v1_2_0):
+    documents = XML().from_string(wrap(geolink_v1_2_0))
+    assert len(documents) == 5
+    assert documents[1].title == u'Planungs- und Baugesetz'
+
+
+@pytest.mark.parametrize('wrap', [bytearray, memoryview])
+def test_xml_parse_buffer_legacy_lxml(wrap, geolink_v1_2_0):
+    from geolink_formatter.parser import fromstring as original
+
+    def fromstring(text, **kwargs):
+        # lxml before version 6 only accepts bytes and text
+        if not isinstance(text, (bytes, type(u''))):
+            raise ValueError('can only parse strings')
+        return original(text, **kwargs)
+
+    with mock.patch('geolink_formatter.parser.fromstring', fromstring):
+        assert len(XML().from_string(wrap(geolink_v1_2_0))) == 5
+
+
+@pytest.mark.parametrize('declaration', [
+    u'',
+    u'<?xml version="1.0"?>',
+    u'<?xml version="1.0" encoding="utf-8"?>',
+    u'<?xml version="1.0" encoding="iso-8859-1"?>'
+])
+def test_xml_parse_text(declaration):
+    xml = declaration + u"""
+    <geolinks>
+        <document doctype='decree' id='1' title='Tiefkühllager – Ärger'></document>
+    </geolinks>
+    """
+    documents = XML().from_string(xml)
+    assert documents[0].title == u'Tiefkühllager – Ärger'
+    documents = list(XML().iter_documents(xml))
+    assert documents[0].title == u'Tiefkühllager – Ärger'
+
+
+def test_xml_parse_text_entities_forbidden():
+    xml = u"""<?xml version="1.0" encoding="utf-8"?>
+    <!DOCTYPE geolinks [<!ENTITY title "Entity">]>
+    <geolinks>
+        <document doctype='decree' id='1' title='&title;'></document>
+    </geolinks>
+    """
+    with pytest.raises(EntitiesForbidden):
+        XML().from_string(xml)
+
+
+def _geolink_v1_1_1():
+    with open('tests/resources/geolink_v1.1.1.xml', 'rb') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('wrap', [bytes, bytearray, memoryview, io.BytesIO, lambda xml: xml.decode('utf-8')])
+def test_xml_max_bytes(wrap, geolink_v1_2_0):
+    size = len(geolink_v1_2_0)
+    assert len(XML(max_bytes=size).from_string(wrap(geolink_v1_2_0))) == 5
+    with pytest.raises(LimitExceededError) as error:
+        XML(max_bytes=size // 2).from_string(wrap(geolink_v1_2_0))
+    assert error.value.limit == 'max_bytes'
+    assert error.value.maximum == size // 2
+    assert str(error.value) == 'Limit "max_bytes" exceeded: the maximum is {0}'.format(size // 2)
+
+
+def test_xml_max_documents(geolink_v1_2_0):
+    assert len(XML(max_documents=5).from_string(geolink_v1_2_0)) == 5
+    with pytest.raises(LimitExceededError) as error:
+        XML(max_documents=4).from_string(geolink_v1_2_0)
+    assert error.value.limit == 'max_documents'
+
+
+def test_xml_max_documents_before_validation():
+    xml = b'<geolinks><document doctype="invalid"/><document doctype="invalid"/></geolinks>'
+    with pytest.raises(LimitExceededError):
+        XML(max_documents=1).from_string(xml)
+
+
+def test_xml_max_files(geolink_v1_2_0):
+    assert len(XML(max_files=5).from_string(geolink_v1_2_0)) == 5
+    with pytest.raises(LimitExceededError) as error:
+        XML(max_files=4).from_string(geolink_v1_2_0)
+    assert error.value.limit == 'max_files'
+
+
+@pytest.mark.parametrize('limits,limit', [
+    ({'max_bytes': 1000}, 'max_bytes'),
+    ({'max_documents': 4}, 'max_documents'),
+    ({'max_files': 4}, 'max_files')
+])
+def test_iter_documents_limits(limits, limit, geolink_v1_2_0):
+    with pytest.raises(LimitExceededError) as error:
+        list(XML(**limits).iter_documents(io.BytesIO(geolink_v1_2_0)))
+    assert error.value.limit == limit
+
+
+def test_xml_from_url_max_bytes(mock_request, geolink_v1_2_0):
+    size = len(geolink_v1_2_0)
+    with mock_request():
+        assert len(XML(max_bytes=size).from_url('http://oereblex.test.com/api/geolinks/1500.xml')) == 5
+        with pytest.raises(LimitExceededError):
+            XML(max_bytes=size - 1).from_url('http://oereblex.test.com/api/geolinks/1500.xml')
+
+
+def test_xml_from_url_max_bytes_content_length():
+    with requests_mock.mock() as m:
+        m.get('http://oereblex.test.com/api/geolinks/1500.xml', content=b'',
+              headers={'Content-Length': '100'})
+        with pytest.raises(LimitExceededError):
+            XML(max_bytes=10).from_url('http://oereblex.test.com/api/geolinks/1500.xml')
+
+
+def test_limit_exceeded_error_pickle():
+    error = pickle.loads(pickle.dumps(LimitExceededError('max_files', 4)))
+    assert error.limit == 'max_files'
+    assert error.maximum == 4
+
+
+_invalid_geolink = b"""<?xml version="1.0" encoding="utf-8"?>
+<geolinks>
+    <document doctype='invalid' id='1' title='Invalid'></document>
+</geolinks>
+"""
+
+
+@pytest.mark.parametrize('xsd_validation,policy', [
+    (True, ValidationPolicy),
+    (False, NeverValidate)
+])
+def test_xml_validation_policy_from_flag(xsd_validation, policy):
+    assert type(XML(xsd_validation=xsd_validation).xsd_validation) is policy
+
+
+def test_xml_validation_never():
+    policy = NeverValidate()
+    documents = XML(xsd_validation=policy).from_string(_invalid_geolink)
+    assert documents[0].doctype == 'invalid'
+    assert (policy.validated, policy.skipped) == (0, 1)
+
+
+def test_xml_validation_override():
+    with pytest.raises(DocumentInvalid):
+        XML(xsd_validation=False).from_string(_invalid_geolink, validation=True)
+    assert len(XML().from_string(_invalid_geolink, validation=False)) == 1
+
+
+@pytest.mark.parametrize('rate,validated', [(0.0, 0), (1.0, 10)])
+def test_xml_validation_sampled(rate, validated, geolink_v1_2_0):
+    policy = SampledValidation(rate)
+    parser = XML(xsd_validation=policy)
+    for _ in range(10):
+        parser.from_string(geolink_v1_2_0)
+    assert (policy.validated, policy.skipped) == (validated, 10 - validated)
+
+
+def test_xml_validation_sampled_reports_failures():
+    policy = SampledValidation(0.5, seed=1)
+    parser = XML(xsd_validation=policy)
+    failures = 0
+    for _ in range(20):
+        try:
+            parser.from_string(_invalid_geolink)
+        except DocumentInvalid:
+            failures += 1
+    assert failures == policy.validated
+    assert 0 < failures < 20
+
+
+def test_xml_validation_first_sight(geolink_v1_2_0):
+    policy = FirstSightValidation()
+    parser = XML(xsd_validation=policy)
+    parser.from_string(geolink_v1_2_0)
+    parser.from_string(geolink_v1_2_0.decode('utf-8'))
+    parser.from_string(geolink_v1_2_0)
+    assert (policy.validated, policy.skipped) == (1, 2)
+
+
+def test_xml_validation_first_sight_failure():
+    policy = FirstSightValidation()
+    parser = XML(xsd_validation=policy)
+    for _ in range(2):
+        with pytest.raises(DocumentInvalid):
+            parser.from_string(_invalid_geolink)
+    assert policy.validated == 2
+
+
+def test_xml_validation_first_sight_max_entries(geolink_v1_2_0):
+    policy = FirstSightValidation(max_entries=1)
+    parser = XML(xsd_validation=policy)
+    parser.from_string(geolink_v1_2_0)
+    parser.from_string(geolink_v1_2_0.replace(b'<geolinks>', b'<geolinks> '))
+    parser.from_string(geolink_v1_2_0)
+    assert policy.validated == 3
+
+
+def test_xml_validation_first_sight_file(geolink_v1_2_0):
+    policy = FirstSightValidation()
+    parser = XML(xsd_validation=policy)
+    for _ in range(2):
+        parser.from_string(io.BytesIO(geolink_v1_2_0))
+    assert policy.validated == 2
+
+
+def test_xml_validation_trusted_source():
+    policy = TrustedSourceValidation(['http://oereblex.test.com/api/'])
+    parser = XML(xsd_validation=policy)
+    with requests_mock.mock() as m:
+        m.get('http://oereblex.test.com/api/geolinks/1.xml', content=_invalid_geolink)
+        m.get('http://other.test.com/api/geolinks/1.xml', content=_invalid_geolink)
+        assert len(parser.from_url('http://oereblex.test.com/api/geolinks/1.xml')) == 1
+        with pytest.raises(DocumentInvalid):
+            parser.from_url('http://other.test.com/api/geolinks/1.xml')
+    with pytest.raises(DocumentInvalid):
+        parser.from_string(_invalid_geolink)
+    assert (policy.validated, policy.skipped) == (2, 1)
+
+
+def test_xml_validation_trusted_source_cached():
+    policy = TrustedSourceValidation(['http://oereblex.test.com/api/'])
+    parser = XML(xsd_validation=policy, cache=MemoryCache())
+    with requests_mock.mock() as m:
+        m.get('http://oereblex.test.com/api/geolinks/1.xml', content=_invalid_geolink)
+        assert len(parser.from_url('http://oereblex.test.com/api/geolinks/1.xml')) == 1
+
+
+def test_xml_validation_override_cached():
+    parser = XML(cache=MemoryCache())
+    with requests_mock.mock() as m:
+        m.get('http://oereblex.test.com/api/geolinks/1.xml', content=_invalid_geolink)
+        assert len(parser.from_url('http://oereblex.test.com/api/geolinks/1.xml', validation=False)) == 1
+        with pytest.raises(DocumentInvalid):
+            parser.from_url('http://oereblex.test.com/api/geolinks/1.xml')
+        assert len(parser.from_url('http://oereblex.test.com/api/geolinks/1.xml', validation=False)) == 1
+    assert parser.cache.hits == 1
+
+
+@pytest.mark.parametrize('validation', [False, NeverValidate()])
+def test_iter_documents_validation(validation):
+    documents = list(XML().iter_documents(_invalid_geolink, validation=validation))
+    assert documents[0].doctype == 'invalid'
+
+
+_document_attributes = ('id', 'category', 'doctype', 'federal_level', 'authority', 'authority_url', 'title',
+                        'number', 'abbreviation', 'instance', 'type', 'subtype', 'decree_date',
+                        'enactment_date', 'abrogation_date', 'cycle')
+
+
+def _document_values(document):
+    return tuple(getattr(document, name) for name in _document_attributes) + tuple(
+        (f.title, f.description, f.href, f.category) for f in document.files
+    )
+
+
+@pytest.mark.parametrize('version', SCHEMA.ALL)
+def test_xml_from_string_lazy(version):
+    with open('tests/resources/geolink_v{0}.xml'.format(version), 'rb') as f:
+        xml = f.read()
+    parser = XML(host_url='http://oereblex.test.com', version=version)
+    documents = parser.from_string(xml)
+    view = parser.from_string(xml, lazy=True)
+    assert isinstance(view, DocumentView)
+    assert len(view) == len(documents)
+    assert [_document_values(d) for d in view] == [_document_values(d) for d in documents]
+    assert [_document_values(d) for d in view.materialize()] == [_document_values(d) for d in documents]
+    assert all(type(d) is Document for d in view.materialize())
+
+
+def test_xml_from_string_lazy_access(geolink_v1_2_0):
+    view = XML().from_string(geolink_v1_2_0, lazy=True)
+    assert view[0] is view[0]
+    assert view[-1] is view[4]
+    assert view[1:3] == [view[1], view[2]]
+    with pytest.raises(IndexError):
+        view[5]
+    document = view[0]
+    with mock.patch.object(XML, '_parse_date', wraps=XML._parse_date) as parse_date:
+        assert document.enactment_date == document.enactment_date
+        assert parse_date.call_count == 1
+
+
+def test_xml_from_string_lazy_max_files(geolink_v1_2_0):
+    view = XML(max_files=1).from_string(geolink_v1_2_0, lazy=True)
+    assert len(view) == 5
+    with pytest.raises(LimitExceededError):
+        view.materialize()
+
+
+@pytest.mark.parametrize('version', [SCHEMA.V1_1_0, SCHEMA.V1_2_0])
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'doctype': 'edict'},
+    {'doctype': ['decree', 'notice']},
+    {'category': 'related', 'federal_level': 'Kanton'},
+    {'federal_level': []},
+    {'abrogated': True},
+    {'abrogated': False},
+    {'doctype': 'it\'s "quoted"'}
+])
+def test_xml_document_filter(version, kwargs):
+    with open('tests/resources/geolink_v{0}.xml'.format(version), 'rb') as f:
+        xml = f.read()
+    parser = XML(version=version)
+    document_filter = DocumentFilter(**kwargs)
+    expected = [d.id for d in parser.from_string(xml) if document_filter.matches(d)]
+    assert [d.id for d in parser.from_string(xml, document_filter=document_filter)] == expected
+    assert [d.id for d in parser.from_string(xml, lazy=True, document_filter=document_filter)] == expected
+    assert [d.id for d in parser.iter_documents(xml, document_filter=document_filter)] == expected
+
+
+@pytest.mark.parametrize('abrogated,expected', [(True, ['2']), (False, ['1', '3'])])
+def test_xml_document_filter_empty_abrogation_date(abrogated, expected):
+    xml = b"""<geolinks>
+        <document id="1" doctype="decree" abrogation_date=""/>
+        <document id="2" doctype="decree" abrogation_date="2001-01-01"/>
+        <document id="3" doctype="decree"/>
+    </geolinks>"""
+    parser = XML()
+    document_filter = DocumentFilter(abrogated=abrogated)
+    assert [d.id for d in parser.from_string(xml, document_filter=document_filter)] == expected
+    assert [d.id for d in parser.iter_documents(xml, document_filter=document_filter)] == expected
+    assert [d.id for d in parser.from_string(xml) if document_filter.matches(d)] == expected
+    assert HTML.format(parser.from_string(xml), document_filter=document_filter) == \
+        HTML.format(parser.from_string(xml, document_filter=document_filter))
+
+
+@pytest.mark.parametrize('kwargs,expected', [
+    ({'category': 'main'}, ['1']),
+    ({'category': 'related'}, ['2']),
+    ({'doctype': 'edict'}, ['2'])
+])
+def test_xml_document_filter_duplicates(kwargs, expected):
+    xml = b"""<geolinks>
+        <document id="1" doctype="decree" category="main"/>
+        <document id="1" doctype="decree" category="related"/>
+        <document id="2" doctype="edict" category="related"/>
+    </geolinks>"""
+    parser = XML()
+    document_filter = DocumentFilter(**kwargs)
+    assert [d.id for d in parser.from_string(xml) if document_filter.matches(d)] == expected
+    assert [d.id for d in parser.from_string(xml, document_filter=document_filter)] == expected
+    assert [d.id for d in parser.from_string(xml, lazy=True, document_filter=document_filter)] == expected
+    assert [d.id for d in parser.iter_documents(xml, document_filter=document_filter)] == expected
+    assert HTML.format(parser.from_string(xml), document_filter=document_filter) == \
+        HTML.format(parser.from_string(xml, document_filter=document_filter))
+
+
+def test_xml_document_filter_skips_entities(geolink_v1_2_0):
+    document_filter = DocumentFilter(doctype='notice')
+    with mock.patch.object(XML, '_create_document', autospec=True,
+                           side_effect=XML._create_document) as create_document:
+        documents = XML().from_string(geolink_v1_2_0, document_filter=document_filter)
+    assert [d.doctype for d in documents] == ['notice']
+    assert create_document.call_count == 1
+
+
+def test_document_filter_key():
+    assert DocumentFilter().key == ''
+    assert DocumentFilter(category='main', doctype=['decree', 'edict'], abrogated=False).key == \
+        'doctype=decree,edict;category=main;abrogated=False'
+
+
+def test_xml_projection(geolink_v1_2_0):
+    parser = XML()
+    full = parser.from_string(geolink_v1_2_0)
+    documents = parser.from_string(geolink_v1_2_0, fields=['title', 'enactment_date'])
+    assert [(d.id, d.title, d.enactment_date) for d in documents] == \
+        [(d.id, d.title, d.enactment_date) for d in full]
+    assert all(d.files == [] and d.doctype is None and d.decree_date is None for d in documents)
+    documents = list(parser.iter_documents(geolink_v1_2_0, fields=['files']))
+    assert [len(d.files) for d in documents] == [len(d.files) for d in full]
+    assert all(d.title is None for d in documents)
+
+
+def test_xml_projection_invalid(geolink_v1_2_0):
+    with pytest.raises(ValueError):
+        XML().from_string(geolink_v1_2_0, fields=['id', 'unknown'])
+
+
+def test_xml_projection_lazy(geolink_v1_2_0):
+    with pytest.raises(ValueError):
+        XML().from_string(geolink_v1_2_0, lazy=True, fields=['title'])
+
+
+def test_xml_from_url_document_filter(geolink_v1_2_0):
+    document_filter = DocumentFilter(doctype='edict')
+    parser = XML(cache=MemoryCache())
+    with requests_mock.mock() as m:
+        m.get('http://oereblex.test.com/api/geolinks/1500.xml', content=geolink_v1_2_0)
+        filtered = parser.from_url('http://oereblex.test.com/api/geolinks/1500.xml',
+                                   document_filter=document_filter)
+        full = parser.from_url('http://oereblex.test.com/api/geolinks/1500.xml')
+    assert len(filtered) == 3
+    assert len(full) == 5
+    assert parser.cache.misses == 2
+
+
+@pytest.mark.parametrize('version,detected', [
+    (SCHEMA.V1_0_0, SCHEMA.V1_0_0),
+    (SCHEMA.V1_1_0, SCHEMA.V1_1_0),
+    (SCHEMA.V1_1_1, SCHEMA.V1_1_0),
+    (SCHEMA.V1_2_0, SCHEMA.V1_2_0)
+])
+def test_xml_version_auto(version, detected):
+    with open('tests/resources/geolink_v{0}.xml'.format(version), 'rb') as f:
+        xml = f.read()
+    parser = XML(version=SCHEMA.AUTO)
+    documents = parser.from_string(xml)
+    assert isinstance(documents, DocumentList)
+    assert documents.version == detected
+    assert parser.from_string(xml, lazy=True).version == detected
+    assert parser.from_string(xml, lazy=True).materialize().version == detected
+    assert [d.id for d in documents] == [d.id for d in XML(version=version).from_string(xml)]
+
+
+def test_xml_version_auto_invalid():
+    parser = XML(version=SCHEMA.AUTO)
+    with pytest.raises(DocumentInvalid):
+        parser.from_string(_invalid_geolink)
+    assert parser.from_string(_invalid_geolink, validation=False).version == SCHEMA.V1_0_0
+
+
+def test_xml_version_fixed():
+    documents = XML(version=SCHEMA.V1_1_1).from_string(_geolink_v1_1_1())
+    assert documents.version == SCHEMA.V1_1_1
+    assert XML(version=SCHEMA.V1_1_1).version == SCHEMA.V1_1_1
+
+
+def test_xml_version_auto_from_url(geolink_v1_2_0):
+    parser = XML(version=SCHEMA.AUTO, cache=MemoryCache())
+    with requests_mock.mock() as m:
+        m.get('http://oereblex.test.com/api/geolinks/1.xml', content=_geolink_v1_1_1())
+        m.get('http://oereblex.test.com/api/geolinks/2.xml', content=geolink_v1_2_0)
+        assert parser.from_url('http://oereblex.test.com/api/geolinks/1.xml').version == SCHEMA.V1_1_0
+        assert parser.from_url('http://oereblex.test.com/api/geolinks/2.xml').version == SCHEMA.V1_2_0
+        assert parser.from_url('http://oereblex.test.com/api/geolinks/2.xml').version == SCHEMA.V1_2_0
+    assert parser.cache.hits == 1
+
+
+def test_xml_version_auto_iter_documents():
+    parser = XML(version=SCHEMA.AUTO)
+    assert len(list(parser.iter_documents(_geolink_v1_1_1()))) == len(parser.from_string(_geolink_v1_1_1()))
+
+
+def test_document_list_pickle(geolink_v1_2_0):
+    documents = pickle.loads(pickle.dumps(XML(version=SCHEMA.AUTO).from_string(geolink_v1_2_0)))
+    assert isinstance(documents, DocumentList)
+    assert documents.version == SCHEMA.V1_2_0
+    assert len(documents) == 5
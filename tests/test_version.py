@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+from lxml.etree import fromstring
+
+from geolink_formatter._specs import SPECS
+from geolink_formatter.parser import SCHEMA, _schema_directory, schema_registry, version_detector
+from geolink_formatter.version import VersionDetector, generate_spec, generate_specs
+
+
+def _resource(name):
+    with open(os.path.join('tests', 'resources', name), 'rb') as f:
+        return f.read()
+
+
+def _document(attributes=u'id="1" doctype="decree"', content=u''):
+    return u'<geolinks><document {0}>{1}</document></geolinks>'.format(attributes, content).encode('utf-8')
+
+
+_fixtures = [
+    _resource('geolink_v1.0.0.xml'),
+    _resource('geolink_v1.1.0.xml'),
+    _resource('geolink_v1.1.1.xml'),
+    _resource('geolink_v1.1.1_bezirk.xml'),
+    _resource('geolink_v1.2.0.xml'),
+    _document(),
+    _document(u''),
+    _document(u'category="main" federal_level="Bund" language="fr"'),
+    _document(u'doctype="notice"'),
+    _document(u'doctype="invalid"'),
+    _document(u'doctype=" decree"'),
+    _document(u'doctype="Decree"'),
+    _document(u'doctype=""'),
+    _document(u'category="additional"'),
+    _document(u'federal_level="Bezirk"'),
+    _document(u'language="en"'),
+    _document(u'number="1" abbreviation="a" abrogation_date="2001-01-01"'),
+    _document(u'description="file attribute"'),
+    _document(u'unknown="1"'),
+    _document(u'xml:lang="de"'),
+    _document(u'xmlns:x="urn:x" x:id="1"'),
+    _document(u'xmlns="urn:x"'),
+    _document(u'id="1" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:nil="true"'),
+    _document(content=u'<file category="main" href="/a" title="a.pdf"/>'),
+    _document(content=u'<file category="main" href="/a" title="a.pdf" description="A"/>'),
+    _document(content=u'<file category="related"/>'),
+    _document(content=u'<file doctype="decree"/>'),
+    _document(content=u'<file/><file/>'),
+    _document(content=u'\n  <file/>\n  <file/>\n'),
+    _document(content=u'text'),
+    _document(content=u'<file/>text'),
+    _document(content=u' '),
+    _document(content=u'&#160;'),
+    _document(content=u'&#32;&#10;'),
+    _document(content=u'<![CDATA[ ]]>'),
+    _document(content=u'<![CDATA[x]]>'),
+    _document(content=u'<!-- comment --><file/><?pi data?>'),
+    _document(content=u'<file>text</file>'),
+    _document(content=u'<file> </file>'),
+    _document(content=u'<file><!-- comment --></file>'),
+    _document(content=u'<file><!-- comment --> </file>'),
+    _document(content=u'<file><?pi data?></file>'),
+    _document(content=u'<file><file/></file>'),
+    _document(content=u'<document id="2"/>'),
+    _document(content=u'<other/>'),
+    b'<geolinks/>',
+    b'<geolinks>  </geolinks>',
+    b'<geolinks><!-- comment --></geolinks>',
+    b'<geolinks>text<document/></geolinks>',
+    b'<geolinks><document/>text</geolinks>',
+    b'<geolinks><document/><!-- comment --><document/></geolinks>',
+    b'<geolinks><file/></geolinks>',
+    b'<geolinks id="1"><document/></geolinks>',
+    b'<geolinks xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    b'xsi:noNamespaceSchemaLocation="geolink.xsd"><document/></geolinks>',
+    b'<geolinks xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:type="xs:string">'
+    b'<document/></geolinks>',
+    b'<geolink><document/></geolink>',
+    b'<document id="1"/>',
+    b'<x:geolinks xmlns:x="urn:x"><document/></x:geolinks>',
+    b'<?xml version="1.0"?>\n<!DOCTYPE geolinks>\n<geolinks><document/></geolinks>',
+]
+
+
+@pytest.mark.parametrize('version', SCHEMA.ALL)
+def test_fixtures(version):
+    results = [schema_registry.get(version).validate(fromstring(xml)) for xml in _fixtures]
+    assert any(results) and not all(results)
+
+
+def test_specs_up_to_date():
+    assert generate_specs(_schema_directory, SCHEMA.ALL) == SPECS
+
+
+@pytest.mark.parametrize('declaration', [
+    '<xs:attribute name="id" type="xs:integer"/>',
+    '<xs:attribute name="id" type="xs:string" use="required"/>',
+    '<xs:attribute name="id"><xs:simpleType><xs:restriction base="xs:string">'
+    '<xs:maxLength value="4"/></xs:restriction></xs:simpleType></xs:attribute>',
+    '<xs:anyAttribute/>'
+])
+def test_generate_spec_unsupported(tmpdir, declaration):
+    xsd = tmpdir.join('geolink.xsd')
+    xsd.write(
+        '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"><xs:element name="geolinks"><xs:complexType>'
+        '<xs:choice maxOccurs="unbounded"><xs:element name="document"><xs:complexType><xs:sequence>'
+        '<xs:element name="file" minOccurs="0" maxOccurs="unbounded"><xs:complexType/></xs:element>'
+        '</xs:sequence>{0}</xs:complexType></xs:element></xs:choice></xs:complexType></xs:element>'
+        '</xs:schema>'.format(declaration)
+    )
+    with pytest.raises(ValueError):
+        generate_spec(str(xsd))
+
+
+@pytest.mark.parametrize('index', range(len(_fixtures)))
+def test_version_detector_narrowest(index):
+    root = fromstring(_fixtures[index])
+    valid = [version for version in SCHEMA.ALL if schema_registry.get(version).validate(root)]
+    detected = version_detector.detect(root)
+    if valid:
+        assert detected == valid[0]
+    else:
+        assert not schema_registry.get(detected).validate(root)
+
+
+@pytest.mark.parametrize('xml,version', [
+    (_resource('geolink_v1.0.0.xml'), SCHEMA.V1_0_0),
+    (_resource('geolink_v1.1.1.xml'), SCHEMA.V1_1_0),
+    (_resource('geolink_v1.2.0.xml'), SCHEMA.V1_2_0),
+    (_document(u'doctype="notice"'), SCHEMA.V1_2_0),
+    (_document(content=u'<file description="A"/>'), SCHEMA.V1_2_0),
+    (_document(u'number="1"'), SCHEMA.V1_1_0)
+])
+def test_version_detector(xml, version):
+    assert version_detector.detect(fromstring(xml)) == version
+
+
+def test_version_detector_removed_attribute():
+    specs = dict(SPECS)
+    specs[SCHEMA.V1_2_0] = dict(SPECS[SCHEMA.V1_2_0], document_attributes={'id': None})
+    with pytest.raises(ValueError):
+        VersionDetector(specs, SCHEMA.ALL)
+
+
+def test_version_detector_removed_value():
+    specs = dict(SPECS)
+    attributes = dict(SPECS[SCHEMA.V1_2_0]['document_attributes'], doctype=('decree',))
+    specs[SCHEMA.V1_2_0] = dict(SPECS[SCHEMA.V1_2_0], document_attributes=attributes)
+    with pytest.raises(ValueError):
+        VersionDetector(specs, SCHEMA.ALL)